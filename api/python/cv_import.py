@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import re
+import threading
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import FastAPI, Request
@@ -12,14 +17,26 @@ from pydantic import ValidationError
 from python_cv.contracts import (
     CvImportSuggestRequest,
 )
-from python_cv.pdf_extract import PdfEmptyTextError, PdfParseError, extract_text_from_pdf_bytes
-from python_cv.service import ImportLimits, default_limits, process_skill_documents
-from python_cv.skill_db import SkillDbUnavailableError, load_skill_db
+from python_cv.multipart_stream import StreamedPart, iter_multipart_parts
+from python_cv.pdf_cache import PdfCacheUsage, extract_text_from_pdf_bytes_cached
+from python_cv.pdf_extract import (
+    PDF_TEXT_MODES,
+    ExtractedPdf,
+    PdfEmptyTextError,
+    PdfEncryptedError,
+    PdfInvalidError,
+    PdfParseError,
+    PdfResourceLimitError,
+    shutdown_pdf_pool,
+)
+from python_cv.pdf_preflight import reject_unparseable_pdf
+from python_cv.service import ImportLimits, default_limits, process_skill_documents, warm_document_suggestions
+from python_cv.skill_db import SkillDbUnavailableError
+from python_cv.skill_db_reload import active_skill_db
+from python_cv.warmup import WarmupResult, run_warmup
 
 LOCAL_DEV_PYTHON_SERVICE_SECRET = "proofound-local-python-service"
 
-app = FastAPI(title="Proofound Python Internal Service")
-
 GENERIC_SUGGEST_ERROR = "Failed to process CV documents"
 GENERIC_EXTRACT_ERROR = "Failed to extract CV text"
 ARCHIVED_CV_WIZARD_ENDPOINT_MESSAGE = (
@@ -28,6 +45,8 @@ ARCHIVED_CV_WIZARD_ENDPOINT_MESSAGE = (
 
 ERROR_CODE_PDF_PARSE_FAILED = "PDF_PARSE_FAILED"
 ERROR_CODE_PDF_EMPTY_TEXT = "PDF_EMPTY_TEXT"
+ERROR_CODE_PDF_INVALID = "PDF_INVALID"
+ERROR_CODE_PDF_ENCRYPTED = "PDF_ENCRYPTED"
 ERROR_CODE_SKILL_DB_UNAVAILABLE = "SKILL_DB_UNAVAILABLE"
 ERROR_CODE_MATCHING_FAILED = "MATCHING_FAILED"
 ERROR_CODE_MULTIPART_METADATA_INVALID = "CV_IMPORT_MULTIPART_METADATA_INVALID"
@@ -36,6 +55,73 @@ UPLOAD_METADATA_ENCODING_ERROR_MESSAGE = (
 )
 
 
+class _Readiness:
+    """Warmup state reported by /ready; /health stays a pure liveness probe."""
+
+    def __init__(self) -> None:
+        self.ready = threading.Event()
+        self.result: WarmupResult | None = None
+        self.error: str | None = None
+
+    def mark_ready(self, result: WarmupResult | None) -> None:
+        self.result = result
+        self.error = None
+        self.ready.set()
+
+    def mark_failed(self, error: str) -> None:
+        self.error = error
+
+
+_readiness = _Readiness()
+
+# A failed warmup (e.g. the skills DB mid-deploy or a transient shm error) is
+# retried with doubling delays so /ready recovers without a restart.
+WARMUP_RETRY_INITIAL_SECONDS = 1.0
+WARMUP_RETRY_MAX_SECONDS = 60.0
+
+
+def _warmup_enabled() -> bool:
+    return os.environ.get("PYTHON_CV_WARMUP", "1").strip().lower() not in {"0", "false", "off", "no"}
+
+
+def multipart_pipelining_enabled() -> bool:
+    # Off by default: the buffered request.form() path stays the reference behaviour.
+    return os.environ.get("CV_IMPORT_PIPELINED_MULTIPART", "").strip().lower() in {"1", "true", "on", "yes"}
+
+
+def _run_startup_warmup(stop: threading.Event) -> None:
+    delay = WARMUP_RETRY_INITIAL_SECONDS
+    while True:
+        try:
+            result = run_warmup(active_skill_db())
+        except Exception as exc:  # readiness stays false until a retry succeeds; /suggest reports its own errors
+            _readiness.mark_failed(str(exc) or exc.__class__.__name__)
+            if stop.wait(delay):
+                return
+            delay = min(delay * 2, WARMUP_RETRY_MAX_SECONDS)
+            continue
+        _readiness.mark_ready(result)
+        return
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    stop_warmup = threading.Event()
+    if _warmup_enabled():
+        # Warm in the background so /health answers while the instance is still cold.
+        threading.Thread(
+            target=_run_startup_warmup, args=(stop_warmup,), name="cv-import-warmup", daemon=True
+        ).start()
+    else:
+        _readiness.mark_ready(None)
+    yield
+    stop_warmup.set()
+    shutdown_pdf_pool()
+
+
+app = FastAPI(title="Proofound Python Internal Service", lifespan=_lifespan)
+
+
 def _env_int(name: str, fallback: int) -> int:
     raw = os.environ.get(name)
     if not raw:
@@ -215,7 +301,7 @@ def _sanitize_document_id(raw_value: Any, idx: int) -> str:
 
 def _load_skill_db_or_response() -> tuple[Any | None, JSONResponse | None]:
     try:
-        return load_skill_db(), None
+        return active_skill_db(), None
     except SkillDbUnavailableError as exc:
         return None, JSONResponse(
             {
@@ -227,6 +313,25 @@ def _load_skill_db_or_response() -> tuple[Any | None, JSONResponse | None]:
         )
 
 
+def _suggestion_warmer(suggestions_limit: int | None) -> Callable[[str], None] | None:
+    """Start matching each uploaded document as soon as its text is ready (pipelined uploads only)."""
+
+    if not multipart_pipelining_enabled():
+        return None
+    try:
+        skill_db = active_skill_db()
+    except SkillDbUnavailableError:
+        return None  # reported by the request-wide pass
+
+    def warm(text: str) -> None:
+        try:
+            warm_document_suggestions(text, skill_db, suggestions_limit=suggestions_limit)
+        except Exception:  # best effort; the request-wide pass matches everything again
+            pass
+
+    return warm
+
+
 def _unique_top_skill_ids(candidate_documents: list[dict[str, Any]], key: str) -> list[str]:
     ordered_ids: list[str] = []
     seen_ids: set[str] = set()
@@ -245,9 +350,165 @@ def _unique_top_skill_ids(candidate_documents: list[dict[str, Any]], key: str) -
     return ordered_ids
 
 
+@dataclass(frozen=True)
+class _UploadSettings:
+    max_file_size_bytes: int
+    max_pdf_pages: int
+    max_extracted_chars: int
+    pdf_text_mode: str | None
+
+
+def _upload_settings(request: Request) -> _UploadSettings:
+    # Optional per-request override of PYTHON_CV_PDF_TEXT_MODE ("layout" or "fast").
+    pdf_text_mode = request.query_params.get("pdf_text_mode") or None
+    if pdf_text_mode is not None and pdf_text_mode.strip().lower() not in PDF_TEXT_MODES:
+        raise ValueError(f"Unsupported pdf_text_mode. Use one of: {', '.join(PDF_TEXT_MODES)}.")
+    return _UploadSettings(
+        max_file_size_bytes=_env_int("CV_IMPORT_MAX_FILE_SIZE_MB", 5) * 1024 * 1024,
+        max_pdf_pages=_env_int("CV_IMPORT_MAX_PDF_PAGES", 4),
+        max_extracted_chars=_env_int("CV_IMPORT_MAX_CHARS_PER_DOCUMENT", 30000),
+        pdf_text_mode=pdf_text_mode,
+    )
+
+
+@dataclass(frozen=True)
+class _UploadResult:
+    file_name: str
+    text: str = ""
+    parse_error: str | None = None
+    parse_error_code: str | None = None
+
+
+def _is_pdf_upload(file_name: str, content_type: str) -> bool:
+    return "pdf" in content_type.lower() or file_name.lower().endswith(".pdf")
+
+
+def _non_pdf_upload(file_name: str) -> _UploadResult:
+    return _UploadResult(
+        file_name,
+        parse_error="Only PDF files are supported in V1.",
+        parse_error_code=ERROR_CODE_PDF_PARSE_FAILED,
+    )
+
+
+def _oversized_upload(file_name: str, settings: _UploadSettings) -> _UploadResult:
+    return _UploadResult(
+        file_name,
+        parse_error=f"File exceeds max size of {settings.max_file_size_bytes // (1024 * 1024)}MB.",
+        parse_error_code=ERROR_CODE_PDF_PARSE_FAILED,
+    )
+
+
+async def _extract_upload(
+    file_name: str,
+    file_bytes: bytes,
+    settings: _UploadSettings,
+    pdf_cache_usage: PdfCacheUsage | None,
+) -> _UploadResult:
+    if len(file_bytes) > settings.max_file_size_bytes:
+        return _oversized_upload(file_name, settings)
+
+    try:
+        # Parsing is CPU-bound (or waits on a sandbox worker); keep it off the event loop.
+        extracted = await asyncio.to_thread(_preflight_and_extract, file_bytes, settings, pdf_cache_usage)
+        return _UploadResult(file_name, text=extracted.text)
+    except PdfEmptyTextError as exc:
+        return _UploadResult(file_name, parse_error=str(exc), parse_error_code=ERROR_CODE_PDF_EMPTY_TEXT)
+    except PdfParseError as exc:
+        error_message = str(exc).lower()
+        # PDF_INVALID/PDF_ENCRYPTED are only reported for preflight rejections;
+        # a failed full parse keeps PDF_PARSE_FAILED whatever its message says.
+        error_code = ERROR_CODE_PDF_PARSE_FAILED
+        if isinstance(exc, PdfResourceLimitError):
+            parse_error = (
+                "PDF took too long or needed too much memory to parse. "
+                "Please export a simpler copy and retry."
+            )
+        elif isinstance(exc, PdfEncryptedError) or "password" in error_message or "encrypted" in error_message:
+            parse_error = (
+                "PDF is encrypted or password-protected. Please export an unlocked copy and retry."
+            )
+            if isinstance(exc, PdfEncryptedError):
+                error_code = ERROR_CODE_PDF_ENCRYPTED
+        elif isinstance(exc, PdfInvalidError) or "not a pdf" in error_message or "syntax" in error_message:
+            parse_error = "The uploaded file is not a valid PDF. Please re-export and try again."
+            if isinstance(exc, PdfInvalidError):
+                error_code = ERROR_CODE_PDF_INVALID
+        else:
+            parse_error = "PDF parser could not start. Please refresh and re-upload the file."
+        return _UploadResult(file_name, parse_error=parse_error, parse_error_code=error_code)
+
+
+def _preflight_and_extract(
+    file_bytes: bytes, settings: _UploadSettings, pdf_cache_usage: PdfCacheUsage | None
+) -> ExtractedPdf:
+    # Header/trailer/xref sniffing turns non-PDFs, locked and image-only files
+    # away before they cost a full parse (or a cache entry).
+    preflight = reject_unparseable_pdf(file_bytes)
+    return extract_text_from_pdf_bytes_cached(
+        file_bytes,
+        max_pages=settings.max_pdf_pages,
+        max_total_chars=settings.max_extracted_chars,
+        usage=pdf_cache_usage,
+        text_mode=settings.pdf_text_mode,
+        page_count=preflight.page_count,
+    )
+
+
+def _collect_upload_results(
+    results: list[_UploadResult],
+    document_ids: list[Any],
+    contexts: list[Any],
+    default_context: str,
+) -> tuple[list[dict[str, str]], list[dict[str, Any]]]:
+    parsed_documents: list[dict[str, str]] = []
+    failed_documents: list[dict[str, Any]] = []
+
+    for idx, result in enumerate(results, start=1):
+        raw_document_id = document_ids[idx - 1] if idx - 1 < len(document_ids) else None
+        document_id = _sanitize_document_id(raw_document_id, idx)
+        context = _safe_context(contexts[idx - 1] if idx - 1 < len(contexts) else default_context, default_context)
+
+        if result.parse_error is not None:
+            failed_documents.append(
+                _document_from_error(
+                    document_id,
+                    result.file_name,
+                    context,
+                    result.parse_error,
+                    parse_error_code=result.parse_error_code,
+                )
+            )
+            continue
+        parsed_documents.append(
+            {
+                "document_id": document_id,
+                "file_name": result.file_name,
+                "text": result.text,
+                "context": context,
+            }
+        )
+
+    return parsed_documents, failed_documents
+
+
 async def _parse_multipart_documents(
-    request: Request, *, default_context: str, limits: ImportLimits
+    request: Request,
+    *,
+    default_context: str,
+    limits: ImportLimits,
+    pdf_cache_usage: PdfCacheUsage | None = None,
+    on_document_text: Callable[[str], None] | None = None,
 ) -> tuple[list[dict[str, str]], list[dict[str, Any]]]:
+    if multipart_pipelining_enabled():
+        return await _parse_multipart_documents_pipelined(
+            request,
+            default_context=default_context,
+            limits=limits,
+            pdf_cache_usage=pdf_cache_usage,
+            on_document_text=on_document_text,
+        )
+
     try:
         form = await request.form()
     except Exception as exc:  # pragma: no cover - parser exceptions vary across runtime versions
@@ -262,90 +523,86 @@ async def _parse_multipart_documents(
     if len(files) > limits.max_documents:
         raise ValueError(f"Too many documents. Maximum allowed is {limits.max_documents}.")
 
-    max_file_size_bytes = _env_int("CV_IMPORT_MAX_FILE_SIZE_MB", 5) * 1024 * 1024
-    max_pdf_pages = _env_int("CV_IMPORT_MAX_PDF_PAGES", 4)
-    max_extracted_chars = _env_int("CV_IMPORT_MAX_CHARS_PER_DOCUMENT", 30000)
-
-    parsed_documents: list[dict[str, str]] = []
-    failed_documents: list[dict[str, Any]] = []
-
+    settings = _upload_settings(request)
+    results: list[_UploadResult] = []
     for idx, upload in enumerate(files, start=1):
         file_name = getattr(upload, "filename", None) or f"upload-{idx}.pdf"
-        raw_document_id = document_ids[idx - 1] if idx - 1 < len(document_ids) else None
-        document_id = _sanitize_document_id(raw_document_id, idx)
-        context = _safe_context(contexts[idx - 1] if idx - 1 < len(contexts) else default_context, default_context)
-
         content_type = getattr(upload, "content_type", None) or ""
-        if "pdf" not in content_type.lower() and not file_name.lower().endswith(".pdf"):
-            failed_documents.append(
-                _document_from_error(
-                    document_id,
-                    file_name,
-                    context,
-                    "Only PDF files are supported in V1.",
-                    parse_error_code=ERROR_CODE_PDF_PARSE_FAILED,
-                )
-            )
+        if not _is_pdf_upload(file_name, content_type):
+            results.append(_non_pdf_upload(file_name))
             continue
+        results.append(await _extract_upload(file_name, await upload.read(), settings, pdf_cache_usage))
 
-        file_bytes = await upload.read()
-        if len(file_bytes) > max_file_size_bytes:
-            failed_documents.append(
-                _document_from_error(
-                    document_id,
-                    file_name,
-                    context,
-                    f"File exceeds max size of {max_file_size_bytes // (1024 * 1024)}MB.",
-                    parse_error_code=ERROR_CODE_PDF_PARSE_FAILED,
-                )
-            )
-            continue
+    return _collect_upload_results(results, document_ids, contexts, default_context)
 
-        try:
-            extracted = extract_text_from_pdf_bytes(
-                file_bytes,
-                max_pages=max_pdf_pages,
-                max_total_chars=max_extracted_chars,
-            )
-            parsed_documents.append(
-                {
-                    "document_id": document_id,
-                    "file_name": file_name,
-                    "text": extracted.text,
-                    "context": context,
-                }
-            )
-        except PdfEmptyTextError as exc:
-            failed_documents.append(
-                _document_from_error(
-                    document_id,
-                    file_name,
-                    context,
-                    str(exc),
-                    parse_error_code=ERROR_CODE_PDF_EMPTY_TEXT,
-                )
-            )
-        except PdfParseError as exc:
-            error_message = str(exc).lower()
-            if "password" in error_message or "encrypted" in error_message:
-                parse_error = (
-                    "PDF is encrypted or password-protected. Please export an unlocked copy and retry."
-                )
-            elif "not a pdf" in error_message or "syntax" in error_message:
-                parse_error = "The uploaded file is not a valid PDF. Please re-export and try again."
-            else:
-                parse_error = "PDF parser could not start. Please refresh and re-upload the file."
-            failed_documents.append(
-                _document_from_error(
-                    document_id,
-                    file_name,
-                    context,
-                    parse_error,
-                    parse_error_code=ERROR_CODE_PDF_PARSE_FAILED,
-                )
+
+async def _pipelined_upload(
+    part: StreamedPart,
+    file_name: str,
+    settings: _UploadSettings,
+    pdf_cache_usage: PdfCacheUsage | None,
+    on_document_text: Callable[[str], None] | None,
+) -> _UploadResult:
+    if not _is_pdf_upload(file_name, part.content_type):
+        return _non_pdf_upload(file_name)
+    if part.oversized:
+        return _oversized_upload(file_name, settings)
+    result = await _extract_upload(file_name, bytes(part.data), settings, pdf_cache_usage)
+    if on_document_text is not None and result.text:
+        await asyncio.to_thread(on_document_text, result.text)
+    return result
+
+
+async def _parse_multipart_documents_pipelined(
+    request: Request,
+    *,
+    default_context: str,
+    limits: ImportLimits,
+    pdf_cache_usage: PdfCacheUsage | None = None,
+    on_document_text: Callable[[str], None] | None = None,
+) -> tuple[list[dict[str, str]], list[dict[str, Any]]]:
+    """Stream the multipart body and extract each file as soon as its last byte arrives.
+
+    File N is parsed (and handed to ``on_document_text``) while file N+1 is
+    still uploading, so a slow upload costs roughly its slowest file rather
+    than the sum. Results are still returned in upload order.
+    """
+
+    settings = _upload_settings(request)
+    tasks: list[asyncio.Task[_UploadResult]] = []
+    document_ids: list[str] = []
+    contexts: list[str] = []
+    try:
+        async for part in iter_multipart_parts(
+            request.headers.get("content-type", ""),
+            request.stream(),
+            max_file_bytes=settings.max_file_size_bytes,
+        ):
+            if part.name == "document_ids":
+                document_ids.append(part.data.decode("utf-8"))
+                continue
+            if part.name == "contexts":
+                contexts.append(part.data.decode("utf-8"))
+                continue
+            if part.name != "files" or not part.is_file:
+                continue
+
+            if len(tasks) >= limits.max_documents:
+                raise ValueError(f"Too many documents. Maximum allowed is {limits.max_documents}.")
+            file_name = part.filename or f"upload-{len(tasks) + 1}.pdf"
+            tasks.append(
+                asyncio.create_task(_pipelined_upload(part, file_name, settings, pdf_cache_usage, on_document_text))
             )
 
-    return parsed_documents, failed_documents
+        results = list(await asyncio.gather(*tasks))
+    except BaseException as exc:
+        for task in tasks:
+            task.cancel()
+        if isinstance(exc, Exception) and _contains_utf8_decode_error(exc):
+            raise ValueError(UPLOAD_METADATA_ENCODING_ERROR_MESSAGE) from exc
+        raise
+
+    return _collect_upload_results(results, document_ids, contexts, default_context)
 
 
 async def _parse_json_documents(request: Request) -> tuple[list[dict[str, str]], int | None]:
@@ -353,8 +610,12 @@ async def _parse_json_documents(request: Request) -> tuple[list[dict[str, str]],
     return [doc.model_dump() for doc in payload.documents], payload.suggestions_limit
 
 
-def _metadata(limits: ImportLimits, unmapped_count: int = 0) -> dict[str, Any]:
-    return {
+def _metadata(
+    limits: ImportLimits,
+    unmapped_count: int = 0,
+    pdf_cache_usage: PdfCacheUsage | None = None,
+) -> dict[str, Any]:
+    metadata: dict[str, Any] = {
         "semantic_used": False,
         "semantic_fallback_triggered": False,
         "unmapped_candidates_count": unmapped_count,
@@ -364,6 +625,19 @@ def _metadata(limits: ImportLimits, unmapped_count: int = 0) -> dict[str, Any]:
             "max_total_chars": limits.max_total_chars,
         },
     }
+    if pdf_cache_usage is not None:
+        _add_pdf_usage_metadata(metadata, pdf_cache_usage)
+    return metadata
+
+
+def _add_pdf_usage_metadata(metadata: dict[str, Any], usage: PdfCacheUsage) -> None:
+    metadata["pdf_cache"] = _pdf_cache_metadata(usage)
+    if usage.peak_rss_bytes:
+        metadata["pdf_peak_rss_bytes"] = usage.peak_rss_bytes
+
+
+def _pdf_cache_metadata(usage: PdfCacheUsage) -> dict[str, int]:
+    return {"hits": usage.hits, "misses": usage.misses}
 
 
 def _value_error_payload(message: str) -> dict[str, str]:
@@ -378,6 +652,24 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready():
+    if not _readiness.ready.is_set():
+        payload: dict[str, Any] = {"status": "warming_up"}
+        if _readiness.error:
+            payload = {"status": "warmup_failed", "error": _readiness.error}
+        return JSONResponse(payload, status_code=503)
+
+    result = _readiness.result
+    return JSONResponse(
+        {
+            "status": "ready",
+            "skill_db_checksum": result.skill_db_checksum if result else None,
+            "warmup_ms": result.duration_ms if result else None,
+        }
+    )
+
+
 @app.post("/wizard-suggest")
 async def wizard_suggest(request: Request):
     return JSONResponse(
@@ -399,15 +691,19 @@ async def suggest(request: Request):
 
     try:
         suggestions_limit: int | None = None
+        pdf_cache_usage: PdfCacheUsage | None = None
         if content_type.startswith("multipart/form-data"):
+            pdf_cache_usage = PdfCacheUsage()
+            suggestions_limit_raw = request.query_params.get("suggestions_limit")
+            if suggestions_limit_raw and suggestions_limit_raw.isdigit():
+                suggestions_limit = int(suggestions_limit_raw)
             parsed_documents, failed_documents = await _parse_multipart_documents(
                 request,
                 default_context="cv",
                 limits=limits,
+                pdf_cache_usage=pdf_cache_usage,
+                on_document_text=_suggestion_warmer(suggestions_limit),
             )
-            suggestions_limit_raw = request.query_params.get("suggestions_limit")
-            if suggestions_limit_raw and suggestions_limit_raw.isdigit():
-                suggestions_limit = int(suggestions_limit_raw)
         else:
             parsed_documents, suggestions_limit = await _parse_json_documents(request)
             failed_documents = []
@@ -425,7 +721,7 @@ async def suggest(request: Request):
                         )
                         for item in failed_documents
                     ],
-                    "metadata": _metadata(limits, 0),
+                    "metadata": _metadata(limits, 0, pdf_cache_usage),
                 }
             )
 
@@ -451,6 +747,8 @@ async def suggest(request: Request):
         ]
 
         result["documents"] = failed_result_docs + result["documents"]
+        if pdf_cache_usage is not None:
+            _add_pdf_usage_metadata(result["metadata"], pdf_cache_usage)  # type: ignore[arg-type]
         return JSONResponse(result)
 
     except ValueError as exc:
@@ -482,11 +780,14 @@ async def extract(request: Request):
 
     try:
         documents: list[dict[str, Any]] = []
+        pdf_cache_usage: PdfCacheUsage | None = None
         if content_type.startswith("multipart/form-data"):
+            pdf_cache_usage = PdfCacheUsage()
             parsed_documents, failed_documents = await _parse_multipart_documents(
                 request,
                 default_context="cv",
                 limits=limits,
+                pdf_cache_usage=pdf_cache_usage,
             )
 
             documents.extend(
@@ -530,7 +831,7 @@ async def extract(request: Request):
         return JSONResponse(
             {
                 "documents": documents,
-                "metadata": _metadata(limits, 0),
+                "metadata": _metadata(limits, 0, pdf_cache_usage),
             }
         )
     except ValueError as exc:
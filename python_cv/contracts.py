@@ -54,11 +54,19 @@ class MetadataLimitsOut(BaseModel):
     max_total_chars: int
 
 
+class MetadataPdfCacheOut(BaseModel):
+    hits: int = Field(ge=0)
+    misses: int = Field(ge=0)
+
+
 class MetadataOut(BaseModel):
     semantic_used: bool = False
     semantic_fallback_triggered: bool = False
     unmapped_candidates_count: int = 0
+    skill_db_checksum: str | None = None
     limits: MetadataLimitsOut
+    pdf_cache: MetadataPdfCacheOut | None = None
+    pdf_peak_rss_bytes: int | None = Field(default=None, ge=0)
     service: str = PYTHON_INTERNAL_SERVICE_NAME
     contract_version: str = PYTHON_INTERNAL_CONTRACT_VERSION
 
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import re
+from functools import cached_property
+
+from python_cv.text_normalize import normalize_token, normalize_whitespace
+
+SECTION_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    "work": [
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in [
+            r"\bexperience\b",
+            r"\bwork\s+history\b",
+            r"\bemployment\b",
+            r"\bprofessional\s+experience\b",
+            r"\bcareer\s+history\b",
+        ]
+    ],
+    "learning": [
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in [
+            r"\beducation\b",
+            r"\blearning\b",
+            r"\bacademic\b",
+            r"\bcertifications?\b",
+            r"\btraining\b",
+        ]
+    ],
+    "volunteering": [
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in [
+            r"\bvolunteer(?:ing)?\b",
+            r"\bcommunity\s+service\b",
+            r"\bnon[-\s]?profit\b",
+        ]
+    ],
+    "languages": [
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in [
+            r"\blanguages?\b",
+            r"\blanguage\s+skills\b",
+        ]
+    ],
+}
+
+
+def _heading_type(line: str) -> str | None:
+    trimmed = line.rstrip(":-")
+    if not trimmed or len(trimmed) > 80:
+        return None
+    for section_type, patterns in SECTION_PATTERNS.items():
+        if any(pattern.search(trimmed) for pattern in patterns):
+            return section_type
+    return None
+
+
+class DocumentView:
+    """One document split into lines once, shared by every extractor.
+
+    ``lines`` holds ``(raw line, start, end)`` with offsets into ``text``;
+    ``stripped`` is each line whitespace-normalized. Token-normalized lines and
+    the section map are derived on first use and then reused.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        lines: list[tuple[str, int, int]] = []
+        cursor = 0
+        for line in text.replace("\r", "\n").split("\n"):
+            end = cursor + len(line)
+            lines.append((line, cursor, end))
+            cursor = end + 1
+        self.lines = lines
+        self.stripped = [normalize_whitespace(line) for line, _, _ in lines]
+
+    @cached_property
+    def content_lines(self) -> list[str]:
+        """Non-empty whitespace-normalized lines, in document order."""
+
+        return [line for line in self.stripped if line]
+
+    @cached_property
+    def normalized_content_lines(self) -> list[str]:
+        """``normalize_token`` of each entry in ``content_lines``."""
+
+        return [normalize_token(line) for line in self.content_lines]
+
+    @cached_property
+    def sections(self) -> dict[str, tuple[int, int]]:
+        """First ``[start, end)`` line range per section type, excluding the heading line."""
+
+        headings: list[tuple[str, int]] = []
+        for idx, line in enumerate(self.stripped):
+            section_type = _heading_type(line)
+            if section_type:
+                headings.append((section_type, idx))
+
+        sections: dict[str, tuple[int, int]] = {}
+        for i, (section_type, start_idx) in enumerate(headings):
+            next_idx = headings[i + 1][1] if i + 1 < len(headings) else len(self.lines)
+            section_start = start_idx + 1
+            if section_start < next_idx and section_type not in sections:
+                sections[section_type] = (section_start, next_idx)
+        return sections
+
+
+def as_document_view(document: str | DocumentView) -> DocumentView:
+    return document if isinstance(document, DocumentView) else DocumentView(document)
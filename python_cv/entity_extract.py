@@ -3,49 +3,12 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from python_cv.document_view import DocumentView, as_document_view
 from python_cv.text_normalize import normalize_whitespace
 
 MAX_ITEMS_PER_ENTITY = 10
 EVIDENCE_WINDOW = 180
 
-SECTION_PATTERNS: dict[str, list[re.Pattern[str]]] = {
-    "work": [
-        re.compile(pattern, re.IGNORECASE)
-        for pattern in [
-            r"\bexperience\b",
-            r"\bwork\s+history\b",
-            r"\bemployment\b",
-            r"\bprofessional\s+experience\b",
-            r"\bcareer\s+history\b",
-        ]
-    ],
-    "learning": [
-        re.compile(pattern, re.IGNORECASE)
-        for pattern in [
-            r"\beducation\b",
-            r"\blearning\b",
-            r"\bacademic\b",
-            r"\bcertifications?\b",
-            r"\btraining\b",
-        ]
-    ],
-    "volunteering": [
-        re.compile(pattern, re.IGNORECASE)
-        for pattern in [
-            r"\bvolunteer(?:ing)?\b",
-            r"\bcommunity\s+service\b",
-            r"\bnon[-\s]?profit\b",
-        ]
-    ],
-    "languages": [
-        re.compile(pattern, re.IGNORECASE)
-        for pattern in [
-            r"\blanguages?\b",
-            r"\blanguage\s+skills\b",
-        ]
-    ],
-}
-
 DATE_RANGE_PATTERN = re.compile(
     r"(\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)?\s*\d{4}\s*[-–]\s*(?:present|current|now|(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)?\s*\d{4})\b)|(\b\d{4}\s*[-–]\s*(?:present|current|\d{4})\b)",
     re.IGNORECASE,
@@ -89,54 +52,17 @@ class Block:
     end: int
 
 
-def _split_lines(text: str) -> list[tuple[str, int, int]]:
-    lines = text.replace("\r", "\n").split("\n")
-    entries: list[tuple[str, int, int]] = []
-    cursor = 0
-    for line in lines:
-        start = cursor
-        end = start + len(line)
-        entries.append((line, start, end))
-        cursor = end + 1
-    return entries
-
-
-def _heading_type(line: str) -> str | None:
-    trimmed = normalize_whitespace(line).rstrip(":-")
-    if not trimmed or len(trimmed) > 80:
-        return None
-    for section_type, patterns in SECTION_PATTERNS.items():
-        if any(pattern.search(trimmed) for pattern in patterns):
-            return section_type
-    return None
-
-
-def _detect_sections(lines: list[tuple[str, int, int]]) -> dict[str, tuple[int, int]]:
-    headings: list[tuple[str, int]] = []
-    for idx, (line, _, _) in enumerate(lines):
-        t = _heading_type(line)
-        if t:
-            headings.append((t, idx))
-
-    sections: dict[str, tuple[int, int]] = {}
-    for i, (t, start_idx) in enumerate(headings):
-        next_idx = headings[i + 1][1] if i + 1 < len(headings) else len(lines)
-        section_start = start_idx + 1
-        if section_start < next_idx and t not in sections:
-            sections[t] = (section_start, next_idx)
-    return sections
-
-
-def _extract_blocks(lines: list[tuple[str, int, int]], section: tuple[int, int] | None) -> list[Block]:
+def _extract_blocks(view: DocumentView, section_type: str) -> list[Block]:
+    section = view.sections.get(section_type)
     if section is None:
         return []
     start, end = section
+    lines = view.lines
     blocks: list[Block] = []
     block_start: int | None = None
 
     for idx in range(start, end):
-        text, _, _ = lines[idx]
-        is_empty = not normalize_whitespace(text)
+        is_empty = not view.stripped[idx]
         if not is_empty and block_start is None:
             block_start = idx
             continue
@@ -182,10 +108,9 @@ def _parse_duration(text: str) -> str:
     return "Duration not specified"
 
 
-def extract_work_experiences(text: str) -> list[dict[str, object]]:
-    lines = _split_lines(text)
-    sections = _detect_sections(lines)
-    blocks = _extract_blocks(lines, sections.get("work"))
+def extract_work_experiences(document: str | DocumentView) -> list[dict[str, object]]:
+    view = as_document_view(document)
+    blocks = _extract_blocks(view, "work")
     if not blocks:
         return []
 
@@ -201,17 +126,16 @@ def extract_work_experiences(text: str) -> list[dict[str, object]]:
                 "organization": organization,
                 "duration": _parse_duration(block.text),
                 "summary": summary,
-                "evidence_snippets": _snippet(text, block.start, block.end),
+                "evidence_snippets": _snippet(view.text, block.start, block.end),
                 "confidence": 0.74,
             }
         )
     return items
 
 
-def extract_learning_experiences(text: str) -> list[dict[str, object]]:
-    lines = _split_lines(text)
-    sections = _detect_sections(lines)
-    blocks = _extract_blocks(lines, sections.get("learning"))
+def extract_learning_experiences(document: str | DocumentView) -> list[dict[str, object]]:
+    view = as_document_view(document)
+    blocks = _extract_blocks(view, "learning")
     if not blocks:
         return []
 
@@ -232,17 +156,16 @@ def extract_learning_experiences(text: str) -> list[dict[str, object]]:
                 "duration": _parse_duration(block.text),
                 "skills": content[:1000],
                 "projects": content[:1000],
-                "evidence_snippets": _snippet(text, block.start, block.end),
+                "evidence_snippets": _snippet(view.text, block.start, block.end),
                 "confidence": 0.69,
             }
         )
     return items
 
 
-def extract_volunteering(text: str) -> list[dict[str, object]]:
-    lines = _split_lines(text)
-    sections = _detect_sections(lines)
-    blocks = _extract_blocks(lines, sections.get("volunteering"))
+def extract_volunteering(document: str | DocumentView) -> list[dict[str, object]]:
+    view = as_document_view(document)
+    blocks = _extract_blocks(view, "volunteering")
     if not blocks:
         return []
 
@@ -263,7 +186,7 @@ def extract_volunteering(text: str) -> list[dict[str, object]]:
                 "impact": impact,
                 "skills_deployed": impact,
                 "personal_why": impact,
-                "evidence_snippets": _snippet(text, block.start, block.end),
+                "evidence_snippets": _snippet(view.text, block.start, block.end),
                 "confidence": 0.67,
             }
         )
@@ -280,22 +203,21 @@ def _extract_language_rows(section_text: str) -> list[str]:
     return rows
 
 
-def extract_languages(text: str) -> list[dict[str, object]]:
-    lines = _split_lines(text)
-    sections = _detect_sections(lines)
+def extract_languages(document: str | DocumentView) -> list[dict[str, object]]:
+    view = as_document_view(document)
+    text = view.text
     language_rows: list[tuple[str, int, int]] = []
 
-    section = sections.get("languages")
+    section = view.sections.get("languages")
     if section:
         for idx in range(section[0], section[1]):
-            line, start, end = lines[idx]
-            normalized = normalize_whitespace(line)
+            _, start, end = view.lines[idx]
+            normalized = view.stripped[idx]
             if normalized:
                 language_rows.append((normalized, start, end))
 
     if not language_rows:
-        for line, start, end in lines:
-            normalized = normalize_whitespace(line)
+        for (_, start, end), normalized in zip(view.lines, view.stripped):
             if any(lang in normalized.lower() for lang in LANGUAGE_CODE_MAP.keys()):
                 language_rows.append((normalized, start, end))
 
@@ -331,10 +253,11 @@ def extract_languages(text: str) -> list[dict[str, object]]:
     return items
 
 
-def extract_all_entities(text: str) -> dict[str, list[dict[str, object]]]:
+def extract_all_entities(document: str | DocumentView) -> dict[str, list[dict[str, object]]]:
+    view = as_document_view(document)
     return {
-        "work_experiences": extract_work_experiences(text),
-        "learning_experiences": extract_learning_experiences(text),
-        "volunteering": extract_volunteering(text),
-        "languages": extract_languages(text),
+        "work_experiences": extract_work_experiences(view),
+        "learning_experiences": extract_learning_experiences(view),
+        "volunteering": extract_volunteering(view),
+        "languages": extract_languages(view),
     }
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+# Plain form fields (ids, contexts) are tiny; anything larger is not a client of ours.
+MAX_FIELD_BYTES = 64 * 1024
+
+
+@dataclass
+class StreamedPart:
+    """One completed multipart part.
+
+    File bodies stop accumulating once they pass the caller's ``max_file_bytes``;
+    ``oversized`` then tells the caller to reject the file without the rest of
+    it ever having been held in memory.
+    """
+
+    name: str
+    filename: str | None = None
+    content_type: str = ""
+    data: bytearray = field(default_factory=bytearray)
+    oversized: bool = False
+
+    @property
+    def is_file(self) -> bool:
+        return self.filename is not None
+
+
+class _PartCollector:
+    def __init__(self, max_file_bytes: int) -> None:
+        self.max_file_bytes = max_file_bytes
+        self.completed: list[StreamedPart] = []
+        self._headers: dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+        self._part: StreamedPart | None = None
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+        self._part = None
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if b"name" not in options:
+            raise ValueError('Multipart part is missing the Content-Disposition "name".')
+        # Strict UTF-8 on purpose: callers map UnicodeDecodeError to their metadata-encoding error.
+        filename = options.get(b"filename")
+        self._part = StreamedPart(
+            name=options[b"name"].decode("utf-8"),
+            filename=filename.decode("utf-8") if filename is not None else None,
+            content_type=self._headers.get(b"content-type", b"").decode("latin-1"),
+        )
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        part = self._part
+        if part is None or part.oversized:
+            return
+        limit = self.max_file_bytes if part.is_file else MAX_FIELD_BYTES
+        if len(part.data) + (end - start) > limit:
+            if not part.is_file:
+                raise ValueError(f"Form field {part.name!r} exceeds {MAX_FIELD_BYTES // 1024}KB.")
+            part.oversized = True
+            part.data = bytearray()
+            return
+        part.data += data[start:end]
+
+    def on_part_end(self) -> None:
+        if self._part is not None:
+            self.completed.append(self._part)
+        self._part = None
+
+
+async def iter_multipart_parts(
+    content_type: str,
+    chunks: AsyncIterable[bytes],
+    *,
+    max_file_bytes: int,
+) -> AsyncIterator[StreamedPart]:
+    """Yield each part of a ``multipart/form-data`` body as soon as its last byte arrives.
+
+    Unlike ``Request.form()``, which returns only after the whole body is
+    spooled, this lets the caller start work on file N while file N+1 is
+    still uploading.
+    """
+
+    _, params = parse_options_header(content_type)
+    boundary = params.get(b"boundary")
+    if not boundary:
+        raise ValueError("Missing boundary in multipart.")
+
+    collector = _PartCollector(max_file_bytes)
+    parser = MultipartParser(
+        boundary,
+        {
+            "on_part_begin": collector.on_part_begin,
+            "on_part_data": collector.on_part_data,
+            "on_part_end": collector.on_part_end,
+            "on_header_field": collector.on_header_field,
+            "on_header_value": collector.on_header_value,
+            "on_header_end": collector.on_header_end,
+            "on_headers_finished": collector.on_headers_finished,
+        },
+    )
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        parser.write(chunk)
+        while collector.completed:
+            yield collector.completed.pop(0)
+    parser.finalize()
+    while collector.completed:
+        yield collector.completed.pop(0)
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from python_cv.pdf_extract import PDF_TEXT_MODE_LAYOUT, ExtractedPdf, extract_text_from_pdf_bytes, pdf_text_mode
+
+PDF_CACHE_MB_ENV = "PYTHON_CV_PDF_CACHE_MB"
+# The disk tier stores extracted CV text as plaintext JSON, so the directory
+# must be private to the service; entries unused for the max age are deleted.
+PDF_CACHE_DIR_ENV = "PYTHON_CV_PDF_CACHE_DIR"
+PDF_CACHE_DISK_MB_ENV = "PYTHON_CV_PDF_CACHE_DISK_MB"
+PDF_CACHE_DISK_MAX_AGE_HOURS_ENV = "PYTHON_CV_PDF_CACHE_DISK_MAX_AGE_HOURS"
+DEFAULT_PDF_CACHE_MB = 64
+DEFAULT_PDF_CACHE_DISK_MB = 512
+DEFAULT_PDF_CACHE_DISK_MAX_AGE_HOURS = 24
+
+_DISK_SUFFIX = ".json"
+# Writes only scan the directory once the running byte total passes the cap,
+# plus every this many writes to pick up other workers' files and expiries.
+_DISK_RESCAN_WRITES = 256
+
+
+@dataclass
+class PdfCacheUsage:
+    """Per-request hit/miss counts, reported in response metadata.
+
+    ``peak_rss_bytes`` is the highest per-page RSS sample of the files parsed
+    on a miss; it stays 0 unless streaming extraction is enabled.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    peak_rss_bytes: int = 0
+
+
+def pdf_cache_key(
+    pdf_bytes: bytes, *, max_pages: int, max_total_chars: int, text_mode: str = PDF_TEXT_MODE_LAYOUT
+) -> str:
+    # The limits and text mode are part of the key: the same file extracted
+    # under other settings can yield different text, page counts and truncation.
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    key = f"{digest}-p{max_pages}-c{max_total_chars}"
+    # Layout keys keep their original shape so existing disk entries stay valid.
+    return key if text_mode == PDF_TEXT_MODE_LAYOUT else f"{key}-m{text_mode}"
+
+
+def _entry_size(extracted: ExtractedPdf) -> int:
+    return len(extracted.text.encode("utf-8"))
+
+
+class PdfExtractionCache:
+    """Content-addressed cache of ``ExtractedPdf`` results.
+
+    The memory tier is an LRU bounded by extracted-text bytes. The optional disk
+    tier keeps one JSON file per key in ``directory`` and drops the least
+    recently used files once it grows past ``max_disk_bytes``, and files unused
+    for ``max_disk_age_seconds`` (0 keeps them); disk hits are promoted back
+    into memory. Only successful extractions are cached.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        *,
+        directory: Path | None = None,
+        max_disk_bytes: int = 0,
+        max_disk_age_seconds: float = 0,
+    ) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self.directory = directory
+        self.max_disk_bytes = max(0, max_disk_bytes)
+        self.max_disk_age_seconds = max(0.0, max_disk_age_seconds)
+        self._entries: OrderedDict[str, ExtractedPdf] = OrderedDict()
+        self._bytes = 0
+        # Bytes on disk as of the last scan plus this process's writes since; None until scanned.
+        self._disk_bytes: int | None = None
+        self._disk_writes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> ExtractedPdf | None:
+        with self._lock:
+            extracted = self._entries.get(key)
+            if extracted is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return extracted
+
+        extracted = self._read_disk(key)
+        with self._lock:
+            if extracted is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, extracted)
+            return extracted
+
+    def put(self, key: str, extracted: ExtractedPdf) -> None:
+        with self._lock:
+            self._remember(key, extracted)
+        self._write_disk(key, extracted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remember(self, key: str, extracted: ExtractedPdf) -> None:
+        size = _entry_size(extracted)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= _entry_size(previous)
+        self._entries[key] = extracted
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= _entry_size(evicted)
+
+    def _expired(self, mtime_ns: int) -> bool:
+        return bool(self.max_disk_age_seconds) and time.time() - mtime_ns / 1e9 > self.max_disk_age_seconds
+
+    def _read_disk(self, key: str) -> ExtractedPdf | None:
+        if self.directory is None or self.max_disk_bytes <= 0:
+            return None
+        path = self.directory / f"{key}{_DISK_SUFFIX}"
+        try:
+            if self._expired(path.stat().st_mtime_ns):
+                path.unlink(missing_ok=True)
+                return None
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload["page_peak_rss_bytes"] = tuple(payload.get("page_peak_rss_bytes", ()))
+            extracted = ExtractedPdf(**payload)
+            path.touch()  # mtime doubles as the disk tier's recency
+        except (OSError, ValueError, TypeError):
+            return None
+        return extracted
+
+    def _write_disk(self, key: str, extracted: ExtractedPdf) -> None:
+        if self.directory is None or self.max_disk_bytes <= 0:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}{_DISK_SUFFIX}"
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            payload = json.dumps(asdict(extracted), ensure_ascii=False).encode("utf-8")
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            tmp_path.write_bytes(payload)
+            tmp_path.replace(path)
+
+            with self._lock:
+                self._disk_writes += 1
+                rescan = self._disk_bytes is None or self._disk_writes % _DISK_RESCAN_WRITES == 0
+                if self._disk_bytes is not None:
+                    self._disk_bytes += len(payload) - replaced
+                    rescan = rescan or self._disk_bytes > self.max_disk_bytes
+            if rescan:
+                self._evict_disk()
+        except OSError:  # the disk tier is best effort; memory still holds the entry
+            pass
+
+    def _evict_disk(self) -> None:
+        assert self.directory is not None
+        files: list[tuple[int, int, Path]] = []
+        for path in self.directory.glob(f"*{_DISK_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted concurrently by another worker
+                continue
+            if self._expired(stat.st_mtime_ns):
+                path.unlink(missing_ok=True)
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+
+def _env_megabytes(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if not raw:
+        return default * 1024 * 1024
+    try:
+        return max(0, int(raw)) * 1024 * 1024
+    except ValueError:
+        return default * 1024 * 1024
+
+
+def _env_hours(name: str, default: int) -> float:
+    raw = os.environ.get(name)
+    try:
+        hours = float(raw) if raw else default
+    except ValueError:
+        hours = default
+    return max(0.0, hours) * 3600
+
+
+def _pdf_cache_from_env() -> PdfExtractionCache:
+    directory = os.environ.get(PDF_CACHE_DIR_ENV, "").strip()
+    return PdfExtractionCache(
+        _env_megabytes(PDF_CACHE_MB_ENV, DEFAULT_PDF_CACHE_MB),
+        directory=Path(directory) if directory else None,
+        max_disk_bytes=_env_megabytes(PDF_CACHE_DISK_MB_ENV, DEFAULT_PDF_CACHE_DISK_MB),
+        max_disk_age_seconds=_env_hours(PDF_CACHE_DISK_MAX_AGE_HOURS_ENV, DEFAULT_PDF_CACHE_DISK_MAX_AGE_HOURS),
+    )
+
+
+pdf_cache = _pdf_cache_from_env()
+
+
+def extract_text_from_pdf_bytes_cached(
+    pdf_bytes: bytes,
+    *,
+    max_pages: int,
+    max_total_chars: int,
+    usage: PdfCacheUsage | None = None,
+    cache: PdfExtractionCache | None = None,
+    text_mode: str | None = None,
+    page_count: int | None = None,
+) -> ExtractedPdf:
+    """``extract_text_from_pdf_bytes`` served from ``cache`` (the module cache by default)."""
+
+    cache = pdf_cache if cache is None else cache
+    text_mode = pdf_text_mode(text_mode)
+    if not pdf_bytes:
+        return extract_text_from_pdf_bytes(
+            pdf_bytes, max_pages=max_pages, max_total_chars=max_total_chars, text_mode=text_mode
+        )
+
+    key = pdf_cache_key(pdf_bytes, max_pages=max_pages, max_total_chars=max_total_chars, text_mode=text_mode)
+    extracted = cache.get(key)
+    if extracted is not None:
+        if usage is not None:
+            usage.hits += 1
+        return extracted
+
+    if usage is not None:
+        usage.misses += 1
+    extracted = extract_text_from_pdf_bytes(
+        pdf_bytes,
+        max_pages=max_pages,
+        max_total_chars=max_total_chars,
+        text_mode=text_mode,
+        page_count=page_count,
+    )
+    if usage is not None and extracted.page_peak_rss_bytes:
+        usage.peak_rss_bytes = max(usage.peak_rss_bytes, *extracted.page_peak_rss_bytes)
+    cache.put(key, extracted)
+    return extracted
@@ -1,17 +1,69 @@
 from __future__ import annotations
 
 import io
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from itertools import islice
+from typing import Any
 
 import pdfplumber
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
+from pdfplumber.page import Page
 
+from python_cv.pdf_fast_text import iter_fast_page_texts
+from python_cv.pdf_sandbox import SandboxLimitError, SandboxPool, process_rss_bytes
 from python_cv.text_normalize import normalize_whitespace
 
+# 0 (the default) extracts pages in-process; N > 0 fans page ranges out to a
+# warm pool of N worker processes, since pdfplumber is pure Python and GIL-bound.
+PDF_WORKERS_ENV = "PYTHON_CV_PDF_WORKERS"
+
+# With the sandbox on, each document is parsed whole in a supervised child
+# process (PYTHON_CV_PDF_WORKERS of them, at least one) that is killed and
+# respawned when it breaks the deadline or the RSS cap.
+PDF_SANDBOX_ENV = "PYTHON_CV_PDF_SANDBOX"
+PDF_DEADLINE_SECONDS_ENV = "PYTHON_CV_PDF_DEADLINE_SECONDS"
+PDF_MAX_RSS_MB_ENV = "PYTHON_CV_PDF_MAX_RSS_MB"
+DEFAULT_PDF_DEADLINE_SECONDS = 10.0
+DEFAULT_PDF_MAX_RSS_MB = 512
+
+# Streaming creates pages one at a time, stops at the page or character limit
+# and releases each page's layout right after its text is taken.
+PDF_STREAMING_ENV = "PYTHON_CV_PDF_STREAMING"
+
+# "layout" (the default) is pdfplumber's extract_text; "fast" interprets pages
+# with a glyph-collecting pdfminer device and no layout analysis, falling back
+# to "layout" when it finds no text. Callers can override the env per request.
+PDF_TEXT_MODE_ENV = "PYTHON_CV_PDF_TEXT_MODE"
+PDF_TEXT_MODE_LAYOUT = "layout"
+PDF_TEXT_MODE_FAST = "fast"
+PDF_TEXT_MODES = (PDF_TEXT_MODE_LAYOUT, PDF_TEXT_MODE_FAST)
+
 
 class PdfParseError(Exception):
     pass
 
 
+class PdfInvalidError(PdfParseError):
+    """The bytes are not a usable PDF (no header, no pages)."""
+
+
+class PdfEncryptedError(PdfParseError):
+    """The PDF cannot be opened without a password."""
+
+
+class PdfResourceLimitError(PdfParseError):
+    """Parsing broke the sandbox deadline or memory cap; the worker was replaced."""
+
+
 class PdfEmptyTextError(Exception):
     pass
 
@@ -22,6 +74,8 @@ class ExtractedPdf:
     total_pages: int
     parsed_pages: int
     truncated: bool
+    # Streaming mode only: process RSS while each extracted page's layout was live.
+    page_peak_rss_bytes: tuple[int, ...] = ()
 
 
 def _normalize_page_text(page_text: str) -> str:
@@ -29,55 +83,369 @@ def _normalize_page_text(page_text: str) -> str:
     return "\n".join(line for line in lines if line)
 
 
+def pdf_worker_count() -> int:
+    raw = os.environ.get(PDF_WORKERS_ENV)
+    if not raw:
+        return 0
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return 0
+
+
+def pdf_sandbox_enabled() -> bool:
+    return os.environ.get(PDF_SANDBOX_ENV, "").strip().lower() in {"1", "true", "on", "yes"}
+
+
+def pdf_streaming_enabled() -> bool:
+    return os.environ.get(PDF_STREAMING_ENV, "").strip().lower() in {"1", "true", "on", "yes"}
+
+
+def pdf_text_mode(requested: str | None = None) -> str:
+    """``requested`` if given, else the env setting; unknown env values mean "layout"."""
+
+    if requested is not None:
+        mode = requested.strip().lower()
+        if mode not in PDF_TEXT_MODES:
+            raise ValueError(f"Unknown PDF text mode {requested!r}; expected one of {', '.join(PDF_TEXT_MODES)}.")
+        return mode
+    mode = os.environ.get(PDF_TEXT_MODE_ENV, "").strip().lower()
+    return mode if mode in PDF_TEXT_MODES else PDF_TEXT_MODE_LAYOUT
+
+
+def pdf_deadline_seconds() -> float:
+    raw = os.environ.get(PDF_DEADLINE_SECONDS_ENV)
+    if not raw:
+        return DEFAULT_PDF_DEADLINE_SECONDS
+    try:
+        value = float(raw)
+    except ValueError:
+        return DEFAULT_PDF_DEADLINE_SECONDS
+    return value if value > 0 else DEFAULT_PDF_DEADLINE_SECONDS
+
+
+def pdf_max_rss_bytes() -> int:
+    raw = os.environ.get(PDF_MAX_RSS_MB_ENV)
+    try:
+        megabytes = int(raw) if raw else DEFAULT_PDF_MAX_RSS_MB
+    except ValueError:
+        megabytes = DEFAULT_PDF_MAX_RSS_MB
+    return (megabytes if megabytes > 0 else DEFAULT_PDF_MAX_RSS_MB) * 1024 * 1024
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_sandbox: SandboxPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _pdf_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            # Spawned workers never inherit the server's threads or open sockets.
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+
+def _pdf_sandbox(workers: int) -> SandboxPool:
+    global _sandbox
+    with _pool_lock:
+        if _sandbox is None or _sandbox.size != workers:
+            if _sandbox is not None:
+                _sandbox.shutdown()
+            _sandbox = SandboxPool(workers)
+        return _sandbox
+
+
+def _ready() -> bool:
+    return True
+
+
+def warm_pdf_pool() -> int:
+    """Start every pool or sandbox worker (and its pdfplumber import) now; returns the worker count."""
+
+    workers = pdf_worker_count()
+    if pdf_sandbox_enabled():
+        sandbox = _pdf_sandbox(max(1, workers))
+        # Idle workers are handed out round-robin, so this reaches each one once.
+        for _ in range(sandbox.size):
+            sandbox.run(_ready, deadline_seconds=pdf_deadline_seconds(), max_rss_bytes=pdf_max_rss_bytes())
+        return sandbox.size
+    if workers:
+        pool = _pdf_pool(workers)
+        for future in [pool.submit(_ready) for _ in range(workers)]:
+            future.result()
+    return workers
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _pool_workers = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_pool() -> None:
+    global _pool, _pool_workers, _sandbox
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        if _sandbox is not None:
+            _sandbox.shutdown()
+        _pool = None
+        _pool_workers = 0
+        _sandbox = None
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> tuple[int, list[str]]:
+    """Worker entry point: total page count and normalized text of pages ``[start, stop)``."""
+
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        pages = pdf.pages
+        return len(pages), [_normalize_page_text(page.extract_text() or "") for page in pages[start:stop]]
+
+
+def _page_ranges(page_count: int, parts: int) -> list[tuple[int, int]]:
+    size, extra = divmod(page_count, parts)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    for idx in range(parts):
+        stop = start + size + (1 if idx < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _assemble(page_texts: Iterable[str], max_total_chars: int) -> tuple[str, bool]:
+    chunks: list[str] = []
+    current_chars = 0
+    truncated = False
+
+    for page_text in page_texts:
+        if not page_text:
+            continue
+
+        remaining = max_total_chars - current_chars
+        if remaining <= 0:
+            truncated = True
+            break
+
+        if len(page_text) > remaining:
+            chunks.append(page_text[:remaining])
+            current_chars += remaining
+            truncated = True
+            break
+
+        chunks.append(page_text)
+        current_chars += len(page_text)
+
+    return "\n\n".join(chunks).strip(), truncated
+
+
+def _extract_in_process(
+    pdf_bytes: bytes,
+    *,
+    max_pages: int,
+    max_total_chars: int,
+    streaming: bool = False,
+    text_mode: str = PDF_TEXT_MODE_LAYOUT,
+) -> ExtractedPdf:
+    if text_mode == PDF_TEXT_MODE_FAST:
+        extracted = _extract_fast(pdf_bytes, max_pages=max_pages, max_total_chars=max_total_chars)
+        if extracted.text:
+            return extracted
+        # Nothing the glyph device could decode; let pdfplumber have a go.
+
+    if streaming:
+        return _extract_streaming(pdf_bytes, max_pages=max_pages, max_total_chars=max_total_chars)
+
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        total_pages = len(pdf.pages)
+        parsed_pages = min(total_pages, max_pages)
+        # Lazy so pages past the character budget are never extracted.
+        page_texts = (_normalize_page_text(page.extract_text() or "") for page in pdf.pages[:parsed_pages])
+        text, truncated = _assemble(page_texts, max_total_chars)
+        return ExtractedPdf(text=text, total_pages=total_pages, parsed_pages=parsed_pages, truncated=truncated)
+
+
+def _declared_page_count(document: PDFDocument) -> int | None:
+    try:
+        count = resolve1(resolve1(document.catalog["Pages"])["Count"])
+    except Exception:  # malformed page tree root; the caller walks the tree instead
+        return None
+    return count if isinstance(count, int) and count >= 0 else None
+
+
+def _stream_page_texts(pdf: pdfplumber.PDF, max_pages: int, page_rss: list[int]) -> Iterator[str]:
+    doctop: float = 0
+    for index, page_object in enumerate(islice(PDFPage.create_pages(pdf.doc), max_pages)):
+        page = Page(pdf, page_object, page_number=index + 1, initial_doctop=doctop)
+        doctop += page.height
+        try:
+            page_text = page.extract_text() or ""
+            # Sampled while the page layout is still alive, i.e. at its high-water mark.
+            rss = process_rss_bytes(os.getpid())
+            if rss is not None:
+                page_rss.append(rss)
+        finally:
+            page.close()
+        yield _normalize_page_text(page_text)
+
+
+def _extract_streaming(pdf_bytes: bytes, *, max_pages: int, max_total_chars: int) -> ExtractedPdf:
+    """Like the default path, but pages are created one at a time and released right after use.
+
+    ``pdf.pages`` would build every page object of the document up front and
+    keep them, with their cached layouts, until the file is closed.
+    """
+
+    pdf = pdfplumber.open(io.BytesIO(pdf_bytes))
+    try:
+        page_rss: list[int] = []
+        text, truncated = _assemble(_stream_page_texts(pdf, max_pages, page_rss), max_total_chars)
+        total_pages = _declared_page_count(pdf.doc)
+        if total_pages is None:
+            total_pages = sum(1 for _ in PDFPage.create_pages(pdf.doc))
+    finally:
+        # Not pdf.close(): that materializes ``pdf.pages`` just to close them.
+        pdf.flush_cache()
+
+    return ExtractedPdf(
+        text=text,
+        total_pages=total_pages,
+        parsed_pages=min(total_pages, max_pages),
+        truncated=truncated,
+        page_peak_rss_bytes=tuple(page_rss),
+    )
+
+
+def _extract_fast(pdf_bytes: bytes, *, max_pages: int, max_total_chars: int) -> ExtractedPdf:
+    document = PDFDocument(PDFParser(io.BytesIO(pdf_bytes)))
+    page_texts = (_normalize_page_text(page_text) for page_text in iter_fast_page_texts(document, max_pages))
+    text, truncated = _assemble(page_texts, max_total_chars)
+    total_pages = _declared_page_count(document)
+    if total_pages is None:
+        total_pages = sum(1 for _ in PDFPage.create_pages(document))
+    return ExtractedPdf(
+        text=text,
+        total_pages=total_pages,
+        parsed_pages=min(total_pages, max_pages),
+        truncated=truncated,
+    )
+
+
+def _extract_in_pool(
+    pdf_bytes: bytes, *, max_pages: int, max_total_chars: int, workers: int, page_count: int | None
+) -> ExtractedPdf:
+    # Every worker re-parses the whole file, so only as many ranges as the
+    # document has pages are handed out, and one range is done in-process.
+    if page_count is None:
+        page_count = _declared_page_count(PDFDocument(PDFParser(io.BytesIO(pdf_bytes))))
+    pages = max_pages if page_count is None else min(max_pages, page_count)
+    parts = min(workers, pages)
+    if parts <= 1:
+        return _extract_in_process(pdf_bytes, max_pages=max_pages, max_total_chars=max_total_chars)
+
+    ranges = _page_ranges(pages, parts)
+    # The declared count comes from the file itself; the last range runs to
+    # max_pages so an understated /Count never drops pages.
+    ranges[-1] = (ranges[-1][0], max_pages)
+    pool = _pdf_pool(workers)
+    futures = [pool.submit(_extract_page_range, pdf_bytes, start, stop) for start, stop in ranges]
+    total_pages = 0
+    page_texts: list[str] = []
+    try:
+        for future in futures:
+            total_pages, texts = future.result()
+            page_texts.extend(texts)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); start a fresh pool for the next request.
+        _discard_pool(pool)
+        raise
+    text, truncated = _assemble(page_texts, max_total_chars)
+    return ExtractedPdf(
+        text=text,
+        total_pages=total_pages,
+        parsed_pages=min(total_pages, max_pages),
+        truncated=truncated,
+    )
+
+
+def run_pdf_parser_call(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a call that feeds untrusted bytes to pdfminer, sandboxed when ``PYTHON_CV_PDF_SANDBOX`` is on."""
+
+    if not pdf_sandbox_enabled():
+        return function(*args, **kwargs)
+    try:
+        return _pdf_sandbox(max(1, pdf_worker_count())).run(
+            function,
+            *args,
+            deadline_seconds=pdf_deadline_seconds(),
+            max_rss_bytes=pdf_max_rss_bytes(),
+            **kwargs,
+        )
+    except SandboxLimitError as exc:
+        raise PdfResourceLimitError(str(exc)) from exc
+
+
 def extract_text_from_pdf_bytes(
     pdf_bytes: bytes,
     *,
     max_pages: int,
     max_total_chars: int,
+    text_mode: str | None = None,
+    page_count: int | None = None,
 ) -> ExtractedPdf:
+    """Extract normalized text; ``text_mode`` overrides ``PYTHON_CV_PDF_TEXT_MODE`` for this call.
+
+    ``page_count`` (e.g. from preflight) sizes the page ranges handed to the
+    process pool; without it the pool path reads the declared count itself.
+    """
+
+    text_mode = pdf_text_mode(text_mode)
     if not pdf_bytes:
         raise PdfParseError("PDF file is empty")
 
+    workers = pdf_worker_count()
+    streaming = pdf_streaming_enabled()
     try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            total_pages = len(pdf.pages)
-            parsed_pages = min(total_pages, max_pages)
-            chunks: list[str] = []
-            current_chars = 0
-            truncated = False
-
-            for page in pdf.pages[:parsed_pages]:
-                page_text_raw = page.extract_text() or ""
-                page_text = _normalize_page_text(page_text_raw)
-                if not page_text:
-                    continue
-
-                remaining = max_total_chars - current_chars
-                if remaining <= 0:
-                    truncated = True
-                    break
-
-                if len(page_text) > remaining:
-                    chunks.append(page_text[:remaining])
-                    current_chars += remaining
-                    truncated = True
-                    break
-
-                chunks.append(page_text)
-                current_chars += len(page_text)
-
-            extracted_text = "\n\n".join(chunks).strip()
-
-            if not extracted_text:
-                raise PdfEmptyTextError("No text could be extracted. OCR is not supported in V1.")
-
-            return ExtractedPdf(
-                text=extracted_text,
-                total_pages=total_pages,
-                parsed_pages=parsed_pages,
-                truncated=truncated,
+        if pdf_sandbox_enabled():
+            extracted = run_pdf_parser_call(
+                _extract_in_process,
+                pdf_bytes,
+                max_pages=max_pages,
+                max_total_chars=max_total_chars,
+                streaming=streaming,
+                text_mode=text_mode,
+            )
+        elif workers and max_pages > 0 and not streaming and text_mode == PDF_TEXT_MODE_LAYOUT:
+            extracted = _extract_in_pool(
+                pdf_bytes,
+                max_pages=max_pages,
+                max_total_chars=max_total_chars,
+                workers=workers,
+                page_count=page_count,
+            )
+        else:
+            extracted = _extract_in_process(
+                pdf_bytes,
+                max_pages=max_pages,
+                max_total_chars=max_total_chars,
+                streaming=streaming,
+                text_mode=text_mode,
             )
-    except PdfEmptyTextError:
+
+        if not extracted.text:
+            raise PdfEmptyTextError("No text could be extracted. OCR is not supported in V1.")
+
+        return extracted
+    except (PdfEmptyTextError, PdfResourceLimitError):
         raise
     except Exception as exc:  # pragma: no cover - third-party parser errors vary
         raise PdfParseError(str(exc) or "Failed to parse PDF") from exc
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any
+
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+
+# Same defaults as pdfplumber's ``extract_text`` so both modes break lines and
+# words in the same places on ordinary documents.
+LINE_TOLERANCE = 3.0
+WORD_GAP_TOLERANCE = 3.0
+
+
+class _TextOnlyDevice(PDFTextDevice):
+    """Collects ``(baseline, x0, x1, text)`` per glyph and nothing else.
+
+    pdfminer's layout device builds an ``LTChar`` with a full bounding box per
+    glyph and pdfplumber then turns each into a dict and clusters words; for
+    skill spotting the glyph origin and advance are enough.
+    """
+
+    def __init__(self, rsrcmgr: PDFResourceManager) -> None:
+        super().__init__(rsrcmgr)
+        self.glyphs: list[tuple[float, float, float, str]] = []
+
+    def begin_page(self, page: PDFPage, ctm: Any) -> None:
+        self.glyphs = []
+
+    def render_char(
+        self,
+        matrix: Any,
+        font: Any,
+        fontsize: float,
+        scaling: float,
+        rise: float,
+        cid: int,
+        ncs: Any,
+        graphicstate: Any,
+    ) -> float:
+        advance = font.char_width(cid) * fontsize * scaling
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = f"(cid:{cid})"  # what pdfminer's layout analyzer emits, so both modes agree
+        a, _, _, _, e, f = matrix
+        x1 = e + a * advance
+        self.glyphs.append((f, min(e, x1), max(e, x1), text))
+        return advance
+
+
+def _page_text(glyphs: list[tuple[float, float, float, str]]) -> str:
+    # Top-to-bottom lines clustered within LINE_TOLERANCE of the previous
+    # baseline, glyphs left to right, a space wherever the gap between glyphs
+    # is wider than WORD_GAP_TOLERANCE.
+    lines: list[list[tuple[float, float, float, str]]] = []
+    last_top: float | None = None
+    for glyph in sorted(glyphs, key=lambda item: -item[0]):
+        top = -glyph[0]
+        if last_top is None or top - last_top > LINE_TOLERANCE:
+            lines.append([])
+        lines[-1].append(glyph)
+        last_top = top
+
+    rendered: list[str] = []
+    for line in lines:
+        parts: list[str] = []
+        previous_x1: float | None = None
+        for _, x0, x1, text in sorted(line, key=lambda item: item[1]):
+            if previous_x1 is not None and x0 - previous_x1 > WORD_GAP_TOLERANCE:
+                parts.append(" ")
+            parts.append(text)
+            previous_x1 = x1
+        rendered.append("".join(parts))
+    return "\n".join(rendered)
+
+
+def iter_fast_page_texts(document: PDFDocument, max_pages: int) -> Iterator[str]:
+    """Raw text of the first ``max_pages`` pages, interpreted one at a time without layout analysis."""
+
+    rsrcmgr = PDFResourceManager(caching=True)
+    device = _TextOnlyDevice(rsrcmgr)
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    for page in islice(PDFPage.create_pages(document), max_pages):
+        interpreter.process_page(page)
+        yield _page_text(device.glyphs)
+        device.glyphs = []
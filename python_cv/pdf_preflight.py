@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import io
+import re
+import zlib
+from dataclasses import dataclass
+
+from pdfminer.pdfdocument import PDFDocument, PDFEncryptionError, PDFPasswordIncorrect
+from pdfminer.pdfparser import PDFParser
+
+from python_cv.pdf_extract import PdfEmptyTextError, PdfEncryptedError, PdfInvalidError, run_pdf_parser_call
+
+# Readers accept the header anywhere in the first KB; startxref sits in the last few.
+_HEADER_WINDOW = 1024
+_TAIL_WINDOW = 2048
+_OBJECT_WINDOW = 64 * 1024
+_MAX_XREF_SECTIONS = 32
+# Hard caps on what sniffing may inflate, so a Flate bomb or a huge predictor
+# table costs the preflight a bounded amount of memory and time.
+_MAX_DECODED_BYTES = 4 * 1024 * 1024
+_MAX_PREDICTED_BYTES = 1024 * 1024
+_SCAN_CHUNK_BYTES = 64 * 1024
+
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_SUBSECTION_RE = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*\r?\n?")
+_ENTRY_RE = re.compile(rb"(\d{10})\s(\d{5})\s([nf])\s{0,2}")
+_TRAILER_RE = re.compile(rb"\s*trailer\s*")
+_OBJ_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj\b")
+_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_PREV_RE = re.compile(rb"/Prev\s+(\d+)")
+_PAGES_RE = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)\b(?!\s+\d+\s+R)")
+_W_RE = re.compile(rb"/W\s*\[\s*(\d+)\s+(\d+)\s+(\d+)\s*\]")
+_INDEX_RE = re.compile(rb"/Index\s*\[([\d\s]*)\]")
+_SIZE_RE = re.compile(rb"/Size\s+(\d+)")
+_LENGTH_RE = re.compile(rb"/Length\s+(\d+)\b(?!\s+\d+\s+R)")
+_COLUMNS_RE = re.compile(rb"/Columns\s+(\d+)")
+_PREDICTOR_RE = re.compile(rb"/Predictor\s+(\d+)")
+_STREAM_RE = re.compile(rb"stream\r?\n")
+_FIRST_RE = re.compile(rb"/First\s+(\d+)")
+_OBJSTM_RE = re.compile(rb"/Type\s*/ObjStm\b")
+
+
+class _Unreadable(Exception):
+    """The cross-reference data is not in a shape the sniffer handles; the full parser decides."""
+
+
+@dataclass(frozen=True)
+class PdfPreflight:
+    """What the header, trailer and cross-reference data say about a file.
+
+    ``page_count`` is None when the page tree root could not be reached without
+    a real parser (e.g. it lives in a compressed object stream); ``has_fonts``
+    is None when font resources could be hidden in object streams.
+    """
+
+    is_pdf: bool
+    encrypted: bool = False
+    page_count: int | None = None
+    has_fonts: bool | None = None
+
+
+# Where an object lives: a byte offset, (object stream number, index) inside a
+# compressed object stream, or None when the entry is free.
+_Location = int | tuple[int, int] | None
+_NOT_IN_SECTION = object()
+
+
+def _dictionary_at(data: bytes, offset: int) -> bytes:
+    end = data.find(b"endobj", offset, offset + _OBJECT_WINDOW)
+    return data[offset : end if end >= 0 else offset + _OBJECT_WINDOW]
+
+
+def _stream_body(data: bytes, body_offset: int) -> tuple[bytes, bytes]:
+    """``(dictionary, raw stream bytes)`` of the stream object whose body starts at ``body_offset``."""
+
+    body = _dictionary_at(data, body_offset)
+    stream_start = _STREAM_RE.search(body)
+    length = _LENGTH_RE.search(body)
+    if stream_start is None or length is None:
+        raise _Unreadable("stream without a direct /Length")
+    dictionary = body[: stream_start.start()]
+    if b"/Filter" in dictionary and b"/FlateDecode" not in dictionary:
+        raise _Unreadable("unsupported stream filter")
+    start = body_offset + stream_start.end()
+    return dictionary, data[start : start + int(length.group(1))]
+
+
+def _stream_payload(data: bytes, body_offset: int) -> tuple[bytes, bytes]:
+    """``(dictionary, decoded stream)``, refusing streams that inflate past ``_MAX_DECODED_BYTES``."""
+
+    dictionary, payload = _stream_body(data, body_offset)
+    if b"/FlateDecode" in dictionary:
+        inflater = zlib.decompressobj()
+        payload = inflater.decompress(payload, _MAX_DECODED_BYTES)
+        if inflater.unconsumed_tail or len(payload) >= _MAX_DECODED_BYTES:
+            raise _Unreadable("stream inflates past the preflight cap")
+    predictor = _PREDICTOR_RE.search(dictionary)
+    if predictor is not None and int(predictor.group(1)) >= 10:
+        columns = _COLUMNS_RE.search(dictionary)
+        payload = _unpredict_png(payload, int(columns.group(1)) if columns else 1)
+    return dictionary, payload
+
+
+def _stream_contains(data: bytes, body_offset: int, needle: bytes) -> bool:
+    """Whether the decoded stream contains ``needle``, inflating only as far as the first hit."""
+
+    dictionary, payload = _stream_body(data, body_offset)
+    if b"/FlateDecode" not in dictionary:
+        return needle in payload
+    inflater = zlib.decompressobj()
+    carry = b""
+    decoded = 0
+    while not inflater.eof:
+        chunk = inflater.decompress(payload, _SCAN_CHUNK_BYTES)
+        payload = inflater.unconsumed_tail
+        if not chunk:
+            break  # truncated stream: nothing more to inflate
+        if needle in carry + chunk:
+            return True
+        decoded += len(chunk)
+        if decoded > _MAX_DECODED_BYTES:
+            raise _Unreadable("stream inflates past the preflight cap")
+        carry = chunk[len(chunk) - len(needle) + 1 :]
+    return False
+
+
+def _unpredict_png(raw: bytes, columns: int) -> bytes:
+    # PNG "Up"/"Sub"/... row filters, as used by nearly every compressed xref stream.
+    # Pure Python, so the input is capped: real xref streams are a few hundred KB.
+    if len(raw) > _MAX_PREDICTED_BYTES:
+        raise _Unreadable("predictor-encoded stream is too large to sniff")
+    rows: list[bytearray] = []
+    previous = bytearray(columns)
+    stride = columns + 1
+    for start in range(0, len(raw) - columns, stride):
+        kind, row = raw[start], bytearray(raw[start + 1 : start + stride])
+        if kind == 2:
+            row = bytearray((value + up) & 0xFF for value, up in zip(row, previous))
+        elif kind:
+            for i in range(columns):
+                left = row[i - 1] if i else 0
+                up = previous[i]
+                if kind == 1:
+                    row[i] = (row[i] + left) & 0xFF
+                elif kind == 3:
+                    row[i] = (row[i] + ((left + up) >> 1)) & 0xFF
+                elif kind == 4:
+                    upper_left = previous[i - 1] if i else 0
+                    estimate = left + up - upper_left
+                    pa, pb, pc = abs(estimate - left), abs(estimate - up), abs(estimate - upper_left)
+                    row[i] = (row[i] + (left if pa <= pb and pa <= pc else up if pb <= pc else upper_left)) & 0xFF
+        rows.append(row)
+        previous = row
+    return b"".join(rows)
+
+
+class _XrefTable:
+    """A classic ``xref`` section; entries are fixed 20-byte records, so lookups index directly."""
+
+    def __init__(self, data: bytes, offset: int) -> None:
+        self._data = data
+        self._ranges: list[tuple[int, int, int]] = []
+        position = offset + len(b"xref")
+        while (subsection := _SUBSECTION_RE.match(data, position)) is not None:
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            self._ranges.append((first, count, subsection.end()))
+            position = subsection.end() + count * 20
+        trailer = _TRAILER_RE.match(data, position)
+        if trailer is None:
+            raise _Unreadable("cross-reference table without trailer")
+        end = data.find(b"startxref", trailer.end())
+        self.trailer = data[trailer.end() : end if end >= 0 else trailer.end() + _OBJECT_WINDOW]
+
+    def locate(self, object_number: int) -> object:
+        for first, count, start in self._ranges:
+            if first <= object_number < first + count:
+                entry = _ENTRY_RE.match(self._data, start + (object_number - first) * 20)
+                if entry is None:
+                    raise _Unreadable("malformed cross-reference entry")
+                return int(entry.group(1)) if entry.group(3) == b"n" else None
+        return _NOT_IN_SECTION
+
+
+class _XrefStream:
+    """A PDF 1.5 cross-reference stream, decoded once and indexed on demand."""
+
+    def __init__(self, data: bytes, offset: int) -> None:
+        header = _OBJ_RE.match(data, offset)
+        if header is None:
+            raise _Unreadable("no cross-reference section at startxref")
+        dictionary, self._payload = _stream_payload(data, header.end())
+        widths = _W_RE.search(dictionary)
+        if widths is None or b"/XRef" not in dictionary:
+            raise _Unreadable("unsupported cross-reference stream")
+        self.trailer = dictionary
+        self._widths = tuple(int(value) for value in widths.groups())
+        index = _INDEX_RE.search(dictionary)
+        if index is not None:
+            numbers = [int(value) for value in index.group(1).split()]
+        else:
+            size = _SIZE_RE.search(dictionary)
+            numbers = [0, int(size.group(1)) if size else 0]
+        self._ranges: list[tuple[int, int, int]] = []
+        row = 0
+        for first, count in zip(numbers[::2], numbers[1::2]):
+            self._ranges.append((first, count, row))
+            row += count
+
+    def locate(self, object_number: int) -> object:
+        w1, w2, w3 = self._widths
+        for first, count, row in self._ranges:
+            if first <= object_number < first + count:
+                start = (row + object_number - first) * (w1 + w2 + w3)
+                entry = self._payload[start : start + w1 + w2 + w3]
+                if len(entry) < w1 + w2 + w3:
+                    raise _Unreadable("truncated cross-reference stream")
+                kind = int.from_bytes(entry[:w1], "big") if w1 else 1
+                field = int.from_bytes(entry[w1 : w1 + w2], "big")
+                if kind == 1:
+                    return field
+                if kind == 2:
+                    return (field, int.from_bytes(entry[w1 + w2 :], "big"))
+                return None
+        return _NOT_IN_SECTION
+
+
+class _CrossReferences:
+    def __init__(self, data: bytes) -> None:
+        match = None
+        for match in _STARTXREF_RE.finditer(data, max(0, len(data) - _TAIL_WINDOW)):
+            pass
+        if match is None:
+            raise _Unreadable("no startxref")
+
+        self._data = data
+        self._sections: list[_XrefTable | _XrefStream] = []
+        offset: int | None = int(match.group(1))
+        seen: set[int] = set()
+        while offset is not None and offset not in seen and len(seen) < _MAX_XREF_SECTIONS:
+            seen.add(offset)
+            section = _XrefTable(data, offset) if data.startswith(b"xref", offset) else _XrefStream(data, offset)
+            self._sections.append(section)
+            previous = _PREV_RE.search(section.trailer)
+            offset = int(previous.group(1)) if previous else None
+        # Newest section first: incremental updates override older entries.
+        self.trailer = self._sections[0].trailer
+
+    def _locate(self, object_number: int) -> _Location:
+        for section in self._sections:
+            location = section.locate(object_number)
+            if location is not _NOT_IN_SECTION:
+                return location  # type: ignore[return-value]
+        return None
+
+    def object_body(self, object_number: int, *, depth: int = 0) -> bytes:
+        location = self._locate(object_number)
+        if location is None:
+            raise _Unreadable(f"object {object_number} is missing")
+        if isinstance(location, tuple):
+            if depth:
+                raise _Unreadable("nested object streams")
+            return self._compressed_object(*location)
+        header = _OBJ_RE.match(self._data, location)
+        if header is None or int(header.group(1)) != object_number:
+            raise _Unreadable(f"object {object_number} is not at its recorded offset")
+        return _dictionary_at(self._data, header.end())
+
+    def _compressed_object(self, stream_number: int, index: int) -> bytes:
+        location = self._locate(stream_number)
+        if not isinstance(location, int):
+            raise _Unreadable("object stream is not directly addressable")
+        header = _OBJ_RE.match(self._data, location)
+        if header is None:
+            raise _Unreadable("object stream is not at its recorded offset")
+        dictionary, payload = _stream_payload(self._data, header.end())
+        first = _FIRST_RE.search(dictionary)
+        if first is None:
+            raise _Unreadable("object stream without /First")
+        offsets = [int(value) for value in payload[: int(first.group(1))].split()[1::2]]
+        if index >= len(offsets):
+            raise _Unreadable("object stream index out of range")
+        start = int(first.group(1)) + offsets[index]
+        end = int(first.group(1)) + offsets[index + 1] if index + 1 < len(offsets) else len(payload)
+        return payload[start:end]
+
+    def object_streams_contain(self, needle: bytes) -> bool:
+        """Whether any ``/ObjStm`` in the file holds ``needle``; stops decoding at the first hit."""
+
+        for match in _OBJSTM_RE.finditer(self._data):
+            header_start = self._data.rfind(b" obj", 0, match.start())
+            if header_start >= 0 and _stream_contains(self._data, header_start + len(b" obj"), needle):
+                return True
+        return False
+
+
+def _page_count(references: _CrossReferences) -> int:
+    root = _ROOT_RE.search(references.trailer)
+    if root is None:
+        raise _Unreadable("trailer without /Root")
+    pages = _PAGES_RE.search(references.object_body(int(root.group(1))))
+    if pages is None:
+        raise _Unreadable("catalog without /Pages")
+    count = _COUNT_RE.search(references.object_body(int(pages.group(1))))
+    if count is None:
+        raise _Unreadable("page tree root without a direct /Count")
+    return int(count.group(1))
+
+
+def preflight_pdf(data: bytes) -> PdfPreflight:
+    """Sniff ``data`` without running the PDF parser.
+
+    Reads the header, the trailer and the cross-reference data it points to
+    (tables and Flate-compressed xref streams), then only the catalog and the
+    page tree root. Font resources are found with a byte search, extended to
+    decompressed object streams when the plain bytes have none.
+    """
+
+    if data.find(b"%PDF-", 0, _HEADER_WINDOW) < 0:
+        return PdfPreflight(is_pdf=False)
+
+    try:
+        references = _CrossReferences(data)
+    except (_Unreadable, ValueError, zlib.error):
+        # Damaged or unusual xref: leave structure to the parser's own recovery.
+        has_fonts = True if b"/Font" in data else None
+        return PdfPreflight(is_pdf=True, encrypted=b"/Encrypt" in data, has_fonts=has_fonts)
+
+    try:
+        page_count: int | None = _page_count(references)
+    except (_Unreadable, ValueError, zlib.error):
+        page_count = None
+
+    has_fonts: bool | None = b"/Font" in data
+    if not has_fonts and b"/ObjStm" in data:
+        try:
+            has_fonts = references.object_streams_contain(b"/Font")
+        except (_Unreadable, ValueError, zlib.error):
+            has_fonts = None
+
+    return PdfPreflight(
+        is_pdf=True,
+        encrypted=b"/Encrypt" in references.trailer,
+        page_count=page_count,
+        has_fonts=has_fonts,
+    )
+
+
+def _needs_password(data: bytes) -> bool:
+    # Most "encrypted" CVs only restrict printing/copying and open with the empty
+    # user password; pdfminer checks that while reading just the xref and trailer.
+    try:
+        PDFDocument(PDFParser(io.BytesIO(data)), password="", fallback=False)
+    except (PDFPasswordIncorrect, PDFEncryptionError):
+        return True
+    except Exception:  # anything else is for the full parse to report
+        return False
+    return False
+
+
+def reject_unparseable_pdf(data: bytes) -> PdfPreflight:
+    """Raise the precise ``PdfParseError``/``PdfEmptyTextError`` a full parse would end in, cheaply.
+
+    Returns the preflight result for files that are worth a full parse.
+    """
+
+    preflight = preflight_pdf(data)
+    if not preflight.is_pdf:
+        raise PdfInvalidError("Not a PDF: missing %PDF header")
+    if preflight.page_count == 0:
+        raise PdfInvalidError("PDF has no pages")
+    # The password check is pdfminer on untrusted bytes, so it gets the same sandbox as the parse.
+    if preflight.encrypted and run_pdf_parser_call(_needs_password, data):
+        raise PdfEncryptedError("PDF is encrypted and needs a password")
+    if preflight.has_fonts is False:
+        raise PdfEmptyTextError("No text could be extracted. OCR is not supported in V1.")
+    return preflight
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+try:  # POSIX only; elsewhere the RSS polling below is the only memory guard.
+    import resource
+except ImportError:  # pragma: no cover - depends on the platform
+    resource = None
+
+_POLL_SECONDS = 0.05
+_KILL_WAIT_SECONDS = 1.0
+
+
+class SandboxLimitError(Exception):
+    """The sandboxed call broke its deadline or memory cap, or its process died."""
+
+
+def _process_status_bytes(pid: int, field: bytes) -> int | None:
+    try:
+        with Path(f"/proc/{pid}/status").open("rb") as handle:
+            for line in handle:
+                if line.startswith(field):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def process_rss_bytes(pid: int) -> int | None:
+    """Resident set size of ``pid`` from /proc, or None where that is unavailable."""
+
+    return _process_status_bytes(pid, b"VmRSS:")
+
+
+def _cap_address_space(headroom_bytes: int) -> None:
+    # Polling only notices growth every _POLL_SECONDS; the rlimit makes one huge
+    # allocation between polls fail with MemoryError instead of taking the host.
+    if resource is None:
+        return
+    mapped = _process_status_bytes(os.getpid(), b"VmSize:")
+    if mapped is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = mapped + headroom_bytes
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _sandbox_main(conn: Connection) -> None:
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        function, args, kwargs, max_rss_bytes = request
+        try:
+            _cap_address_space(max_rss_bytes)
+            conn.send(("ok", function(*args, **kwargs)))
+        except Exception as exc:
+            try:
+                conn.send(("error", exc))
+            except Exception:  # unpicklable third-party exception
+                conn.send(("error", RuntimeError(str(exc) or exc.__class__.__name__)))
+
+
+class SandboxWorker:
+    """One supervised child process that runs calls under a deadline and an RSS cap.
+
+    The parent polls the child while it works and kills it on a breach; the
+    next call starts a fresh process, so one pathological input never poisons
+    later ones.
+    """
+
+    def __init__(self, context: Any) -> None:
+        self._context = context
+        self._process: Any = None
+        self._conn: Connection | None = None
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    def start(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            return
+        self.stop()
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_sandbox_main, args=(child_conn,), name="pdf-sandbox", daemon=True)
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+
+    def stop(self) -> None:
+        process, conn = self._process, self._conn
+        self._process = None
+        self._conn = None
+        if conn is not None:
+            conn.close()
+        if process is not None:
+            if process.is_alive():
+                process.kill()
+            process.join(_KILL_WAIT_SECONDS)
+
+    def run(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        deadline_seconds: float,
+        max_rss_bytes: int,
+        **kwargs: Any,
+    ) -> Any:
+        self.start()
+        assert self._process is not None and self._conn is not None
+        process, conn = self._process, self._conn
+        deadline = time.monotonic() + deadline_seconds
+
+        try:
+            conn.send((function, args, kwargs, max_rss_bytes))
+            while not conn.poll(_POLL_SECONDS):
+                if not process.is_alive():
+                    raise SandboxLimitError("PDF worker exited unexpectedly (likely out of memory)")
+                if time.monotonic() >= deadline:
+                    raise SandboxLimitError(f"PDF parsing exceeded the {deadline_seconds:.3g}s deadline")
+                rss = process_rss_bytes(process.pid)
+                if rss is not None and rss > max_rss_bytes:
+                    raise SandboxLimitError(f"PDF parsing exceeded the {max_rss_bytes // (1024 * 1024)}MB memory limit")
+            status, payload = conn.recv()
+        except SandboxLimitError:
+            self.stop()
+            raise
+        except (EOFError, OSError) as exc:
+            self.stop()
+            raise SandboxLimitError("PDF worker exited unexpectedly") from exc
+
+        # Memory a finished call left behind stays resident; recycle bloated workers.
+        rss = process_rss_bytes(process.pid)
+        if rss is not None and rss > max_rss_bytes:
+            self.stop()
+
+        if status == "error":
+            if isinstance(payload, MemoryError):
+                self.stop()
+                raise SandboxLimitError(
+                    f"PDF parsing exceeded the {max_rss_bytes // (1024 * 1024)}MB memory limit"
+                ) from payload
+            raise payload
+        return payload
+
+
+class SandboxPool:
+    """Fixed set of ``SandboxWorker``s handed out to one caller at a time."""
+
+    def __init__(self, size: int) -> None:
+        # Spawned so the child never inherits the server's threads, locks or sockets.
+        context = multiprocessing.get_context("spawn")
+        self.size = max(1, size)
+        self._workers = [SandboxWorker(context) for _ in range(self.size)]
+        self._idle: queue.SimpleQueue[SandboxWorker] = queue.SimpleQueue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._closed = threading.Event()
+
+    def start(self) -> None:
+        for worker in self._workers:
+            worker.start()
+
+    def run(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        deadline_seconds: float,
+        max_rss_bytes: int,
+        **kwargs: Any,
+    ) -> Any:
+        if self._closed.is_set():
+            raise SandboxLimitError("PDF sandbox is shut down")
+        # Waiting for a free worker counts against the same deadline as the call itself.
+        deadline = time.monotonic() + deadline_seconds
+        try:
+            worker = self._idle.get(timeout=deadline_seconds)
+        except queue.Empty:
+            raise SandboxLimitError(
+                f"No PDF worker became free within the {deadline_seconds:g}s deadline"
+            ) from None
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SandboxLimitError(f"No PDF worker became free within the {deadline_seconds:g}s deadline")
+            return worker.run(function, *args, deadline_seconds=remaining, max_rss_bytes=max_rss_bytes, **kwargs)
+        finally:
+            self._idle.put(worker)
+
+    def shutdown(self) -> None:
+        self._closed.set()
+        for worker in self._workers:
+            worker.stop()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import random
+from time import perf_counter
+
+from rapidfuzz.distance import Levenshtein
+
+from python_cv.pdf_extract import PDF_TEXT_MODE_FAST, PDF_TEXT_MODE_LAYOUT, extract_text_from_pdf_bytes
+from python_cv.synthetic_pdf import build_text_pdf
+
+SKILL_LINES = (
+    "Python, TypeScript, React.js, Node.js, PostgreSQL, Redis, Kafka",
+    "AWS (EC2, S3, Lambda), Terraform, Kubernetes, Docker, CI/CD",
+    "Machine Learning, PyTorch, scikit-learn, Pandas, R&D, C++",
+    "Languages: English (fluent), Français, Español - B2",
+)
+EXPERIENCE_LINES = (
+    "Senior Software Engineer at Example Org",
+    "2019 - Present",
+    "Led migration of billing services to event-driven architecture.",
+    "Built data pipelines processing 2B events/day with Kafka and Spark.",
+    "Mentored engineers; owned incident response and on-call rotations.",
+    "Café ordering platform: José & Zoë, Müller GmbH (São Paulo office)",
+)
+
+
+def build_corpus(documents: int, max_pages: int, seed: int) -> list[bytes]:
+    rng = random.Random(seed)
+    corpus: list[bytes] = []
+    for _ in range(documents):
+        pages: list[list[str]] = []
+        for page_idx in range(rng.randint(1, max_pages)):
+            lines = ["Experience" if page_idx == 0 else f"Experience (continued, page {page_idx + 1})"]
+            lines.extend(rng.choice(EXPERIENCE_LINES) for _ in range(rng.randint(10, 45)))
+            lines.append("Skills")
+            lines.extend(rng.sample(SKILL_LINES, k=rng.randint(1, len(SKILL_LINES))))
+            pages.append(lines)
+        corpus.append(build_text_pdf(pages))
+    return corpus
+
+
+def _time_mode(corpus: list[bytes], mode: str, iterations: int, max_pages: int) -> tuple[float, list[str]]:
+    best = float("inf")
+    texts: list[str] = []
+    for _ in range(iterations):
+        started = perf_counter()
+        texts = [
+            extract_text_from_pdf_bytes(
+                pdf_bytes, max_pages=max_pages, max_total_chars=1_000_000, text_mode=mode
+            ).text
+            for pdf_bytes in corpus
+        ]
+        best = min(best, perf_counter() - started)
+    return best, texts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark fast vs layout PDF text extraction")
+    parser.add_argument("--documents", type=int, default=40, help="Synthetic PDFs in the corpus")
+    parser.add_argument("--max-pages", type=int, default=4, help="Upper bound on pages per PDF")
+    parser.add_argument("--iterations", type=int, default=3, help="Timed runs per mode (best is reported)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.documents, args.max_pages, args.seed)
+    layout_seconds, layout_texts = _time_mode(corpus, PDF_TEXT_MODE_LAYOUT, args.iterations, args.max_pages)
+    fast_seconds, fast_texts = _time_mode(corpus, PDF_TEXT_MODE_FAST, args.iterations, args.max_pages)
+
+    identical = sum(layout == fast for layout, fast in zip(layout_texts, fast_texts))
+    similarity = min(
+        Levenshtein.normalized_similarity(layout, fast) for layout, fast in zip(layout_texts, fast_texts)
+    )
+
+    print("[bench_pdf_text_mode] extract_text_from_pdf_bytes")
+    print(f"  documents: {len(corpus)}")
+    print(f"  chars: {sum(len(text) for text in layout_texts)}")
+    print(f"  layout_ms: {layout_seconds * 1000:.1f}")
+    print(f"  fast_ms: {fast_seconds * 1000:.1f}")
+    print(f"  speedup: {layout_seconds / fast_seconds:.2f}x")
+    print(f"  identical_text: {identical}/{len(corpus)}")
+    print(f"  min_similarity: {similarity:.4f}")
+
+
+if __name__ == "__main__":
+    main()
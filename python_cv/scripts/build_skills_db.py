@@ -9,6 +9,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from python_cv.skill_db import (
+    SKILL_DB_SCHEMA_VERSION,
+    build_skill_indexes,
+    serialize_skill_indexes,
+    skills_from_records,
+    snapshot_path_for,
+    write_skill_db_snapshot,
+)
 from python_cv.text_normalize import normalize_token, slugify
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -72,12 +80,12 @@ def _parse_aliases(value: Any) -> list[str]:
     return deduped
 
 
-def _record_search_terms(name: str, slug: str, aliases: list[str], tags: list[str]) -> list[str]:
+def _record_search_terms(name: str, slug: str, aliases: list[str]) -> list[str]:
+    # Hierarchy tags are indexed separately (tag_to_codes) so one category term
+    # cannot fan a fuzzy hit out to thousands of skills.
     terms = {normalize_token(name), normalize_token(slug)}
     for alias in aliases:
         terms.add(normalize_token(alias))
-    for tag in tags:
-        terms.add(normalize_token(tag))
     return sorted(term for term in terms if term)
 
 
@@ -158,9 +166,7 @@ def _build_from_database(database_url: str) -> list[dict[str, Any]]:
     records = []
     for code in sorted(skills.keys()):
         record = skills[code]
-        record["search_terms"] = _record_search_terms(
-            record["name"], record["slug"], record["aliases"], record["tags"]
-        )
+        record["search_terms"] = _record_search_terms(record["name"], record["slug"], record["aliases"])
         records.append(record)
 
     return records
@@ -217,7 +223,7 @@ def _build_from_fallback_file(path: Path) -> list[dict[str, Any]]:
                 "l3_name": l3_name,
                 "status": "active",
                 "tags": [tag for tag in tags if tag],
-                "search_terms": _record_search_terms(name, slug, aliases, [tag for tag in tags if tag]),
+                "search_terms": _record_search_terms(name, slug, aliases),
             }
         )
 
@@ -229,7 +235,11 @@ def _checksum(records: list[dict[str, Any]]) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-def build_skills_db(output_path: Path, source_mode: str | None = None) -> dict[str, Any]:
+def build_skills_db(
+    output_path: Path,
+    source_mode: str | None = None,
+    snapshot_path: Path | None = None,
+) -> dict[str, Any]:
     requested_mode = (source_mode or os.environ.get("PYTHON_CV_SKILLS_SOURCE_MODE") or "auto").lower()
     database_url = os.environ.get("DATABASE_URL")
 
@@ -251,6 +261,7 @@ def build_skills_db(output_path: Path, source_mode: str | None = None) -> dict[s
         resolved_mode = "repo_fallback"
 
     checksum = _checksum(records)
+    skills = skills_from_records(records)
 
     payload = {
         "metadata": {
@@ -258,12 +269,17 @@ def build_skills_db(output_path: Path, source_mode: str | None = None) -> dict[s
             "source_mode": resolved_mode,
             "record_count": len(records),
             "checksum": checksum,
+            "schema_version": SKILL_DB_SCHEMA_VERSION,
         },
         "skills": records,
+        # Token-variant expansion happens here once so runtime loaders skip normalization.
+        "indexes": serialize_skill_indexes(skills, build_skill_indexes(skills)),
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Written after the JSON so its mtime marks it as fresh for load_skill_db.
+    write_skill_db_snapshot(snapshot_path or snapshot_path_for(output_path), payload)
     return payload
 
 
@@ -274,6 +290,11 @@ def main() -> None:
         default=str(OUTPUT_PATH),
         help="Output path for skills_db.json",
     )
+    parser.add_argument(
+        "--snapshot-output",
+        default=None,
+        help="Output path for the binary skills snapshot (defaults to the JSON path with .bin)",
+    )
     parser.add_argument(
         "--source-mode",
         choices=["auto", "db", "repo"],
@@ -283,12 +304,14 @@ def main() -> None:
     args = parser.parse_args()
 
     source_mode = "repo_fallback" if args.source_mode == "repo" else args.source_mode
-    payload = build_skills_db(Path(args.output), source_mode=source_mode)
+    snapshot_output = Path(args.snapshot_output) if args.snapshot_output else snapshot_path_for(Path(args.output))
+    payload = build_skills_db(Path(args.output), source_mode=source_mode, snapshot_path=snapshot_output)
 
     print("[build_skills_db] done")
     print(f"  source_mode: {payload['metadata']['source_mode']}")
     print(f"  record_count: {payload['metadata']['record_count']}")
     print(f"  output: {args.output}")
+    print(f"  snapshot: {snapshot_output}")
 
 
 if __name__ == "__main__":
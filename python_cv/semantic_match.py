@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from collections import Counter
+from collections.abc import Callable, Sequence
+
+NGRAM_SIZES = (3, 4)
+
+# N-grams present in more than this share of terms ("ment", " co") carry almost
+# no signal but dominate posting-list work, so they are left out of the vectors.
+MAX_DOCUMENT_FREQUENCY_RATIO = 0.02
+MIN_STOP_DOCUMENT_FREQUENCY = 200
+
+
+def char_ngrams(term: str) -> Counter[str]:
+    """Space-padded per-token character n-gram counts."""
+
+    grams: Counter[str] = Counter()
+    for token in term.split():
+        padded = f" {token} "
+        for size in NGRAM_SIZES:
+            for start in range(len(padded) - size + 1):
+                grams[padded[start : start + size]] += 1
+    return grams
+
+
+class SemanticTermIndex:
+    """TF-IDF character n-gram vectors for taxonomy terms, searched by cosine similarity.
+
+    Vectors are L2-normalized and stored as an inverted index in flat arrays:
+    n-gram ``g`` (found via ``gram_position``) has weight ``idf[g]`` and owns
+    ``positions``/``weights`` entries ``offsets[g]:offsets[g + 1]``. The arrays
+    are what snapshots store, so a loaded index is zero-copy. Pure Python and
+    CPU-only; no embedding service involved.
+    """
+
+    __slots__ = ("gram_position", "idf", "offsets", "positions", "weights")
+
+    def __init__(
+        self,
+        gram_position: Callable[[str], int],
+        idf: Sequence[float],
+        offsets: Sequence[int],
+        positions: Sequence[int],
+        weights: Sequence[float],
+    ) -> None:
+        self.gram_position = gram_position
+        self.idf = idf
+        self.offsets = offsets
+        self.positions = positions
+        self.weights = weights
+
+    @classmethod
+    def build(cls, terms: Sequence[str]) -> SemanticTermIndex:
+        grams, idf, offsets, positions, weights = build_semantic_tables(terms)
+        gram_ids = {gram: gram_id for gram_id, gram in enumerate(grams)}
+        return cls(lambda gram: gram_ids.get(gram, -1), idf, offsets, positions, weights)
+
+    def search(self, query: str, *, limit: int, min_score: float) -> list[tuple[int, float]]:
+        """Top ``limit`` (term position, cosine) pairs scoring at least ``min_score``."""
+
+        counts: dict[int, int] = {}
+        for gram, count in char_ngrams(query).items():
+            gram_id = self.gram_position(gram)
+            if gram_id >= 0:
+                counts[gram_id] = count
+        vector = _weigh(counts, self.idf)
+        if not vector:
+            return []
+
+        offsets = self.offsets
+        scores: dict[int, float] = {}
+        for gram_id, query_weight in vector.items():
+            start, end = offsets[gram_id], offsets[gram_id + 1]
+            for position, weight in zip(self.positions[start:end], self.weights[start:end]):
+                scores[position] = scores.get(position, 0.0) + query_weight * weight
+
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(position, score) for position, score in ranked if score >= min_score]
+
+
+def build_semantic_tables(terms: Sequence[str]) -> tuple[list[str], array, array, array, array]:
+    """``(grams, idf, offsets, positions, weights)`` for ``terms``, grams in UTF-8 byte order.
+
+    The byte order matches snapshot index keys, so a snapshot can store the
+    grams as an index and the other tables as sections aligned with it.
+    """
+
+    term_grams = [char_ngrams(term) for term in terms]
+    document_frequency: Counter[str] = Counter()
+    for term_counts in term_grams:
+        document_frequency.update(term_counts.keys())
+
+    total = len(term_grams)
+    max_df = max(MIN_STOP_DOCUMENT_FREQUENCY, int(total * MAX_DOCUMENT_FREQUENCY_RATIO))
+    grams = sorted(
+        (gram for gram, df in document_frequency.items() if df <= max_df),
+        key=lambda gram: gram.encode("utf-8"),
+    )
+    gram_ids = {gram: gram_id for gram_id, gram in enumerate(grams)}
+    idf = array("d", (math.log((1 + total) / (1 + document_frequency[gram])) + 1.0 for gram in grams))
+
+    gram_postings: list[list[tuple[int, float]]] = [[] for _ in grams]
+    for position, term_counts in enumerate(term_grams):
+        counts = {gram_ids[gram]: count for gram, count in term_counts.items() if gram in gram_ids}
+        for gram_id, weight in _weigh(counts, idf).items():
+            gram_postings[gram_id].append((position, weight))
+
+    offsets = array("I", [0])
+    positions = array("I")
+    weights = array("f")
+    for postings in gram_postings:
+        for position, weight in postings:
+            positions.append(position)
+            weights.append(weight)
+        offsets.append(len(positions))
+    return grams, idf, offsets, positions, weights
+
+
+def _weigh(counts: dict[int, int], idf: Sequence[float]) -> dict[int, float]:
+    vector = {gram_id: (1.0 + math.log(count)) * idf[gram_id] for gram_id, count in counts.items()}
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if norm == 0.0:
+        return {}
+    return {gram_id: weight / norm for gram_id, weight in vector.items()}
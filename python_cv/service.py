@@ -6,9 +6,16 @@ from python_cv.contracts import (
     PYTHON_INTERNAL_CONTRACT_VERSION,
     PYTHON_INTERNAL_SERVICE_NAME,
 )
-from python_cv.skill_candidate_extract import extract_skill_candidates
-from python_cv.skill_db import SkillDb
-from python_cv.skill_matcher import MatchedCandidate, match_skill_candidates
+from python_cv.document_view import DocumentView
+from python_cv.skill_candidate_extract import CandidateSeed, extract_skill_candidates
+from python_cv.skill_db import SkillDb, skill_db_checksum
+from python_cv.skill_matcher import (
+    MatchedCandidate,
+    SemanticUsage,
+    match_document_candidates,
+    match_skill_candidates,
+    suggestion_cache,
+)
 
 
 @dataclass(frozen=True)
@@ -48,11 +55,17 @@ def _serialize_candidate(candidate: MatchedCandidate) -> dict[str, object]:
     }
 
 
-def _metadata(limits: ImportLimits, unmapped_count: int) -> dict[str, object]:
+def _metadata(
+    limits: ImportLimits,
+    unmapped_count: int,
+    checksum: str | None,
+    semantic_usage: SemanticUsage,
+) -> dict[str, object]:
     return {
-        "semantic_used": False,
-        "semantic_fallback_triggered": False,
+        "semantic_used": semantic_usage.used,
+        "semantic_fallback_triggered": semantic_usage.fallback_triggered,
         "unmapped_candidates_count": unmapped_count,
+        "skill_db_checksum": checksum,
         "service": PYTHON_INTERNAL_SERVICE_NAME,
         "contract_version": PYTHON_INTERNAL_CONTRACT_VERSION,
         "limits": {
@@ -81,6 +94,24 @@ def validate_total_chars(total_chars: int, limits: ImportLimits) -> None:
         raise ValueError(f"Total payload too large. Maximum is {limits.max_total_chars} characters.")
 
 
+def warm_document_suggestions(text: str, skill_db: SkillDb, *, suggestions_limit: int | None) -> None:
+    """Match one document's candidates ahead of ``process_skill_documents``.
+
+    Used while the rest of an upload is still arriving: the suggestions land in
+    the shared suggestion cache, so the request-wide pass later serves them as
+    hits. Skipped when they could not be cached (no checksum or cache disabled).
+    """
+
+    if suggestion_cache.max_entries <= 0 or not skill_db_checksum(skill_db):
+        return
+    candidates = extract_skill_candidates(
+        DocumentView(text),
+        taxonomy=skill_db.columns.taxonomy_automaton(),
+        vocabulary=skill_db.columns.term_vocabulary(),
+    )
+    match_skill_candidates(candidates, skill_db, suggestions_limit=_clamp_suggestions_limit(suggestions_limit))
+
+
 def process_skill_documents(
     documents: list[dict[str, str]],
     skill_db: SkillDb,
@@ -94,15 +125,30 @@ def process_skill_documents(
     output_documents: list[dict[str, object]] = []
     unmapped = 0
     suggestion_limit = _clamp_suggestions_limit(suggestions_limit)
+    semantic_usage = SemanticUsage()
 
+    taxonomy = skill_db.columns.taxonomy_automaton()
+    vocabulary = skill_db.columns.term_vocabulary()
+    extracted: list[tuple[dict[str, str], DocumentView, list[CandidateSeed]]] = []
     for source in documents:
         document_text = validate_text_limits(source.get("text", ""), limits)
         total_chars += len(document_text)
         validate_total_chars(total_chars, limits)
-
-        candidates = extract_skill_candidates(document_text)
-        matched = match_skill_candidates(candidates, skill_db, suggestions_limit=suggestion_limit)
-
+        # One view per document, so line splitting and section detection run once
+        # for every extractor that reads it (skills and entities alike).
+        view = DocumentView(document_text)
+        candidates = extract_skill_candidates(view, taxonomy=taxonomy, vocabulary=vocabulary)
+        extracted.append((source, view, candidates))
+
+    # Candidates shared across documents are matched once for the whole request.
+    matched_documents = match_document_candidates(
+        [candidates for _, _, candidates in extracted],
+        skill_db,
+        suggestions_limit=suggestion_limit,
+        semantic_usage=semantic_usage,
+    )
+
+    for (source, view, _), matched in zip(extracted, matched_documents):
         unmapped += sum(1 for item in matched if item.unmapped_candidate)
 
         output_documents.append(
@@ -110,7 +156,7 @@ def process_skill_documents(
                 "document_id": source["document_id"],
                 "file_name": source["file_name"],
                 "context": source.get("context", "cv"),
-                "parsed_text": document_text,
+                "parsed_text": view.text,
                 "parse_error": source.get("parse_error"),
                 "parse_error_code": source.get("parse_error_code"),
                 "candidate_count": len(matched),
@@ -120,5 +166,5 @@ def process_skill_documents(
 
     return {
         "documents": output_documents,
-        "metadata": _metadata(limits, unmapped),
+        "metadata": _metadata(limits, unmapped, skill_db_checksum(skill_db), semantic_usage),
     }
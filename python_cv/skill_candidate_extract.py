@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from collections.abc import Container, Iterator
 from dataclasses import dataclass
 
-from python_cv.text_normalize import normalize_token, normalize_whitespace
+from python_cv.document_view import DocumentView, as_document_view
+from python_cv.taxonomy_scanner import TaxonomyAutomaton
+from python_cv.text_normalize import expand_token_variants, normalize_token, normalize_whitespace
 
 MAX_CANDIDATES = 40
 MAX_CANDIDATE_LENGTH = 80
 MAX_TOKENS = 8
 
+SECTION_PART_CONFIDENCE = 0.82
+SECTION_NGRAM_CONFIDENCE = 0.58
+
+# Whole-document taxonomy hits outside a skills section; repeated mentions add
+# a little confidence but stay below terms listed under a skills heading.
+TAXONOMY_HIT_CONFIDENCE = 0.66
+TAXONOMY_REPEAT_BONUS = 0.04
+TAXONOMY_MAX_CONFIDENCE = 0.78
+
 SKILLS_HEADING_RE = re.compile(
     r"\b(skills?|technologies|tooling|competencies|technical skills|core skills|stack|languages)\b",
     re.IGNORECASE,
@@ -112,8 +125,7 @@ class CandidateSeed:
     category: str
 
 
-def _is_valid_candidate(value: str) -> bool:
-    normalized = normalize_token(value)
+def _is_valid_candidate(normalized: str) -> bool:
     if not normalized:
         return False
     if len(normalized) > MAX_CANDIDATE_LENGTH:
@@ -131,9 +143,7 @@ def _is_valid_candidate(value: str) -> bool:
     return True
 
 
-def _infer_category(value: str) -> str:
-    normalized = normalize_token(value)
-
+def _infer_category(normalized: str) -> str:
     if normalized in LANGUAGE_KEYWORDS:
         return "languages"
 
@@ -167,12 +177,14 @@ def _split_candidate_line(line: str) -> list[str]:
     return [segment for segment in SPLIT_RE.split(trimmed) if segment]
 
 
-def _extract_skill_section_lines(lines: list[str]) -> list[str]:
-    section_lines: list[str] = []
+def _extract_skill_section_lines(lines: list[str]) -> list[int]:
+    """Indices of the lines under skills headings; ``lines`` are whitespace-normalized."""
+
+    section_indices: list[int] = []
 
     idx = 0
     while idx < len(lines):
-        line = normalize_whitespace(lines[idx])
+        line = lines[idx]
         if not line:
             idx += 1
             continue
@@ -180,11 +192,10 @@ def _extract_skill_section_lines(lines: list[str]) -> list[str]:
         if SKILLS_HEADING_RE.search(line):
             idx += 1
             while idx < len(lines):
-                candidate = normalize_whitespace(lines[idx])
+                candidate = lines[idx]
                 if not candidate:
-                    if section_lines and idx + 1 < len(lines):
-                        peek = normalize_whitespace(lines[idx + 1])
-                        if SECTION_HEADING_RE.match(peek):
+                    if section_indices and idx + 1 < len(lines):
+                        if SECTION_HEADING_RE.match(lines[idx + 1]):
                             break
                     idx += 1
                     continue
@@ -192,47 +203,101 @@ def _extract_skill_section_lines(lines: list[str]) -> list[str]:
                 if SECTION_HEADING_RE.match(candidate) and not SKILLS_HEADING_RE.search(candidate):
                     break
 
-                section_lines.append(candidate)
+                section_indices.append(idx)
                 idx += 1
             continue
 
         idx += 1
 
-    return section_lines
+    return section_indices
+
+
+def _in_vocabulary(token: str, vocabulary: Container[str]) -> bool:
+    # The matcher resolves "py" or "k8s" through their expansions, so the gate must too.
+    return token in vocabulary or any(
+        all(part in vocabulary for part in variant.split()) for variant in expand_token_variants(token)
+    )
+
 
+def _extract_ngrams_from_line(normalized_line: str, vocabulary: Container[str] | None = None) -> Iterator[str]:
+    """1-4-grams of non-stopword tokens; with a ``vocabulary``, only runs of known tokens.
 
-def _extract_ngrams_from_line(line: str) -> list[str]:
-    tokens = [token for token in normalize_token(line).split() if token and token not in STOPWORDS]
-    ngrams: list[str] = []
-    for size in range(1, min(4, len(tokens)) + 1):
-        for start in range(0, len(tokens) - size + 1):
+    An n-gram containing a token that neither itself nor through its variants
+    appears in any taxonomy term cannot match exactly and is far below the
+    fuzzy thresholds as a whole, so it is not worth a lookup.
+    """
+
+    tokens = [token for token in normalized_line.split() if token and token not in STOPWORDS]
+    for start in range(len(tokens)):
+        for size in range(1, min(4, len(tokens) - start) + 1):
+            if vocabulary is not None and not _in_vocabulary(tokens[start + size - 1], vocabulary):
+                break
             ngram = " ".join(tokens[start : start + size])
             if len(ngram) >= 2:
-                ngrams.append(ngram)
-    return ngrams
+                yield ngram
 
 
-def extract_skill_candidates(text: str, max_candidates: int = MAX_CANDIDATES) -> list[CandidateSeed]:
-    lines = [normalize_whitespace(line) for line in text.replace("\r", "\n").split("\n")]
-    lines = [line for line in lines if line]
+def _iter_section_candidates(
+    lines: list[str],
+    normalized_lines: list[str],
+    section_indices: list[int],
+    vocabulary: Container[str] | None,
+) -> Iterator[tuple[str, str, float]]:
+    """(value, evidence, confidence) for skills-section lines: listed parts first, then n-grams."""
 
-    section_lines = _extract_skill_section_lines(lines)
+    for idx in section_indices:
+        line = lines[idx]
+        for part in _split_candidate_line(line):
+            yield part, line, SECTION_PART_CONFIDENCE
+
+    for idx in section_indices:
+        for ngram in _extract_ngrams_from_line(normalized_lines[idx], vocabulary):
+            yield ngram, lines[idx], SECTION_NGRAM_CONFIDENCE
+
+
+def _taxonomy_hits(view: DocumentView, taxonomy: TaxonomyAutomaton) -> list[tuple[str, str, int]]:
+    """(term, first evidence line, mention count) per taxonomy term, in first-seen order."""
+
+    lines = view.content_lines
+    normalized_lines = view.normalized_content_lines
+    line_starts: list[int] = []
+    offset = 0
+    for normalized in normalized_lines:
+        line_starts.append(offset)
+        offset += len(normalized) + 1
+
+    found: dict[str, tuple[str, int]] = {}
+    for hit in taxonomy.scan("\n".join(normalized_lines)):
+        evidence, count = found.get(hit.term, (lines[bisect_right(line_starts, hit.start) - 1], 0))
+        found[hit.term] = (evidence, count + 1)
+    return [(term, evidence, count) for term, (evidence, count) in found.items()]
+
+
+def extract_skill_candidates(
+    document: str | DocumentView,
+    max_candidates: int = MAX_CANDIDATES,
+    *,
+    taxonomy: TaxonomyAutomaton | None = None,
+    vocabulary: Container[str] | None = None,
+) -> list[CandidateSeed]:
+    view = as_document_view(document)
+    lines = view.content_lines
+    normalized_lines = view.normalized_content_lines
+
+    section_indices = _extract_skill_section_lines(lines)
     candidate_map: dict[str, CandidateSeed] = {}
 
     def add_candidate(raw_value: str, evidence: str, confidence: float) -> None:
         value = normalize_whitespace(raw_value)
-        if not _is_valid_candidate(value):
-            return
-
         normalized = normalize_token(value)
-        if not normalized:
+        if not _is_valid_candidate(normalized):
             return
 
         evidence_snippet = normalize_whitespace(evidence)[:240]
         if not evidence_snippet:
             return
 
-        category = _infer_category(value)
+        category = _infer_category(normalized)
 
         existing = candidate_map.get(normalized)
         if existing is None or confidence > existing.confidence:
@@ -243,18 +308,26 @@ def extract_skill_candidates(text: str, max_candidates: int = MAX_CANDIDATES) ->
                 category=category,
             )
 
-    for line in section_lines:
-        for part in _split_candidate_line(line):
-            add_candidate(part, line, 0.82)
-
-        for ngram in _extract_ngrams_from_line(line):
-            add_candidate(ngram, line, 0.58)
+    listed = 0
+    for value, evidence, confidence in _iter_section_candidates(lines, normalized_lines, section_indices, vocabulary):
+        if confidence >= SECTION_PART_CONFIDENCE:
+            add_candidate(value, evidence, confidence)
+            listed = len(candidate_map)
+        elif listed >= max_candidates:
+            # A full page of listed skills already outranks every n-gram.
+            break
+        else:
+            add_candidate(value, evidence, confidence)
+
+    if not candidate_map and taxonomy is not None:
+        for term, evidence, count in _taxonomy_hits(view, taxonomy):
+            confidence = TAXONOMY_HIT_CONFIDENCE + TAXONOMY_REPEAT_BONUS * (count - 1)
+            add_candidate(term, evidence, round(min(confidence, TAXONOMY_MAX_CONFIDENCE), 3))
 
     if not candidate_map:
-        for line in lines:
+        for line, normalized_line in zip(lines, normalized_lines):
             if len(line.split()) > 14:
                 continue
-            normalized_line = normalize_token(line)
             if not any(keyword in normalized_line for keyword in FALLBACK_SCAN_KEYWORDS):
                 continue
             for part in _split_candidate_line(line):
@@ -2,14 +2,40 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from python_cv.skill_db_shm import (
+    SharedSnapshotUnavailableError,
+    open_shared_snapshot,
+    shared_memory_enabled,
+)
+from python_cv.skill_db_snapshot import (
+    SNAPSHOT_SUFFIX,
+    SkillDbSnapshot,
+    SnapshotBuilder,
+    SnapshotFormatError,
+    is_snapshot_file,
+)
+from python_cv.semantic_match import SemanticTermIndex, build_semantic_tables
+from python_cv.taxonomy_scanner import TaxonomyAutomaton
+from python_cv.term_trigrams import TermTrigramIndex
 from python_cv.text_normalize import expand_token_variants, normalize_token
+from python_cv.typo_index import DeletionIndex
 
 DEFAULT_DB_PATH = Path(__file__).resolve().parent / "data" / "skills_db.json"
 
+# v1 payloads carry records only; v2 adds the prebuilt ``indexes`` section; v3
+# moves hierarchy tags out of ``term_to_codes`` into their own ``tag_to_codes``.
+SKILL_DB_SCHEMA_VERSION = 3
+
+# Tags shorter than this (the L1 letters) are too ambiguous to index at all.
+MIN_TAG_TERM_LENGTH = 3
+
 
 class SkillDbUnavailableError(Exception):
     pass
@@ -32,15 +58,338 @@ class SkillRecord:
     search_terms: tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class SkillIndexes:
+    """Record-ordinal indexes shared by the JSON loader and the snapshot writer."""
+
+    by_name: dict[str, list[int]]
+    by_alias: dict[str, list[int]]
+    term_to_ordinals: dict[str, list[int]]
+    tag_to_ordinals: dict[str, list[int]] = field(default_factory=dict)
+
+
+Postings = Mapping[str, Sequence[int]]
+
+_NULL_INT = -1
+
+
+def _optional_int(value: int) -> int | None:
+    return None if value == _NULL_INT else value
+
+
+class SkillColumns:
+    """Parallel per-skill columns addressed by a dense ordinal.
+
+    Indexes map terms to ``array('I')`` (or snapshot-backed) ordinal posting
+    lists, so matching reads codes and names straight from the columns and
+    ``SkillRecord`` objects are only built when a caller asks for one.
+    """
+
+    __slots__ = (
+        "codes",
+        "names",
+        "slugs",
+        "statuses",
+        "l1_codes",
+        "l2_codes",
+        "l3_names",
+        "cat_ids",
+        "subcat_ids",
+        "l3_ids",
+        "aliases",
+        "tags",
+        "search_terms",
+        "by_code",
+        "by_name",
+        "by_alias",
+        "term_to_ordinals",
+        "tag_to_ordinals",
+        "term_choices",
+        "_term_trigrams",
+        "_semantic_index",
+        "_typo_index",
+        "_taxonomy_automaton",
+        "_taxonomy_automaton_loader",
+        "_term_vocabulary",
+        "_term_vocabulary_tokens",
+    )
+
+    def __init__(
+        self,
+        *,
+        codes: Sequence[str],
+        names: Sequence[str],
+        slugs: Sequence[str],
+        statuses: Sequence[str],
+        l1_codes: Sequence[str],
+        l2_codes: Sequence[str],
+        l3_names: Sequence[str],
+        cat_ids: Sequence[int],
+        subcat_ids: Sequence[int],
+        l3_ids: Sequence[int],
+        aliases: Sequence[tuple[str, ...]],
+        tags: Sequence[tuple[str, ...]],
+        search_terms: Sequence[tuple[str, ...]],
+        by_code: Postings,
+        by_name: Postings,
+        by_alias: Postings,
+        term_to_ordinals: Postings,
+        tag_to_ordinals: Postings,
+        term_choices: Sequence[str],
+        term_trigrams: TermTrigramIndex | None = None,
+        typo_index: DeletionIndex | None = None,
+        semantic_index: SemanticTermIndex | None = None,
+        taxonomy_automaton_loader: Callable[[], TaxonomyAutomaton] | None = None,
+        term_vocabulary_tokens: Sequence[str] | None = None,
+    ) -> None:
+        self.codes = codes
+        self.names = names
+        self.slugs = slugs
+        self.statuses = statuses
+        self.l1_codes = l1_codes
+        self.l2_codes = l2_codes
+        self.l3_names = l3_names
+        self.cat_ids = cat_ids
+        self.subcat_ids = subcat_ids
+        self.l3_ids = l3_ids
+        self.aliases = aliases
+        self.tags = tags
+        self.search_terms = search_terms
+        self.by_code = by_code
+        self.by_name = by_name
+        self.by_alias = by_alias
+        self.term_to_ordinals = term_to_ordinals
+        self.tag_to_ordinals = tag_to_ordinals
+        self.term_choices = term_choices
+        self._term_trigrams = term_trigrams
+        self._semantic_index = semantic_index
+        self._typo_index = typo_index
+        self._taxonomy_automaton: TaxonomyAutomaton | None = None
+        self._taxonomy_automaton_loader = taxonomy_automaton_loader
+        self._term_vocabulary: frozenset[str] | None = None
+        self._term_vocabulary_tokens = term_vocabulary_tokens
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def record(self, ordinal: int) -> SkillRecord:
+        return SkillRecord(
+            code=self.codes[ordinal],
+            name=self.names[ordinal],
+            aliases=self.aliases[ordinal],
+            slug=self.slugs[ordinal],
+            cat_id=_optional_int(self.cat_ids[ordinal]),
+            subcat_id=_optional_int(self.subcat_ids[ordinal]),
+            l3_id=_optional_int(self.l3_ids[ordinal]),
+            l1_code=self.l1_codes[ordinal] or None,
+            l2_code=self.l2_codes[ordinal] or None,
+            l3_name=self.l3_names[ordinal] or None,
+            status=self.statuses[ordinal],
+            tags=self.tags[ordinal],
+            search_terms=self.search_terms[ordinal],
+        )
+
+    def term_trigrams(self) -> TermTrigramIndex:
+        """Trigram prefilter over ``term_choices``; snapshots ship it, JSON loads build it once."""
+
+        if self._term_trigrams is None:
+            self._term_trigrams = TermTrigramIndex.build(tuple(self.term_choices))
+        return self._term_trigrams
+
+    def semantic_index(self) -> SemanticTermIndex:
+        """TF-IDF char n-gram vectors over ``term_choices``; snapshots ship them, JSON loads build them once."""
+
+        if self._semantic_index is None:
+            self._semantic_index = SemanticTermIndex.build(tuple(self.term_choices))
+        return self._semantic_index
+
+    def semantic_index_if_built(self) -> SemanticTermIndex | None:
+        """The semantic index if a snapshot shipped it or warmup built it, else ``None``.
+
+        Building takes seconds on a full taxonomy, so request paths never do it.
+        """
+
+        return self._semantic_index
+
+    def typo_index(self) -> DeletionIndex:
+        """Symmetric-delete index over single-token normalized names and aliases; snapshots ship it."""
+
+        if self._typo_index is None:
+            self._typo_index = DeletionIndex.build([*self.by_name, *self.by_alias])
+        return self._typo_index
+
+    def taxonomy_automaton(self) -> TaxonomyAutomaton:
+        """Aho-Corasick automaton over normalized names and aliases; snapshots ship its tables."""
+
+        if self._taxonomy_automaton is None:
+            if self._taxonomy_automaton_loader is not None:
+                self._taxonomy_automaton = self._taxonomy_automaton_loader()
+            else:
+                self._taxonomy_automaton = TaxonomyAutomaton.build([*self.by_name, *self.by_alias])
+        return self._taxonomy_automaton
+
+    def term_vocabulary(self) -> frozenset[str]:
+        """Every token used by a search term, name, alias or tag; gates candidate n-grams."""
+
+        if self._term_vocabulary is None:
+            if self._term_vocabulary_tokens is not None:
+                self._term_vocabulary = frozenset(self._term_vocabulary_tokens)
+            else:
+                self._term_vocabulary = _term_vocabulary(
+                    (*self.term_choices, *self.by_name, *self.by_alias, *self.tag_to_ordinals)
+                )
+        return self._term_vocabulary
+
+    def build_derived_indexes(self) -> None:
+        """Build the lazily derived indexes now, e.g. before a SkillDb starts serving."""
+
+        self.term_trigrams()
+        self.semantic_index()
+        self.typo_index()
+        self.taxonomy_automaton()
+        self.term_vocabulary()
+
+    @classmethod
+    def from_records(
+        cls,
+        skills: Sequence[SkillRecord],
+        indexes: SkillIndexes,
+        *,
+        term_choices: Sequence[str] | None = None,
+    ) -> SkillColumns:
+        def ints(values: Iterator[int | None]) -> array:
+            return array("i", (_NULL_INT if value is None else value for value in values))
+
+        def postings(source: Mapping[str, Sequence[int]]) -> dict[str, array]:
+            return {key: array("I", ordinals) for key, ordinals in source.items()}
+
+        return cls(
+            codes=[skill.code for skill in skills],
+            names=[skill.name for skill in skills],
+            slugs=[skill.slug for skill in skills],
+            statuses=[skill.status for skill in skills],
+            l1_codes=[skill.l1_code or "" for skill in skills],
+            l2_codes=[skill.l2_code or "" for skill in skills],
+            l3_names=[skill.l3_name or "" for skill in skills],
+            cat_ids=ints(skill.cat_id for skill in skills),
+            subcat_ids=ints(skill.subcat_id for skill in skills),
+            l3_ids=ints(skill.l3_id for skill in skills),
+            aliases=[skill.aliases for skill in skills],
+            tags=[skill.tags for skill in skills],
+            search_terms=[skill.search_terms for skill in skills],
+            by_code={skill.code: array("I", (ordinal,)) for ordinal, skill in enumerate(skills)},
+            by_name=postings(indexes.by_name),
+            by_alias=postings(indexes.by_alias),
+            term_to_ordinals=postings(indexes.term_to_ordinals),
+            tag_to_ordinals=postings(indexes.tag_to_ordinals),
+            term_choices=(
+                tuple(indexes.term_to_ordinals) if term_choices is None else term_choices
+            ),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: SkillDbSnapshot) -> SkillColumns:
+        term_to_ordinals = snapshot.index("term_to_codes")
+        term_trigrams = None
+        if snapshot.has_section("term_trigram_counts"):
+            term_trigrams = TermTrigramIndex(
+                snapshot.index("term_trigrams"), snapshot.section("term_trigram_counts")
+            )
+        semantic_index = None
+        if snapshot.has_section("semantic_weights"):
+            semantic_grams = snapshot.index("semantic_postings")
+            semantic_index = SemanticTermIndex(
+                semantic_grams.position,
+                snapshot.section("semantic_idf"),
+                snapshot.section("semantic_postings.postings.offsets"),
+                snapshot.section("semantic_postings.postings"),
+                snapshot.section("semantic_weights"),
+            )
+        typo_index = None
+        if snapshot.has_section("typo_keys.offsets"):
+            typo_index = DeletionIndex(snapshot.strings("typo_keys"), snapshot.index("typo_deletes"))
+        term_vocabulary_tokens = None
+        if snapshot.has_section("term_vocabulary.offsets"):
+            term_vocabulary_tokens = snapshot.strings("term_vocabulary")
+        taxonomy_automaton_loader = None
+        if snapshot.has_section("automaton_fail"):
+            taxonomy_automaton_loader = partial(_automaton_from_snapshot, snapshot)
+        return cls(
+            codes=snapshot.strings("code"),
+            names=snapshot.strings("name"),
+            slugs=snapshot.strings("slug"),
+            statuses=snapshot.strings("status"),
+            l1_codes=snapshot.strings("l1_code"),
+            l2_codes=snapshot.strings("l2_code"),
+            l3_names=snapshot.strings("l3_name"),
+            cat_ids=snapshot.section("cat_id"),
+            subcat_ids=snapshot.section("subcat_id"),
+            l3_ids=snapshot.section("l3_id"),
+            aliases=snapshot.string_lists("aliases"),
+            tags=snapshot.string_lists("tags"),
+            search_terms=snapshot.string_lists("search_terms"),
+            by_code=snapshot.index("by_code"),
+            by_name=snapshot.index("by_name"),
+            by_alias=snapshot.index("by_alias"),
+            term_to_ordinals=term_to_ordinals,
+            # Missing in pre-v3 snapshots, whose term_to_codes still holds tag terms;
+            # the resulting SnapshotFormatError sends the loader back to the JSON.
+            tag_to_ordinals=snapshot.index("tag_to_codes"),
+            term_choices=_LazyTermChoices(term_to_ordinals),
+            term_trigrams=term_trigrams,
+            typo_index=typo_index,
+            semantic_index=semantic_index,
+            taxonomy_automaton_loader=taxonomy_automaton_loader,
+            term_vocabulary_tokens=term_vocabulary_tokens,
+        )
+
+
+def _term_vocabulary(terms: Iterable[str]) -> frozenset[str]:
+    return frozenset(token for term in terms for token in term.split())
+
+
+def _automaton_from_snapshot(snapshot: SkillDbSnapshot) -> TaxonomyAutomaton:
+    return TaxonomyAutomaton.from_tables(
+        zip(
+            snapshot.section("automaton_edge_parents"),
+            snapshot.strings("automaton_edge_tokens"),
+            snapshot.section("automaton_edge_children"),
+        ),
+        snapshot.section("automaton_fail"),
+        snapshot.section("automaton_output"),
+        snapshot.section("automaton_depth"),
+        zip(snapshot.section("automaton_term_nodes"), snapshot.strings("automaton_terms")),
+    )
+
+
 @dataclass(frozen=True)
 class SkillDb:
     metadata: dict[str, Any]
-    skills: tuple[SkillRecord, ...]
-    by_code: dict[str, SkillRecord]
-    by_name: dict[str, tuple[SkillRecord, ...]]
-    by_alias: dict[str, tuple[SkillRecord, ...]]
-    term_to_codes: dict[str, tuple[str, ...]]
-    term_choices: tuple[str, ...]
+    skills: Sequence[SkillRecord]
+    by_code: Mapping[str, SkillRecord]
+    by_name: Mapping[str, tuple[SkillRecord, ...]]
+    by_alias: Mapping[str, tuple[SkillRecord, ...]]
+    term_to_codes: Mapping[str, tuple[str, ...]]
+    term_choices: Sequence[str]
+    columns: SkillColumns = field(default=None, compare=False, repr=False)  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        # Hand-assembled record DBs (tests, tooling) get their columns derived once here.
+        if self.columns is None:
+            object.__setattr__(self, "columns", _columns_from_record_fields(self))
+
+    @classmethod
+    def from_columns(cls, metadata: dict[str, Any], columns: SkillColumns) -> SkillDb:
+        return cls(
+            metadata=metadata,
+            skills=_ColumnRecords(columns),
+            by_code=_PostingView(columns.by_code, partial(_first_record, columns)),
+            by_name=_PostingView(columns.by_name, partial(_records, columns)),
+            by_alias=_PostingView(columns.by_alias, partial(_records, columns)),
+            term_to_codes=_PostingView(columns.term_to_ordinals, partial(_codes, columns)),
+            term_choices=columns.term_choices,
+            columns=columns,
+        )
 
 
 _cached_skill_db: SkillDb | None = None
@@ -90,62 +439,352 @@ def _build_skill(record: dict[str, Any]) -> SkillRecord:
     )
 
 
-def load_skill_db(force_reload: bool = False) -> SkillDb:
-    global _cached_skill_db
+def skills_from_records(records: list[Any]) -> tuple[SkillRecord, ...]:
+    skills = tuple(_build_skill(record) for record in records if isinstance(record, dict))
+    return tuple(skill for skill in skills if skill.code and skill.name)
+
+
+def _code_ordered_postings(
+    skills: Sequence[SkillRecord], postings: dict[str, set[int]]
+) -> dict[str, list[int]]:
+    # One ordinal per code, ordered by code, mirrors the historical sorted code tuples.
+    ordered: dict[str, list[int]] = {}
+    for key, ordinals in postings.items():
+        if not key or not ordinals:
+            continue
+        by_code = {skills[ordinal].code: ordinal for ordinal in sorted(ordinals)}
+        ordered[key] = [by_code[code] for code in sorted(by_code)]
+    return ordered
+
+
+def build_tag_index(skills: Sequence[SkillRecord]) -> dict[str, list[int]]:
+    tag_to_ordinals: dict[str, set[int]] = {}
+    for ordinal, skill in enumerate(skills):
+        for tag in skill.tags:
+            for normalized_tag in expand_token_variants(tag):
+                if len(normalized_tag) >= MIN_TAG_TERM_LENGTH:
+                    tag_to_ordinals.setdefault(normalized_tag, set()).add(ordinal)
+    return _code_ordered_postings(skills, tag_to_ordinals)
+
+
+def build_skill_indexes(skills: Sequence[SkillRecord]) -> SkillIndexes:
+    by_name: dict[str, list[int]] = {}
+    by_alias: dict[str, list[int]] = {}
+    term_to_ordinals: dict[str, set[int]] = {}
+
+    for ordinal, skill in enumerate(skills):
+        own_terms: set[str] = set()
+        for normalized_name in expand_token_variants(skill.name):
+            by_name.setdefault(normalized_name, []).append(ordinal)
+            term_to_ordinals.setdefault(normalized_name, set()).add(ordinal)
+            own_terms.add(normalized_name)
 
-    if _cached_skill_db and not force_reload:
-        return _cached_skill_db
+        for alias in skill.aliases:
+            for normalized_alias in expand_token_variants(alias):
+                by_alias.setdefault(normalized_alias, []).append(ordinal)
+                term_to_ordinals.setdefault(normalized_alias, set()).add(ordinal)
+                own_terms.add(normalized_alias)
 
-    configured_path = os.environ.get("PYTHON_CV_SKILLS_DB_PATH")
-    db_path = Path(configured_path) if configured_path else DEFAULT_DB_PATH
+        # Older builds copied hierarchy tags into search_terms; those belong to the tag index.
+        tag_terms = {normalize_token(tag) for tag in skill.tags} - own_terms
+        for term in skill.search_terms:
+            if normalize_token(term) in tag_terms:
+                continue
+            for normalized_term in expand_token_variants(term):
+                term_to_ordinals.setdefault(normalized_term, set()).add(ordinal)
 
-    if not db_path.exists():
-        raise SkillDbUnavailableError(f"skills_db.json not found at {db_path}")
+    return SkillIndexes(
+        by_name=by_name,
+        by_alias=by_alias,
+        term_to_ordinals=_code_ordered_postings(skills, term_to_ordinals),
+        tag_to_ordinals=build_tag_index(skills),
+    )
+
+
+def serialize_skill_indexes(
+    skills: Sequence[SkillRecord], indexes: SkillIndexes
+) -> dict[str, dict[str, list[str]]]:
+    def as_codes(postings: dict[str, list[int]]) -> dict[str, list[str]]:
+        return {key: [skills[ordinal].code for ordinal in ordinals] for key, ordinals in postings.items()}
+
+    return {
+        "by_name": as_codes(indexes.by_name),
+        "by_alias": as_codes(indexes.by_alias),
+        "term_to_codes": as_codes(indexes.term_to_ordinals),
+        "tag_to_codes": as_codes(indexes.tag_to_ordinals),
+    }
+
+
+def _schema_version(payload: dict[str, Any]) -> int:
+    metadata = payload.get("metadata")
+    if not isinstance(metadata, dict):
+        return 1
+    return _as_int(metadata.get("schema_version")) or 1
+
+
+def _indexes_from_payload(payload: dict[str, Any], skills: Sequence[SkillRecord]) -> SkillIndexes | None:
+    if _schema_version(payload) < SKILL_DB_SCHEMA_VERSION:
+        return None
+
+    raw_indexes = payload.get("indexes")
+    if not isinstance(raw_indexes, dict):
+        raise SkillDbUnavailableError("skills_db.json has invalid format: missing indexes")
+
+    ordinal_by_code = {skill.code: ordinal for ordinal, skill in enumerate(skills)}
+
+    def as_ordinals(name: str) -> dict[str, list[int]]:
+        section = raw_indexes.get(name)
+        if not isinstance(section, dict):
+            raise SkillDbUnavailableError(f"skills_db.json has invalid format: missing indexes.{name}")
+        return {
+            key: [ordinal_by_code[code] for code in codes if code in ordinal_by_code]
+            for key, codes in section.items()
+            if isinstance(codes, list)
+        }
+
+    return SkillIndexes(
+        by_name=as_ordinals("by_name"),
+        by_alias=as_ordinals("by_alias"),
+        term_to_ordinals={key: value for key, value in as_ordinals("term_to_codes").items() if key and value},
+        tag_to_ordinals={key: value for key, value in as_ordinals("tag_to_codes").items() if key and value},
+    )
 
-    payload = json.loads(db_path.read_text(encoding="utf-8"))
+
+def _skills_and_indexes(payload: dict[str, Any]) -> tuple[tuple[SkillRecord, ...], SkillIndexes]:
     records = payload.get("skills")
     if not isinstance(records, list):
         raise SkillDbUnavailableError("skills_db.json has invalid format: missing skills array")
 
-    skills = tuple(_build_skill(record) for record in records if isinstance(record, dict))
-    skills = tuple(skill for skill in skills if skill.code and skill.name)
+    skills = skills_from_records(records)
+    indexes = _indexes_from_payload(payload, skills)
+    return skills, indexes if indexes is not None else build_skill_indexes(skills)
 
-    by_code = {skill.code: skill for skill in skills}
 
-    by_name_map: dict[str, list[SkillRecord]] = {}
-    by_alias_map: dict[str, list[SkillRecord]] = {}
-    term_to_codes: dict[str, set[str]] = {}
+_SNAPSHOT_STRING_FIELDS = ("code", "name", "slug", "l1_code", "l2_code", "l3_name", "status")
+_SNAPSHOT_INT_FIELDS = ("cat_id", "subcat_id", "l3_id")
+_SNAPSHOT_LIST_FIELDS = ("aliases", "tags", "search_terms")
 
-    for skill in skills:
-        for normalized_name in expand_token_variants(skill.name):
-            by_name_map.setdefault(normalized_name, []).append(skill)
-            term_to_codes.setdefault(normalized_name, set()).add(skill.code)
 
-        for alias in skill.aliases:
-            for normalized_alias in expand_token_variants(alias):
-                by_alias_map.setdefault(normalized_alias, []).append(skill)
-                term_to_codes.setdefault(normalized_alias, set()).add(skill.code)
+def write_skill_db_snapshot(path: Path, payload: dict[str, Any]) -> None:
+    """Write the binary snapshot for a skills_db.json payload, indexes included."""
 
-        for term in skill.search_terms:
-            for normalized_term in expand_token_variants(term):
-                term_to_codes.setdefault(normalized_term, set()).add(skill.code)
-
-    by_name = {key: tuple(value) for key, value in by_name_map.items()}
-    by_alias = {key: tuple(value) for key, value in by_alias_map.items()}
-    term_to_codes_final = {
-        key: tuple(sorted(value))
-        for key, value in term_to_codes.items()
-        if key and value
-    }
+    skills, indexes = _skills_and_indexes(payload)
 
-    _cached_skill_db = SkillDb(
-        metadata=payload.get("metadata", {}),
-        skills=skills,
-        by_code=by_code,
-        by_name=by_name,
-        by_alias=by_alias,
-        term_to_codes=term_to_codes_final,
-        term_choices=tuple(term_to_codes_final.keys()),
+    builder = SnapshotBuilder()
+    for field in _SNAPSHOT_STRING_FIELDS:
+        builder.add_strings(field, (getattr(skill, field) or "" for skill in skills))
+    for field in _SNAPSHOT_INT_FIELDS:
+        values = (getattr(skill, field) for skill in skills)
+        builder.add_array(field, "i", (_NULL_INT if value is None else value for value in values))
+    for field in _SNAPSHOT_LIST_FIELDS:
+        builder.add_string_lists(field, (getattr(skill, field) for skill in skills))
+
+    by_code = {skill.code: [ordinal] for ordinal, skill in enumerate(skills)}
+    builder.add_index("by_code", by_code)
+    builder.add_index("by_name", indexes.by_name)
+    builder.add_index("by_alias", indexes.by_alias)
+    builder.add_index("tag_to_codes", indexes.tag_to_ordinals)
+    builder.add_index(
+        "term_to_codes",
+        indexes.term_to_ordinals,
+        order=list(indexes.term_to_ordinals.keys()),
+    )
+    term_trigrams = TermTrigramIndex.build(list(indexes.term_to_ordinals.keys()))
+    builder.add_index("term_trigrams", {gram: list(posting) for gram, posting in term_trigrams.postings.items()})
+    builder.add_array("term_trigram_counts", "I", term_trigrams.counts)
+    grams, idf, offsets, positions, weights = build_semantic_tables(list(indexes.term_to_ordinals.keys()))
+    builder.add_index(
+        "semantic_postings",
+        {gram: list(positions[offsets[gram_id] : offsets[gram_id + 1]]) for gram_id, gram in enumerate(grams)},
+    )
+    builder.add_array("semantic_idf", "d", idf)
+    builder.add_array("semantic_weights", "f", weights)
+    typo_index = DeletionIndex.build([*indexes.by_name, *indexes.by_alias])
+    builder.add_strings("typo_keys", typo_index.keys)
+    builder.add_index("typo_deletes", {variant: list(posting) for variant, posting in typo_index.deletes.items()})
+    automaton = TaxonomyAutomaton.build([*indexes.by_name, *indexes.by_alias])
+    builder.add_array("automaton_edge_parents", "I", (parent for parent, _ in automaton.goto))
+    builder.add_strings("automaton_edge_tokens", (token for _, token in automaton.goto))
+    builder.add_array("automaton_edge_children", "I", automaton.goto.values())
+    builder.add_array("automaton_fail", "I", automaton.fail)
+    builder.add_array("automaton_output", "I", automaton.output)
+    builder.add_array("automaton_depth", "I", automaton.depth)
+    builder.add_array("automaton_term_nodes", "I", automaton.terms)
+    builder.add_strings("automaton_terms", automaton.terms.values())
+    vocabulary = _term_vocabulary(
+        (*indexes.term_to_ordinals, *indexes.by_name, *indexes.by_alias, *indexes.tag_to_ordinals)
+    )
+    builder.add_strings("term_vocabulary", sorted(vocabulary))
+
+    builder.write(path, metadata=payload.get("metadata", {}), record_count=len(skills))
+
+
+def _columns_from_record_fields(db: SkillDb) -> SkillColumns:
+    skills = tuple(db.skills)
+    ordinal_by_code = {skill.code: ordinal for ordinal, skill in enumerate(skills)}
+
+    def ordinals(codes: Iterator[str]) -> list[int]:
+        return [ordinal_by_code[code] for code in codes if code in ordinal_by_code]
+
+    indexes = SkillIndexes(
+        by_name={key: ordinals(s.code for s in value) for key, value in db.by_name.items()},
+        by_alias={key: ordinals(s.code for s in value) for key, value in db.by_alias.items()},
+        term_to_ordinals={key: ordinals(iter(value)) for key, value in db.term_to_codes.items()},
+        tag_to_ordinals=build_tag_index(skills),
     )
+    return SkillColumns.from_records(skills, indexes, term_choices=db.term_choices)
+
+
+class _ColumnRecords(Sequence[SkillRecord]):
+    def __init__(self, columns: SkillColumns) -> None:
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __getitem__(self, index: Any) -> Any:
+        count = len(self._columns)
+        if isinstance(index, slice):
+            return tuple(self._columns.record(i) for i in range(*index.indices(count)))
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(index)
+        return self._columns.record(index)
+
+
+class _PostingView(Mapping[str, Any]):
+    """``key -> resolve(ordinals)`` over a posting index; ``resolve`` decides what a hit returns."""
+
+    def __init__(self, postings: Postings, resolve: Callable[[Sequence[int]], Any]) -> None:
+        self._postings = postings
+        self._resolve = resolve
+
+    def __getitem__(self, key: str) -> Any:
+        ordinals = self._postings.get(key)
+        if ordinals is None:
+            raise KeyError(key)
+        return self._resolve(ordinals)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+
+def _first_record(columns: SkillColumns, ordinals: Sequence[int]) -> SkillRecord:
+    return columns.record(ordinals[0])
+
+
+def _records(columns: SkillColumns, ordinals: Sequence[int]) -> tuple[SkillRecord, ...]:
+    return tuple(columns.record(ordinal) for ordinal in ordinals)
+
+
+def _codes(columns: SkillColumns, ordinals: Sequence[int]) -> tuple[str, ...]:
+    return tuple(columns.codes[ordinal] for ordinal in ordinals)
+
+
+class _LazyTermChoices(Sequence[str]):
+    """Term choices in build order; decoded once, when fuzzy matching first needs them."""
+
+    def __init__(self, terms: Postings) -> None:
+        self._terms = terms
+        self._choices: tuple[str, ...] | None = None
+
+    def _materialize(self) -> tuple[str, ...]:
+        if self._choices is None:
+            self._choices = tuple(self._terms)
+        return self._choices
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+
+def _open_snapshot(path: Path) -> SkillDbSnapshot:
+    if shared_memory_enabled():
+        try:
+            return open_shared_snapshot(path)
+        except (OSError, SharedSnapshotUnavailableError):
+            pass  # Fall back to this worker's own file mapping.
+    return SkillDbSnapshot.open(path)
+
+
+def _load_from_snapshot(path: Path) -> SkillDb:
+    snapshot = _open_snapshot(path)
+    return SkillDb.from_columns(snapshot.metadata, SkillColumns.from_snapshot(snapshot))
 
+
+def _load_from_json(path: Path) -> SkillDb:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    skills, indexes = _skills_and_indexes(payload)
+    return SkillDb.from_columns(payload.get("metadata", {}), SkillColumns.from_records(skills, indexes))
+
+
+def snapshot_path_for(db_path: Path) -> Path:
+    return db_path.with_suffix(SNAPSHOT_SUFFIX)
+
+
+def _resolve_snapshot_path(db_path: Path) -> Path | None:
+    if is_snapshot_file(db_path):
+        return db_path
+
+    snapshot_path = snapshot_path_for(db_path)
+    if not snapshot_path.exists():
+        return None
+    # A snapshot older than its JSON source is stale; rebuild it with build_skills_db.
+    if db_path.exists() and snapshot_path.stat().st_mtime < db_path.stat().st_mtime:
+        return None
+    return snapshot_path
+
+
+def resolve_skill_db_path() -> Path:
+    configured_path = os.environ.get("PYTHON_CV_SKILLS_DB_PATH")
+    return Path(configured_path) if configured_path else DEFAULT_DB_PATH
+
+
+def load_skill_db_from_path(db_path: Path) -> SkillDb:
+    """Load a fresh, uncached SkillDb from a JSON source or binary snapshot."""
+
+    snapshot_path = _resolve_snapshot_path(db_path)
+    if snapshot_path is not None:
+        try:
+            return _load_from_snapshot(snapshot_path)
+        except (OSError, ValueError, SnapshotFormatError) as exc:
+            if snapshot_path == db_path:
+                raise SkillDbUnavailableError(f"skills snapshot at {db_path} is unreadable: {exc}") from exc
+            # Fall back to the JSON source below.
+
+    if not db_path.exists():
+        raise SkillDbUnavailableError(f"skills_db.json not found at {db_path}")
+
+    return _load_from_json(db_path)
+
+
+def skill_db_checksum(skill_db: SkillDb) -> str | None:
+    checksum = skill_db.metadata.get("checksum") if isinstance(skill_db.metadata, dict) else None
+    return checksum if isinstance(checksum, str) and checksum else None
+
+
+def load_skill_db(force_reload: bool = False) -> SkillDb:
+    global _cached_skill_db
+
+    if _cached_skill_db and not force_reload:
+        return _cached_skill_db
+
+    _cached_skill_db = load_skill_db_from_path(resolve_skill_db_path())
     return _cached_skill_db
+
+
+def clear_skill_db_cache(*_: object) -> None:
+    """Drop the ``load_skill_db()`` cache; doubles as a SkillDbReloader swap listener."""
+
+    global _cached_skill_db
+
+    _cached_skill_db = None
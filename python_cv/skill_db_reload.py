@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from python_cv.skill_db import (
+    SkillDb,
+    clear_skill_db_cache,
+    load_skill_db_from_path,
+    resolve_skill_db_path,
+    skill_db_checksum,
+    snapshot_path_for,
+)
+from python_cv.skill_matcher import clear_suggestion_cache
+from python_cv.text_normalize import clear_normalize_caches
+
+RELOAD_INTERVAL_ENV = "PYTHON_CV_SKILLS_DB_RELOAD_SECONDS"
+DEFAULT_RELOAD_INTERVAL_SECONDS = 30.0
+
+SwapListener = Callable[[SkillDb], None]
+SourceStamp = tuple[tuple[str, int, int], ...]
+
+
+def _reload_interval_from_env() -> float:
+    raw = os.environ.get(RELOAD_INTERVAL_ENV)
+    if not raw:
+        return DEFAULT_RELOAD_INTERVAL_SECONDS
+    try:
+        value = float(raw)
+    except ValueError:
+        return DEFAULT_RELOAD_INTERVAL_SECONDS
+    return max(0.0, value)
+
+
+def _source_stamp(db_path: Path) -> SourceStamp:
+    stamp: list[tuple[str, int, int]] = []
+    for path in (db_path, snapshot_path_for(db_path)):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        stamp.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+class SkillDbReloader:
+    """Serves the active SkillDb and swaps in a rebuilt one when the source changes.
+
+    Request threads only ever read ``self._active`` (an atomic reference read) and,
+    at most once per interval, try a non-blocking stat of the source files. The
+    rebuild runs on a daemon thread; requests that already hold the old SkillDb
+    finish on it, and the new one is swapped in only when its checksum differs.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_seconds: float | None = None,
+        path_resolver: Callable[[], Path] = resolve_skill_db_path,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._interval = _reload_interval_from_env() if interval_seconds is None else interval_seconds
+        self._path_resolver = path_resolver
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._active: SkillDb | None = None
+        self._stamp: SourceStamp = ()
+        self._next_check = 0.0
+        self._builder: threading.Thread | None = None
+        self._listeners: list[SwapListener] = []
+        self.swap_count = 0
+        self.last_error: str | None = None
+
+    @property
+    def active_checksum(self) -> str | None:
+        active = self._active
+        return skill_db_checksum(active) if active is not None else None
+
+    def add_swap_listener(self, listener: SwapListener) -> None:
+        self._listeners.append(listener)
+
+    def current(self) -> SkillDb:
+        active = self._active
+        if active is None:
+            # Nothing to serve yet, so the very first load is synchronous.
+            with self._lock:
+                if self._active is None:
+                    db_path = self._path_resolver()
+                    stamp = _source_stamp(db_path)
+                    self._active = load_skill_db_from_path(db_path)
+                    self._stamp = stamp
+                    self._next_check = self._clock() + self._interval
+                return self._active
+
+        self._maybe_start_reload()
+        return active
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until an in-progress rebuild finishes; returns False on timeout."""
+
+        builder = self._builder
+        if builder is None:
+            return True
+        builder.join(timeout)
+        return not builder.is_alive()
+
+    def _maybe_start_reload(self) -> None:
+        if self._interval <= 0 or self._clock() < self._next_check:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._clock() < self._next_check:
+                return
+            self._next_check = self._clock() + self._interval
+            if self._builder is not None and self._builder.is_alive():
+                return
+
+            db_path = self._path_resolver()
+            stamp = _source_stamp(db_path)
+            if not stamp or stamp == self._stamp:
+                return
+
+            self._builder = threading.Thread(
+                target=self._rebuild,
+                args=(db_path, stamp),
+                name="skill-db-reload",
+                daemon=True,
+            )
+            self._builder.start()
+        finally:
+            self._lock.release()
+
+    def _rebuild(self, db_path: Path, stamp: SourceStamp) -> None:
+        try:
+            candidate = load_skill_db_from_path(db_path)
+            candidate.columns.build_derived_indexes()
+        except Exception as exc:  # keep serving the previous snapshot and retry next interval
+            with self._lock:
+                self.last_error = str(exc) or exc.__class__.__name__
+            return
+
+        checksum = skill_db_checksum(candidate)
+        # Publish under the lock so a concurrent first load or reload check never
+        # sees the new SkillDb paired with the old stamp (or the reverse).
+        with self._lock:
+            self.last_error = None
+            self._stamp = stamp
+            active = self._active
+            if checksum is not None and active is not None and checksum == skill_db_checksum(active):
+                return
+            self._active = candidate
+            self.swap_count += 1
+
+        # Listeners run outside the lock; they may call back into current().
+        for listener in list(self._listeners):
+            try:
+                listener(candidate)
+            except Exception as exc:  # pragma: no cover - listeners must not break the swap
+                with self._lock:
+                    self.last_error = f"swap listener failed: {exc}"
+
+
+_reloader: SkillDbReloader | None = None
+_reloader_lock = threading.Lock()
+
+
+def get_skill_db_reloader() -> SkillDbReloader:
+    global _reloader
+
+    if _reloader is None:
+        with _reloader_lock:
+            if _reloader is None:
+                _reloader = SkillDbReloader()
+                # Callers still on load_skill_db() pick up the new taxonomy on their next call.
+                _reloader.add_swap_listener(clear_skill_db_cache)
+                _reloader.add_swap_listener(clear_suggestion_cache)
+                _reloader.add_swap_listener(clear_normalize_caches)
+    return _reloader
+
+
+def active_skill_db() -> SkillDb:
+    return get_skill_db_reloader().current()
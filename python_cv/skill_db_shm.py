@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+from python_cv.skill_db_snapshot import SNAPSHOT_FORMAT_VERSION, SkillDbSnapshot
+
+SHARED_MEMORY_ENV = "PYTHON_CV_SKILLS_DB_SHARED_MEMORY"
+SHARED_MEMORY_PREFIX_ENV = "PYTHON_CV_SKILLS_DB_SHM_PREFIX"
+DEFAULT_SHARED_MEMORY_PREFIX = "pcvskdb"
+
+# state (0 = copying, 1 = ready), creator pid, payload length, creation time
+# (Unix seconds). The payload starts at an 8-byte aligned offset so snapshot
+# sections stay aligned.
+_SEGMENT_HEADER = struct.Struct("<IIQd")
+_STATE_READY = 1
+_ATTACH_WAIT_SECONDS = 5.0
+_ATTACH_POLL_SECONDS = 0.01
+# Copying even a large snapshot takes milliseconds; a segment still copying
+# after this long was abandoned by a creator that died or hung mid-copy.
+_PUBLISH_STALE_SECONDS = 60.0
+
+
+class SharedSnapshotUnavailableError(Exception):
+    pass
+
+
+class _StaleSegmentError(SharedSnapshotUnavailableError):
+    """The segment was never marked ready and its creator is gone."""
+
+
+class _SnapshotSegment(SharedMemory):
+    """SharedMemory that closes its mapping on collection unless views still use it.
+
+    Column views slice the underlying mmap directly and can outlive this handle
+    in a GC cycle; the stock ``__del__`` would then raise on the exported map.
+    In that case the mapping is released when the last view goes.
+    """
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except BufferError:
+            pass
+
+
+# Segments this process created, by name, so it can retire them on the next swap.
+_published: dict[str, SharedMemory] = {}
+
+
+def shared_memory_enabled() -> bool:
+    return os.environ.get(SHARED_MEMORY_ENV, "").strip().lower() in {"1", "true", "on", "yes"}
+
+
+def _prefix() -> str:
+    prefix = os.environ.get(SHARED_MEMORY_PREFIX_ENV, "").strip()
+    return prefix or DEFAULT_SHARED_MEMORY_PREFIX
+
+
+def segment_name(snapshot: SkillDbSnapshot) -> str:
+    # The taxonomy checksum alone would let a worker running a newer snapshot
+    # format attach to an older layout of the same taxonomy, so the name also
+    # carries the format version. The checksum is hashed down to keep us under
+    # macOS's 31-character POSIX shm limit; snapshots without one fall back to
+    # hashing the file bytes.
+    key = snapshot.checksum.encode("utf-8") if snapshot.checksum else snapshot.raw_view()
+    digest = hashlib.blake2b(key, digest_size=8).hexdigest()
+    return f"{_prefix()}-v{SNAPSHOT_FORMAT_VERSION}-{digest}"
+
+
+def _untrack(shm: SharedMemory) -> None:
+    # Before Python 3.13 every attaching process registers the segment with its
+    # resource tracker, which unlinks it when *that* process exits and breaks the
+    # other workers. Lifetime is managed explicitly here instead.
+    if sys.version_info < (3, 13):
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:  # pragma: no cover - tracker internals vary
+            pass
+
+
+def _creator_gone(pid: int, created: float) -> bool:
+    if time.time() - created > _PUBLISH_STALE_SECONDS:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
+def _payload_view(shm: SharedMemory, *, wait_seconds: float) -> memoryview:
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        state, pid, length, created = _SEGMENT_HEADER.unpack_from(shm.buf, 0)
+        if state == _STATE_READY:
+            start = _SEGMENT_HEADER.size
+            return shm.buf[start : start + length].toreadonly()
+        # pid 0 means the header is not written yet; give the creator the full wait.
+        if pid and _creator_gone(pid, created):
+            raise _StaleSegmentError(f"shared snapshot {shm.name} was abandoned mid-copy")
+        if time.monotonic() >= deadline:
+            if not pid:
+                raise _StaleSegmentError(f"shared snapshot {shm.name} was abandoned before its header")
+            raise SharedSnapshotUnavailableError(f"shared snapshot {shm.name} never became ready")
+        time.sleep(_ATTACH_POLL_SECONDS)
+
+
+def _attach(name: str, *, wait_seconds: float) -> SkillDbSnapshot:
+    shm = _SnapshotSegment(name=name, create=False)
+    _untrack(shm)
+    try:
+        payload = _payload_view(shm, wait_seconds=wait_seconds)
+    except SharedSnapshotUnavailableError:
+        shm.close()
+        raise
+    return SkillDbSnapshot(payload, source=f"shm:{name}", keepalive=shm)
+
+
+def _publish(name: str, file_snapshot: SkillDbSnapshot) -> SkillDbSnapshot:
+    source = file_snapshot.raw_view()
+    shm = _SnapshotSegment(name=name, create=True, size=_SEGMENT_HEADER.size + len(source))
+    _untrack(shm)
+    created = time.time()
+    _SEGMENT_HEADER.pack_into(shm.buf, 0, 0, os.getpid(), len(source), created)
+    start = _SEGMENT_HEADER.size
+    shm.buf[start : start + len(source)] = source
+    # Flip the ready flag last so attaching workers never see a partial copy.
+    _SEGMENT_HEADER.pack_into(shm.buf, 0, _STATE_READY, os.getpid(), len(source), created)
+    _published[name] = shm
+    _retire_stale_segments(keep=name)
+    return SkillDbSnapshot(_payload_view(shm, wait_seconds=0), source=f"shm:{name}", keepalive=shm)
+
+
+def _unlink(name: str) -> None:
+    shm = _published.pop(name, None)
+    try:
+        if shm is None:
+            shm = SharedMemory(name=name, create=False)
+            _untrack(shm)
+            shm.close()
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _retire_stale_segments(*, keep: str) -> None:
+    """Unlink older taxonomy versions this process published; attached workers keep their mappings.
+
+    Segments published by other processes are left alone even under the same
+    prefix: a second deployment or a canary on the box may still be serving them.
+    """
+
+    for name in [name for name in _published if name != keep]:
+        _unlink(name)
+
+
+def open_shared_snapshot(path: Path, *, wait_seconds: float = _ATTACH_WAIT_SECONDS) -> SkillDbSnapshot:
+    """Return a read-only view of ``path`` backed by a box-wide shared memory segment.
+
+    The first worker to see a taxonomy version copies the snapshot into a segment
+    named after its checksum; every other worker (and later hot swaps to the same
+    version) attaches to that segment instead of holding its own copy.
+    """
+
+    file_snapshot = SkillDbSnapshot.open(path)
+    name = segment_name(file_snapshot)
+    try:
+        return _attach(name, wait_seconds=wait_seconds)
+    except FileNotFoundError:
+        pass
+    except _StaleSegmentError:
+        # Its creator died mid-copy; nobody can be attached to it, so replace it.
+        # Two workers racing here at worst unlink a fresh copy someone already
+        # mapped, which only costs that copy's memory until its workers swap.
+        _unlink(name)
+
+    try:
+        return _publish(name, file_snapshot)
+    except FileExistsError:
+        # Another worker won the race to publish; wait for its copy to complete.
+        return _attach(name, wait_seconds=wait_seconds)
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+SNAPSHOT_MAGIC = b"PCVSKDB\x00"
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = ".bin"
+
+# magic, format version, header length (little-endian). Section payloads use the
+# writer's native byte order, recorded in the header and checked on open.
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 8
+
+
+class SnapshotFormatError(Exception):
+    pass
+
+
+def _align(value: int) -> int:
+    return (value + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _slot_count(key_count: int) -> int:
+    # Power of two at most half full, so linear probing stays short.
+    size = 1
+    while size < key_count * 2:
+        size *= 2
+    return size
+
+
+def _encode_strings(values: Iterable[str]) -> tuple[array, bytes]:
+    offsets = array("I", [0])
+    blob = bytearray()
+    for value in values:
+        blob.extend(value.encode("utf-8"))
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+class SnapshotBuilder:
+    """Collects typed sections and writes them as one aligned, mmap-friendly file."""
+
+    def __init__(self) -> None:
+        self._sections: list[tuple[str, str, bytes]] = []
+
+    def add_array(self, name: str, typecode: str, values: Iterable[float]) -> None:
+        self._sections.append((name, typecode, array(typecode, values).tobytes()))
+
+    def add_strings(self, name: str, values: Iterable[str]) -> None:
+        offsets, blob = _encode_strings(values)
+        self._sections.append((f"{name}.offsets", "I", offsets.tobytes()))
+        self._sections.append((f"{name}.data", "B", blob))
+
+    def add_string_lists(self, name: str, rows: Iterable[Iterable[str]]) -> None:
+        row_offsets = array("I", [0])
+        items: list[str] = []
+        for row in rows:
+            items.extend(row)
+            row_offsets.append(len(items))
+        self._sections.append((f"{name}.rows", "I", row_offsets.tobytes()))
+        self.add_strings(f"{name}.items", items)
+
+    def add_index(
+        self,
+        name: str,
+        postings: dict[str, list[int]],
+        *,
+        order: list[str] | None = None,
+    ) -> None:
+        """Store ``key -> ordinals`` sorted by UTF-8 key bytes for binary search.
+
+        ``order`` optionally records the caller's key order (e.g. dict insertion
+        order) so iteration over the index can reproduce it exactly.
+        """
+
+        keys = sorted(postings, key=lambda key: key.encode("utf-8"))
+        self.add_strings(f"{name}.keys", keys)
+
+        # crc32 open-addressing table (key position + 1, 0 = empty) so a lookup
+        # is one hash and usually one comparison instead of a binary search.
+        slots = array("I", [0]) * _slot_count(len(keys))
+        mask = len(slots) - 1
+        for position, key in enumerate(keys):
+            slot = zlib.crc32(key.encode("utf-8")) & mask
+            while slots[slot]:
+                slot = (slot + 1) & mask
+            slots[slot] = position + 1
+        self._sections.append((f"{name}.keys.slots", "I", slots.tobytes()))
+
+        posting_offsets = array("I", [0])
+        flat = array("I")
+        for key in keys:
+            flat.extend(postings[key])
+            posting_offsets.append(len(flat))
+        self._sections.append((f"{name}.postings.offsets", "I", posting_offsets.tobytes()))
+        self._sections.append((f"{name}.postings", "I", flat.tobytes()))
+
+        if order is not None:
+            position = {key: idx for idx, key in enumerate(keys)}
+            self.add_array(f"{name}.order", "I", (position[key] for key in order))
+
+    def write(self, path: Path, *, metadata: dict[str, Any], record_count: int) -> None:
+        layout: dict[str, list[Any]] = {}
+        cursor = 0
+        for name, typecode, payload in self._sections:
+            cursor = _align(cursor)
+            layout[name] = [cursor, len(payload), typecode]
+            cursor += len(payload)
+
+        header = json.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "metadata": metadata,
+                "record_count": record_count,
+                "sections": layout,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        data_start = _align(_PREAMBLE.size + len(header))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header)))
+            handle.write(header)
+            for name, _, payload in self._sections:
+                handle.seek(data_start + layout[name][0])
+                handle.write(payload)
+        tmp_path.replace(path)
+
+
+class StringTable:
+    """Zero-copy view over an offsets/data string section pair."""
+
+    __slots__ = ("_offsets", "_data")
+
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self._data[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        # One copy of the data beats a memoryview slice per row when walking the whole table.
+        data = self._data.tobytes()
+        offsets = self._offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield str(data[start:end], "utf-8")
+
+    def raw(self, index: int) -> bytes:
+        return self._data[self._offsets[index] : self._offsets[index + 1]].tobytes()
+
+    def matches(self, index: int, encoded: bytes) -> bool:
+        return self._data[self._offsets[index] : self._offsets[index + 1]] == encoded
+
+    def find(self, key: str) -> int:
+        """Binary search; only valid for tables written in UTF-8 byte order."""
+
+        target = key.encode("utf-8")
+        low, high = 0, len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if self.raw(mid) < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(self) and self.raw(low) == target:
+            return low
+        return -1
+
+
+class StringListTable:
+    __slots__ = ("_rows", "_items")
+
+    def __init__(self, rows: memoryview, items: StringTable) -> None:
+        self._rows = rows
+        self._items = items
+
+    def __getitem__(self, index: int) -> tuple[str, ...]:
+        return tuple(self._items[item] for item in range(self._rows[index], self._rows[index + 1]))
+
+
+class SnapshotIndex(Mapping[str, memoryview]):
+    """Read-only ``key -> ordinal posting list`` mapping over a snapshot index."""
+
+    __slots__ = ("keys", "_posting_offsets", "_postings", "_order", "_slots")
+
+    def __init__(
+        self,
+        keys: StringTable,
+        posting_offsets: memoryview,
+        postings: memoryview,
+        order: memoryview | None,
+        slots: memoryview | None = None,
+    ) -> None:
+        self.keys = keys
+        self._posting_offsets = posting_offsets
+        self._postings = postings
+        self._order = order
+        self._slots = slots
+
+    def position(self, key: str) -> int:
+        """Sorted position of ``key`` among the index keys, or -1 if absent."""
+
+        slots = self._slots
+        if slots is None:
+            return self.keys.find(key)
+        encoded = key.encode("utf-8")
+        mask = len(slots) - 1
+        slot = zlib.crc32(encoded) & mask
+        while True:
+            entry = slots[slot]
+            if not entry:
+                return -1
+            if self.keys.matches(entry - 1, encoded):
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, key: str) -> memoryview:
+        postings = self.get(key)
+        if postings is None:
+            raise KeyError(key)
+        return postings
+
+    def __iter__(self) -> Iterator[str]:
+        if self._order is None:
+            yield from self.keys
+            return
+        for position in self._order:
+            yield self.keys[position]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        position = self.position(key)
+        if position < 0:
+            return default
+        return self._postings[self._posting_offsets[position] : self._posting_offsets[position + 1]]
+
+
+class SkillDbSnapshot:
+    """Read-only, lazily decoded view over a snapshot held in an mmap or buffer."""
+
+    def __init__(self, buffer: Any, *, source: str, keepalive: Any = None) -> None:
+        # ``keepalive`` pins whatever owns the memory (e.g. a SharedMemory handle).
+        self._keepalive = keepalive
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self.source = source
+
+        if len(self._view) < _PREAMBLE.size:
+            raise SnapshotFormatError(f"Snapshot {source} is truncated")
+
+        magic, version, header_length = _PREAMBLE.unpack_from(self._view, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotFormatError(f"Snapshot {source} has an unknown file signature")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise SnapshotFormatError(
+                f"Snapshot {source} has format version {version}, expected {SNAPSHOT_FORMAT_VERSION}"
+            )
+
+        header_end = _PREAMBLE.size + header_length
+        header = json.loads(self._view[_PREAMBLE.size : header_end].tobytes().decode("utf-8"))
+        if header.get("byteorder") != sys.byteorder:
+            raise SnapshotFormatError(f"Snapshot {source} was written with a different byte order")
+
+        self.metadata: dict[str, Any] = header.get("metadata", {})
+        self.record_count = int(header.get("record_count", 0))
+        self._sections: dict[str, list[Any]] = header.get("sections", {})
+        self._data_start = _align(header_end)
+
+    @property
+    def checksum(self) -> str | None:
+        value = self.metadata.get("checksum")
+        return value if isinstance(value, str) and value else None
+
+    def raw_view(self) -> memoryview:
+        return self._view
+
+    @classmethod
+    def open(cls, path: Path) -> "SkillDbSnapshot":
+        with path.open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, source=str(path))
+
+    def has_section(self, name: str) -> bool:
+        return name in self._sections
+
+    def section(self, name: str) -> memoryview:
+        try:
+            offset, length, typecode = self._sections[name]
+        except KeyError as exc:
+            raise SnapshotFormatError(f"Snapshot {self.source} is missing section {name}") from exc
+        start = self._data_start + offset
+        raw = self._view[start : start + length]
+        return raw if typecode == "B" else raw.cast(typecode)
+
+    def strings(self, name: str) -> StringTable:
+        return StringTable(self.section(f"{name}.offsets"), self.section(f"{name}.data"))
+
+    def string_lists(self, name: str) -> StringListTable:
+        return StringListTable(self.section(f"{name}.rows"), self.strings(f"{name}.items"))
+
+    def index(self, name: str) -> SnapshotIndex:
+        order_name = f"{name}.order"
+        slots_name = f"{name}.keys.slots"
+        return SnapshotIndex(
+            self.strings(f"{name}.keys"),
+            self.section(f"{name}.postings.offsets"),
+            self.section(f"{name}.postings"),
+            self.section(order_name) if self.has_section(order_name) else None,
+            self.section(slots_name) if self.has_section(slots_name) else None,
+        )
+
+
+def is_snapshot_file(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            return handle.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
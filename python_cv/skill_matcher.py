@@ -1,14 +1,40 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Iterable
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
 from python_cv.skill_candidate_extract import CandidateSeed
-from python_cv.skill_db import SkillDb
+from python_cv.skill_db import SkillColumns, SkillDb, skill_db_checksum
+from python_cv.term_trigrams import TermTrigramIndex
 from python_cv.text_normalize import expand_token_variants, normalize_token
 
+FUZZY_RESULT_LIMIT = 80
+
+MATCH_CACHE_SIZE_ENV = "PYTHON_CV_MATCH_CACHE_SIZE"
+DEFAULT_MATCH_CACHE_SIZE = 4096
+
+# A candidate that only matches a hierarchy tag (an L2 name or L3 slug) gets at
+# most this many of the tagged skills, scored below any direct fuzzy hit.
+TAG_POSTING_LIMIT = 25
+TAG_MATCH_SCORE = 0.7
+
+SEMANTIC_MATCHING_ENV = "PYTHON_CV_SEMANTIC_MATCHING"
+# Cosine floor, retrieved terms per candidate, and the score cap that keeps
+# semantic suggestions below every fuzzy one.
+SEMANTIC_MIN_SCORE = 0.6
+SEMANTIC_TOP_K = 10
+SEMANTIC_MAX_SCORE = 0.85
+# Per match_skill_candidates call (a request's unique candidates): at most this
+# many candidates go to the semantic tier.
+SEMANTIC_MAX_CANDIDATES = 15
+
 
 @dataclass(frozen=True)
 class MatchedSuggestion:
@@ -18,6 +44,14 @@ class MatchedSuggestion:
     score: float
 
 
+@dataclass
+class SemanticUsage:
+    """Request-level semantic tier flags, reported as ``semantic_*`` metadata."""
+
+    used: bool = False
+    fallback_triggered: bool = False
+
+
 @dataclass(frozen=True)
 class MatchedCandidate:
     candidate_id: str
@@ -29,6 +63,83 @@ class MatchedCandidate:
     unmapped_candidate: bool
 
 
+# normalized candidate text, skill DB checksum, suggestions_limit
+SuggestionCacheKey = tuple[str, str, int]
+
+
+class SuggestionCache:
+    """Bounded, thread-safe LRU of per-candidate suggestions shared across requests.
+
+    Keys carry the skill DB checksum, so a swapped taxonomy can never serve stale
+    suggestions; the reloader still clears the cache on swap to free the memory.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(0, max_entries)
+        self._entries: OrderedDict[SuggestionCacheKey, tuple[MatchedSuggestion, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: SuggestionCacheKey) -> tuple[MatchedSuggestion, ...] | None:
+        with self._lock:
+            suggestions = self._entries.get(key)
+            if suggestions is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return suggestions
+
+    def put(self, key: SuggestionCacheKey, suggestions: tuple[MatchedSuggestion, ...]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = suggestions
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+def _match_cache_size_from_env() -> int:
+    raw = os.environ.get(MATCH_CACHE_SIZE_ENV)
+    if not raw:
+        return DEFAULT_MATCH_CACHE_SIZE
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return DEFAULT_MATCH_CACHE_SIZE
+
+
+suggestion_cache = SuggestionCache(_match_cache_size_from_env())
+
+
+def clear_suggestion_cache(*_: object) -> None:
+    """Drop cached suggestions; doubles as a SkillDbReloader swap listener."""
+
+    suggestion_cache.clear()
+
+
+def semantic_matching_enabled() -> bool:
+    return os.environ.get(SEMANTIC_MATCHING_ENV, "1").strip().lower() not in {"0", "false", "off", "no"}
+
+
 def _fuzzy_threshold(normalized_candidate: str) -> int:
     token_count = len(normalized_candidate.split())
     if token_count <= 1 and len(normalized_candidate) <= 2:
@@ -48,19 +159,19 @@ def _method_rank(method: str) -> int:
     return {"exact": 4, "synonym": 3, "fuzzy": 2, "semantic": 1}.get(method, 0)
 
 
-def _upsert_suggestion(container: dict[str, MatchedSuggestion], suggestion: MatchedSuggestion) -> None:
-    existing = container.get(suggestion.skill_id)
+def _upsert_suggestion(
+    container: dict[int, tuple[str, float]], ordinal: int, match_method: str, score: float
+) -> None:
+    existing = container.get(ordinal)
     if existing is None:
-        container[suggestion.skill_id] = suggestion
+        container[ordinal] = (match_method, score)
         return
 
-    incoming_rank = _method_rank(suggestion.match_method)
-    existing_rank = _method_rank(existing.match_method)
+    incoming_rank = _method_rank(match_method)
+    existing_rank = _method_rank(existing[0])
 
-    if incoming_rank > existing_rank or (
-        incoming_rank == existing_rank and suggestion.score > existing.score
-    ):
-        container[suggestion.skill_id] = suggestion
+    if incoming_rank > existing_rank or (incoming_rank == existing_rank and score > existing[1]):
+        container[ordinal] = (match_method, score)
 
 
 def _dedupe_sorted(values: Iterable[MatchedSuggestion], limit: int) -> tuple[MatchedSuggestion, ...]:
@@ -71,100 +182,341 @@ def _dedupe_sorted(values: Iterable[MatchedSuggestion], limit: int) -> tuple[Mat
     return tuple(ordered[:limit])
 
 
+@dataclass(frozen=True)
+class _FuzzyQuery:
+    variant: str
+    threshold: int
+    # term_choices positions worth scoring; None means a full scan.
+    positions: Sequence[int] | None
+
+
+def _fuzzy_query(variant: str, term_trigrams: TermTrigramIndex) -> _FuzzyQuery:
+    shortlist = term_trigrams.shortlist(variant)
+    return _FuzzyQuery(variant, _fuzzy_threshold(variant), shortlist or None)
+
+
+def _extract_fuzzy_matches(query: _FuzzyQuery, term_choices: Sequence[str]) -> list[tuple[str, float]]:
+    """The top ``FUZZY_RESULT_LIMIT`` (term, WRatio) pairs at or above the query threshold."""
+
+    # Shortlists keep term_choices order, so extract breaks score ties as a full scan would.
+    choices = (
+        term_choices
+        if query.positions is None
+        else [term_choices[position] for position in query.positions]
+    )
+    fuzzy_matches = process.extract(
+        query.variant,
+        choices,
+        scorer=fuzz.WRatio,
+        limit=FUZZY_RESULT_LIMIT,
+    )
+    return [(term, ratio) for term, ratio, _ in fuzzy_matches if int(ratio) >= query.threshold]
+
+
+def _batch_columns(queries: list[_FuzzyQuery], term_count: int) -> Sequence[int]:
+    if any(query.positions is None for query in queries):
+        return range(term_count)
+    return sorted({position for query in queries for position in query.positions or ()})
+
+
+def _cdist_fuzzy_matches(
+    queries: list[_FuzzyQuery], term_choices: Sequence[str], column_positions: Sequence[int]
+) -> list[list[tuple[str, float]]]:
+    """``_extract_fuzzy_matches`` for many queries from one multi-threaded ``process.cdist``.
+
+    cdist only finds the surviving (query, term) pairs; they are rescored with
+    ``fuzz.WRatio`` so scores are the exact values extract reports, then ranked
+    by (score desc, position) and cut like extract's top-N.
+    """
+
+    column_terms = [term_choices[position] for position in column_positions]
+    scores = process.cdist(
+        [query.variant for query in queries],
+        column_terms,
+        scorer=fuzz.WRatio,
+        score_cutoff=min(query.threshold for query in queries),
+        workers=-1,
+    )
+
+    results: list[list[tuple[str, float]]] = []
+    for row, query in enumerate(queries):
+        allowed = None if query.positions is None else set(query.positions)
+        ranked: list[tuple[float, int, str]] = []
+        for column in np.flatnonzero(scores[row]).tolist():
+            position = column_positions[column]
+            if allowed is not None and position not in allowed:
+                continue
+            term = column_terms[column]
+            ratio = fuzz.WRatio(query.variant, term)
+            if int(ratio) >= query.threshold:
+                ranked.append((-ratio, position, term))
+        ranked.sort()
+        results.append([(term, -negative_ratio) for negative_ratio, _, term in ranked[:FUZZY_RESULT_LIMIT]])
+    return results
+
+
+def _score_fuzzy_queries(
+    queries: list[_FuzzyQuery], term_choices: Sequence[str]
+) -> list[list[tuple[str, float]]]:
+    """Fuzzy matches per query, batching through cdist where the dense matrix pays off.
+
+    Full scans always batch. Shortlisted queries batch only when scoring every
+    query against the union of their shortlists, spread over the available
+    cores, costs no more than scoring each shortlist on its own.
+    """
+
+    results: list[list[tuple[str, float]]] = [[] for _ in queries]
+    full_scan = [idx for idx, query in enumerate(queries) if query.positions is None]
+    shortlisted = [idx for idx, query in enumerate(queries) if query.positions is not None]
+    workers = os.cpu_count() or 1
+
+    for group in (full_scan, shortlisted):
+        group_queries = [queries[idx] for idx in group]
+        scored: list[list[tuple[str, float]]] | None = None
+        if len(group_queries) > 1:
+            column_positions = _batch_columns(group_queries, len(term_choices))
+            per_query_work = sum(
+                len(term_choices) if query.positions is None else len(query.positions)
+                for query in group_queries
+            )
+            if len(group_queries) * len(column_positions) <= workers * per_query_work:
+                scored = _cdist_fuzzy_matches(group_queries, term_choices, column_positions)
+        if scored is None:
+            scored = [_extract_fuzzy_matches(query, term_choices) for query in group_queries]
+        for idx, matches in zip(group, scored):
+            results[idx] = matches
+
+    return results
+
+
+def _materialize_suggestions(
+    container: dict[int, tuple[str, float]], columns: SkillColumns, limit: int
+) -> tuple[MatchedSuggestion, ...]:
+    return _dedupe_sorted(
+        (
+            MatchedSuggestion(
+                skill_id=columns.codes[ordinal],
+                skill_name=columns.names[ordinal],
+                match_method=match_method,
+                score=score,
+            )
+            for ordinal, (match_method, score) in container.items()
+        ),
+        limit,
+    )
+
+
+def _matched_candidate(
+    index: int, candidate: CandidateSeed, suggestions: tuple[MatchedSuggestion, ...]
+) -> MatchedCandidate:
+    return MatchedCandidate(
+        candidate_id=f"candidate-{index}",
+        raw_skill_text=candidate.raw_skill_text,
+        category=candidate.category,
+        evidence_snippets=candidate.evidence_snippets,
+        confidence=round(max(0.0, min(1.0, candidate.confidence)), 3),
+        suggestions=suggestions,
+        unmapped_candidate=len(suggestions) == 0,
+    )
+
+
+def _match_semantic(
+    pending: list[int],
+    normalized_candidates: list[str],
+    suggestion_maps: list[dict[int, tuple[str, float]]],
+    columns: SkillColumns,
+) -> set[int]:
+    """Run the semantic tier for ``pending`` candidates; returns those it skipped.
+
+    Candidates are skipped past the per-request cap, and all of them while the
+    index is still being built in the background.
+    """
+
+    if not pending:
+        return set()
+
+    semantic_index = columns.semantic_index_if_built()
+    if semantic_index is None:
+        return set(pending)
+    for attempt, position in enumerate(pending):
+        if attempt >= SEMANTIC_MAX_CANDIDATES:
+            return set(pending[attempt:])
+
+        hits = semantic_index.search(
+            normalized_candidates[position],
+            limit=SEMANTIC_TOP_K,
+            min_score=SEMANTIC_MIN_SCORE,
+        )
+        for term_position, similarity in hits:
+            score = round(min(SEMANTIC_MAX_SCORE, similarity), 3)
+            for ordinal in columns.term_to_ordinals.get(columns.term_choices[term_position], ()):
+                _upsert_suggestion(suggestion_maps[position], ordinal, "semantic", score)
+    return set()
+
+
 def match_skill_candidates(
     candidates: list[CandidateSeed],
     skill_db: SkillDb,
     *,
     suggestions_limit: int,
+    semantic_usage: SemanticUsage | None = None,
 ) -> list[MatchedCandidate]:
-    matched_candidates: list[MatchedCandidate] = []
-
-    for index, candidate in enumerate(candidates, start=1):
+    columns = skill_db.columns
+    term_trigrams = columns.term_trigrams()
+    typo_index = columns.typo_index()
+    checksum = skill_db_checksum(skill_db)
+    normalized_candidates: list[str] = []
+    suggestion_maps: list[dict[int, tuple[str, float]]] = []
+    cache_keys: list[SuggestionCacheKey | None] = []
+    cached_suggestions: dict[int, tuple[MatchedSuggestion, ...]] = {}
+    variants_by_position: dict[int, tuple[str, ...]] = {}
+    fuzzy_queries: list[_FuzzyQuery] = []
+    fuzzy_owners: list[int] = []
+
+    for position, candidate in enumerate(candidates):
         normalized_candidate = normalize_token(candidate.raw_skill_text)
+        normalized_candidates.append(normalized_candidate)
+        suggestion_map: dict[int, tuple[str, float]] = {}
+        suggestion_maps.append(suggestion_map)
+
+        # Without a checksum there is no safe way to tell taxonomy versions apart.
+        cache_key = (normalized_candidate, checksum, suggestions_limit) if checksum else None
+        cache_keys.append(cache_key)
+        if cache_key is not None:
+            cached = suggestion_cache.get(cache_key)
+            if cached is not None:
+                cached_suggestions[position] = cached
+                continue
+
         candidate_variants = expand_token_variants(candidate.raw_skill_text)
-        suggestion_map: dict[str, MatchedSuggestion] = {}
-
-        if normalized_candidate and candidate_variants:
-            for token_variant in candidate_variants:
-                for exact_skill in skill_db.by_name.get(token_variant, ()):  # exact name
-                    _upsert_suggestion(
-                        suggestion_map,
-                        MatchedSuggestion(
-                            skill_id=exact_skill.code,
-                            skill_name=exact_skill.name,
-                            match_method="exact",
-                            score=1.0,
-                        ),
-                    )
-
-                for alias_skill in skill_db.by_alias.get(token_variant, ()):  # exact alias
-                    _upsert_suggestion(
-                        suggestion_map,
-                        MatchedSuggestion(
-                            skill_id=alias_skill.code,
-                            skill_name=alias_skill.name,
-                            match_method="synonym",
-                            score=0.95,
-                        ),
-                    )
-
-            fuzzy_variants = sorted(
-                set(candidate_variants),
-                key=lambda item: (-len(item), item),
-            )[:3]
-
-            for fuzzy_variant in fuzzy_variants:
-                threshold = _fuzzy_threshold(fuzzy_variant)
-                if threshold >= 100:
+        if not (normalized_candidate and candidate_variants):
+            continue
+        variants_by_position[position] = candidate_variants
+
+        for token_variant in candidate_variants:
+            for ordinal in columns.by_name.get(token_variant, ()):  # exact name
+                _upsert_suggestion(suggestion_map, ordinal, "exact", 1.0)
+
+            for ordinal in columns.by_alias.get(token_variant, ()):  # exact alias
+                _upsert_suggestion(suggestion_map, ordinal, "synonym", 0.95)
+
+        # Single-token typos ("kubernets") with no exact hit resolve through the
+        # deletion index and skip the WRatio pass, but only when the typo scores
+        # as high as the fuzzy tier would require; weaker ones go through WRatio.
+        typo_hit = False
+        for token_variant in () if suggestion_map else candidate_variants:
+            for key, edits in typo_index.lookup(token_variant):
+                score = min(0.94, 1.0 - edits / max(len(key), len(token_variant)))
+                if score < _fuzzy_threshold(token_variant) / 100.0:
+                    continue
+                for ordinal in (*columns.by_name.get(key, ()), *columns.by_alias.get(key, ())):
+                    _upsert_suggestion(suggestion_map, ordinal, "fuzzy", round(score, 3))
+                    typo_hit = True
+        if typo_hit:
+            continue
+
+        fuzzy_variants = sorted(
+            set(candidate_variants),
+            key=lambda item: (-len(item), item),
+        )[:3]
+
+        for fuzzy_variant in fuzzy_variants:
+            if _fuzzy_threshold(fuzzy_variant) >= 100:
+                continue
+            fuzzy_queries.append(_fuzzy_query(fuzzy_variant, term_trigrams))
+            fuzzy_owners.append(len(suggestion_maps) - 1)
+
+    # Every fuzzy variant in the document is scored in one pass, then fanned back out.
+    fuzzy_results = _score_fuzzy_queries(fuzzy_queries, columns.term_choices)
+
+    for query, owner, fuzzy_matches in zip(fuzzy_queries, fuzzy_owners, fuzzy_results):
+        suggestion_map = suggestion_maps[owner]
+        for term, ratio in fuzzy_matches:
+            normalized_term = normalize_token(term)
+            if not normalized_term:
+                continue
+
+            for ordinal in columns.term_to_ordinals.get(normalized_term, ()):  # fuzzy to skill
+                token_score = fuzz.token_set_ratio(query.variant, normalized_term)
+                combined = max(float(ratio), float(token_score)) / 100.0
+                if combined < query.threshold / 100.0:
                     continue
 
-                fuzzy_matches = process.extract(
-                    fuzzy_variant,
-                    skill_db.term_choices,
-                    scorer=fuzz.WRatio,
-                    limit=80,
-                )
-
-                for term, ratio, _ in fuzzy_matches:
-                    if int(ratio) < threshold:
-                        continue
-
-                    normalized_term = normalize_token(term)
-                    if not normalized_term:
-                        continue
-
-                    for code in skill_db.term_to_codes.get(normalized_term, ()):  # fuzzy to code
-                        skill = skill_db.by_code.get(code)
-                        if skill is None:
-                            continue
-
-                        token_score = fuzz.token_set_ratio(fuzzy_variant, normalized_term)
-                        combined = max(float(ratio), float(token_score)) / 100.0
-                        if combined < threshold / 100.0:
-                            continue
-
-                        _upsert_suggestion(
-                            suggestion_map,
-                            MatchedSuggestion(
-                                skill_id=skill.code,
-                                skill_name=skill.name,
-                                match_method="fuzzy",
-                                score=min(0.94, combined),
-                            ),
-                        )
-
-        suggestions = _dedupe_sorted(suggestion_map.values(), suggestions_limit)
-
-        matched_candidates.append(
-            MatchedCandidate(
-                candidate_id=f"candidate-{index}",
-                raw_skill_text=candidate.raw_skill_text,
-                category=candidate.category,
-                evidence_snippets=candidate.evidence_snippets,
-                confidence=round(max(0.0, min(1.0, candidate.confidence)), 3),
-                suggestions=suggestions,
-                unmapped_candidate=len(suggestions) == 0,
-            )
+                _upsert_suggestion(suggestion_map, ordinal, "fuzzy", min(0.94, combined))
+
+    for position, candidate_variants in variants_by_position.items():
+        suggestion_map = suggestion_maps[position]
+        if suggestion_map:
+            continue
+        for token_variant in candidate_variants:
+            for ordinal in columns.tag_to_ordinals.get(token_variant, ())[:TAG_POSTING_LIMIT]:  # tag
+                _upsert_suggestion(suggestion_map, ordinal, "fuzzy", TAG_MATCH_SCORE)
+
+    usage = semantic_usage if semantic_usage is not None else SemanticUsage()
+    semantic_skipped: set[int] = set()
+    if semantic_matching_enabled():
+        semantic_pending = [
+            position
+            for position, suggestion_map in enumerate(suggestion_maps)
+            if position not in cached_suggestions and not suggestion_map and normalized_candidates[position]
+        ]
+        semantic_skipped = _match_semantic(semantic_pending, normalized_candidates, suggestion_maps, columns)
+        usage.used = usage.used or len(semantic_skipped) < len(semantic_pending)
+        usage.fallback_triggered = usage.fallback_triggered or bool(semantic_skipped)
+
+        # A cached candidate without exact/alias/fuzzy suggestions went through the tier when cached.
+        usage.used = usage.used or any(
+            normalized_candidates[position]
+            and all(item.match_method == "semantic" for item in suggestions)
+            for position, suggestions in cached_suggestions.items()
         )
 
+    matched_candidates: list[MatchedCandidate] = []
+    for index, (candidate, suggestion_map) in enumerate(zip(candidates, suggestion_maps), start=1):
+        suggestions = cached_suggestions.get(index - 1)
+        if suggestions is None:
+            suggestions = _materialize_suggestions(suggestion_map, columns, suggestions_limit)
+            cache_key = cache_keys[index - 1]
+            # Budget-skipped candidates stay uncached so a later request can map them.
+            if cache_key is not None and index - 1 not in semantic_skipped:
+                suggestion_cache.put(cache_key, suggestions)
+
+        matched_candidates.append(_matched_candidate(index, candidate, suggestions))
+
     return matched_candidates
+
+
+def match_document_candidates(
+    documents: list[list[CandidateSeed]],
+    skill_db: SkillDb,
+    *,
+    suggestions_limit: int,
+    semantic_usage: SemanticUsage | None = None,
+) -> list[list[MatchedCandidate]]:
+    """Match several documents' candidates, scoring each normalized candidate text once.
+
+    A CV and a cover letter in one request mostly repeat the same skills, so
+    unique candidates are matched in a single pass and the suggestions are
+    projected back onto every document with its own ``candidate-N`` numbering.
+    """
+
+    unique: dict[str, CandidateSeed] = {}
+    for candidates in documents:
+        for candidate in candidates:
+            unique.setdefault(normalize_token(candidate.raw_skill_text), candidate)
+
+    matched = match_skill_candidates(
+        list(unique.values()),
+        skill_db,
+        suggestions_limit=suggestions_limit,
+        semantic_usage=semantic_usage,
+    )
+    suggestions_by_text = {text: item.suggestions for text, item in zip(unique, matched)}
+
+    return [
+        [
+            _matched_candidate(index, candidate, suggestions_by_text[normalize_token(candidate.raw_skill_text)])
+            for index, candidate in enumerate(candidates, start=1)
+        ]
+        for candidates in documents
+    ]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+
+def _escape_pdf_text(value: str) -> str:
+    ascii_value = value.encode("latin-1", "replace").decode("latin-1")
+    return ascii_value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _page_content(lines: list[str]) -> str:
+    operations = ["BT", "/F1 11 Tf", "14 TL", "72 740 Td"]
+    for line in lines:
+        operations.append(f"({_escape_pdf_text(line)}) Tj T*")
+    operations.append("ET")
+    return "\n".join(operations)
+
+
+def build_text_pdf(pages: list[list[str]]) -> bytes:
+    """Build a small, valid PDF with a Helvetica text layer, one list of lines per page.
+
+    Used for startup warmup and local benchmarks so neither needs binary fixtures.
+    """
+
+    page_count = max(1, len(pages))
+    font_id = 3
+    first_page_id = 4
+    kids = " ".join(f"{first_page_id + idx * 2} 0 R" for idx in range(page_count))
+
+    objects: dict[int, str] = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>",
+        font_id: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for idx in range(page_count):
+        page_id = first_page_id + idx * 2
+        content = _page_content(pages[idx] if idx < len(pages) else [])
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        )
+        objects[page_id + 1] = (
+            f"<< /Length {len(content.encode('latin-1'))} >>\nstream\n{content}\nendstream"
+        )
+
+    return build_pdf(objects)
+
+
+def build_pdf(objects: dict[int, str], *, trailer_entries: str = "") -> bytes:
+    """Serialize numbered object bodies into a PDF with a classic xref table; object 1 is the catalog.
+
+    ``trailer_entries`` is spliced into the trailer dictionary (e.g. an ``/Encrypt`` entry).
+    """
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets: dict[int, int] = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output.extend(f"{object_id} 0 obj\n{objects[object_id]}\nendobj\n".encode("latin-1"))
+
+    xref_offset = len(output)
+    size = max(objects) + 1
+    output.extend(f"xref\n0 {size}\n0000000000 65535 f \n".encode("latin-1"))
+    for object_id in range(1, size):
+        output.extend(f"{offsets[object_id]:010d} 00000 n \n".encode("latin-1"))
+    extra = f" {trailer_entries}" if trailer_entries else ""
+    output.extend(
+        f"trailer\n<< /Size {size} /Root 1 0 R{extra} >>\nstartxref\n{xref_offset}\n%%EOF\n".encode("latin-1")
+    )
+    return bytes(output)
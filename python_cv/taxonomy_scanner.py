@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+# Two-letter keys ("go", "it", "ai") occur as ordinary words in almost every CV,
+# so whole-document spotting leaves them to the skills-section path.
+MIN_SCAN_TERM_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class TaxonomyHit:
+    term: str
+    start: int
+    end: int
+
+
+class TaxonomyAutomaton:
+    """Aho-Corasick automaton over normalized taxonomy terms, with tokens as the alphabet.
+
+    Working on whole tokens keeps the automaton to one node per distinct term
+    prefix and makes every hit token-aligned ("java" never fires inside
+    "javascript"), while a scan stays a single linear pass over the document.
+    """
+
+    __slots__ = ("goto", "fail", "output", "depth", "terms")
+
+    def __init__(
+        self,
+        goto: dict[tuple[int, str], int],
+        fail: Sequence[int],
+        output: Sequence[int],
+        depth: Sequence[int],
+        terms: dict[int, str],
+    ) -> None:
+        self.goto = goto
+        self.fail = fail
+        # Nearest node on the failure chain (the node itself included) that ends a term.
+        self.output = output
+        self.depth = depth
+        self.terms = terms
+
+    @classmethod
+    def build(cls, terms: Iterable[str]) -> TaxonomyAutomaton:
+        goto: dict[tuple[int, str], int] = {}
+        children: list[list[tuple[str, int]]] = [[]]
+        depth = array("I", [0])
+        node_terms: dict[int, str] = {}
+
+        for term in sorted(set(terms)):
+            if len(term) < MIN_SCAN_TERM_LENGTH:
+                continue
+            node = 0
+            for token in term.split():
+                child = goto.get((node, token))
+                if child is None:
+                    child = len(depth)
+                    goto[(node, token)] = child
+                    children[node].append((token, child))
+                    children.append([])
+                    depth.append(depth[node] + 1)
+                node = child
+            if node:
+                node_terms[node] = term
+
+        fail = array("I", [0]) * len(depth)
+        output = array("I", [0]) * len(depth)
+        queue = deque(child for _, child in children[0])
+        for node in queue:
+            if node in node_terms:
+                output[node] = node
+        while queue:
+            node = queue.popleft()
+            for token, child in children[node]:
+                state = fail[node]
+                while state and (state, token) not in goto:
+                    state = fail[state]
+                target = goto.get((state, token), 0)
+                fail[child] = target if target != child else 0
+                output[child] = child if child in node_terms else output[fail[child]]
+                queue.append(child)
+        return cls(goto, fail, output, depth, node_terms)
+
+    @classmethod
+    def from_tables(
+        cls,
+        edges: Iterable[tuple[int, str, int]],
+        fail: Sequence[int],
+        output: Sequence[int],
+        depth: Sequence[int],
+        terms: Iterable[tuple[int, str]],
+    ) -> TaxonomyAutomaton:
+        """Reassemble an automaton from stored ``(parent, token, child)`` edges and node tables.
+
+        Skips the sort and the breadth-first failure-link pass; only the goto
+        dict is rebuilt, since scans probe it once per token.
+        """
+
+        goto = {(parent, token): child for parent, token, child in edges}
+        return cls(goto, fail, output, depth, dict(terms))
+
+    def scan(self, text: str) -> list[TaxonomyHit]:
+        """Leftmost-longest, non-overlapping term hits in normalized ``text``.
+
+        Spans are character offsets into ``text``. Lines are scanned
+        independently so no hit crosses a line break.
+        """
+
+        hits: list[TaxonomyHit] = []
+        offset = 0
+        for line in text.split("\n"):
+            hits.extend(self._scan_line(line, offset))
+            offset += len(line) + 1
+        return hits
+
+    def _scan_line(self, line: str, offset: int) -> list[TaxonomyHit]:
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+
+        starts: list[int] = []
+        matches: list[tuple[int, int, int]] = []
+        state = 0
+        cursor = 0
+        for raw_token in line.split():
+            start = line.index(raw_token, cursor)
+            cursor = start + len(raw_token)
+            starts.append(start)
+            # Normalization keeps dots for "node.js"; a sentence-final one is not part of the term.
+            token = raw_token.rstrip(".")
+            while state and (state, token) not in goto:
+                state = fail[state]
+            state = goto.get((state, token), 0)
+
+            node = output[state]
+            while node:
+                first = len(starts) - self.depth[node]
+                matches.append((first, len(starts) - 1, node))
+                node = output[fail[node]]
+
+        selected: list[TaxonomyHit] = []
+        covered = -1
+        for first, last, node in sorted(matches, key=lambda item: (item[0], -item[1])):
+            if first <= covered:
+                continue
+            covered = last
+            end = starts[last] + len(self.terms[node].rsplit(" ", 1)[-1])
+            selected.append(TaxonomyHit(self.terms[node], offset + starts[first], offset + end))
+        return selected
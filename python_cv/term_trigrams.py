@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from collections.abc import Mapping, Sequence
+
+# A term is shortlisted when it shares at least this fraction of the smaller
+# trigram set with the query. WRatio only reaches the matcher's thresholds
+# (>= 86) when one side is (nearly) contained in the other, token order aside,
+# and a single edit removes at most three trigrams from a token.
+MIN_SHARED_FRACTION = 0.4
+
+
+def term_trigrams(term: str) -> set[str]:
+    """Space-padded per-token character trigrams, so token order does not matter."""
+
+    grams: set[str] = set()
+    for token in term.split():
+        padded = f" {token} "
+        for start in range(len(padded) - 2):
+            grams.add(padded[start : start + 3])
+    return grams
+
+
+class TermTrigramIndex:
+    """Character-trigram inverted index over ``term_choices`` positions.
+
+    ``shortlist`` returns the positions of terms that can plausibly reach a
+    fuzzy threshold, in ascending order so callers that break score ties by
+    position (``process.extract``) see the same order as a full scan.
+    """
+
+    __slots__ = ("postings", "counts")
+
+    def __init__(self, postings: Mapping[str, Sequence[int]], counts: Sequence[int]) -> None:
+        self.postings = postings
+        self.counts = counts
+
+    @classmethod
+    def build(cls, terms: Sequence[str]) -> TermTrigramIndex:
+        postings: dict[str, array] = {}
+        counts = array("I")
+        for position, term in enumerate(terms):
+            grams = term_trigrams(term)
+            counts.append(len(grams))
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                posting.append(position)
+        return cls(postings, counts)
+
+    def shortlist(self, query: str) -> list[int]:
+        grams = term_trigrams(query)
+        if not grams:
+            return []
+
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is not None:
+                shared.update(posting)
+
+        # hits >= fraction * min(query, term) is checked as two cheap comparisons.
+        query_need = len(grams) * MIN_SHARED_FRACTION
+        counts = self.counts
+        return sorted(
+            position
+            for position, hits in shared.items()
+            if hits >= query_need or hits >= counts[position] * MIN_SHARED_FRACTION
+        )
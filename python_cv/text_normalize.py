@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import re
 import unicodedata
+from functools import lru_cache
 
 WHITESPACE_RE = re.compile(r"\s+")
 NON_ALNUM_RE = re.compile(r"[^a-z0-9+.#\-/\s]")
@@ -88,6 +90,22 @@ TOKEN_EXPANSIONS: dict[str, str] = {
 
 TRANSLATION_TABLE = str.maketrans(CONFUSABLES)
 
+NORMALIZE_CACHE_SIZE_ENV = "PYTHON_CV_NORMALIZE_CACHE_SIZE"
+DEFAULT_NORMALIZE_CACHE_SIZE = 16384
+
+
+def _normalize_cache_size_from_env() -> int:
+    raw = os.environ.get(NORMALIZE_CACHE_SIZE_ENV)
+    if not raw:
+        return DEFAULT_NORMALIZE_CACHE_SIZE
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return DEFAULT_NORMALIZE_CACHE_SIZE
+
+
+_NORMALIZE_CACHE_SIZE = _normalize_cache_size_from_env()
+
 
 def normalize_whitespace(value: str) -> str:
     return WHITESPACE_RE.sub(" ", value).strip()
@@ -97,10 +115,21 @@ def _ascii_fold(value: str) -> str:
     return unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
 
 
+def _fold_unicode(value: str) -> str:
+    return _ascii_fold(value.translate(TRANSLATION_TABLE)).casefold()
+
+
+def _fold(value: str) -> str:
+    # Confusables are all non-ASCII and NFKD leaves ASCII untouched, so plain
+    # ASCII input (nearly all CV text) only needs casefolding.
+    if value.isascii():
+        return value.casefold()
+    return _fold_unicode(value)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_token(value: str) -> str:
-    normalized = value.translate(TRANSLATION_TABLE)
-    normalized = _ascii_fold(normalized)
-    normalized = normalized.casefold()
+    normalized = _fold(value)
     normalized = normalized.replace("&", " and ")
     normalized = NON_ALNUM_RE.sub(" ", normalized)
     return WHITESPACE_RE.sub(" ", normalized).strip()
@@ -123,6 +152,7 @@ def _leet_variant(value: str) -> str:
     return " ".join(normalized_tokens)
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def expand_token_variants(value: str) -> tuple[str, ...]:
     base = normalize_token(value)
     if not base:
@@ -153,8 +183,30 @@ def expand_token_variants(value: str) -> tuple[str, ...]:
     return tuple(sorted(variant for variant in variants if variant))
 
 
+def normalize_cache_stats() -> dict[str, dict[str, float]]:
+    stats: dict[str, dict[str, float]] = {}
+    for function in (normalize_token, expand_token_variants):
+        info = function.cache_info()
+        lookups = info.hits + info.misses
+        stats[function.__name__] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize or 0,
+            "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        }
+    return stats
+
+
+def clear_normalize_caches(*_: object) -> None:
+    """Drop memoized normalizations; doubles as a SkillDbReloader swap listener."""
+
+    normalize_token.cache_clear()
+    expand_token_variants.cache_clear()
+
+
 def slugify(value: str) -> str:
-    normalized = _ascii_fold(value.translate(TRANSLATION_TABLE)).casefold()
+    normalized = _fold(value)
     normalized = SLUG_NON_ALNUM_RE.sub("-", normalized)
     normalized = normalized.strip("-")
     return normalized or "skill"
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+
+from rapidfuzz.distance import Levenshtein
+
+MAX_EDIT_DISTANCE = 2
+# Deletes are generated from this many leading characters only (as in SymSpell),
+# which keeps the index small; full-length distances are verified on lookup.
+PREFIX_LENGTH = 7
+
+
+def max_edit_distance(term: str) -> int:
+    """Typo budget by length: none below 5 characters, 1 up to 8, then 2."""
+
+    if len(term) < 5:
+        return 0
+    if len(term) <= 8:
+        return 1
+    return MAX_EDIT_DISTANCE
+
+
+def _deletes(term: str, distance: int) -> set[str]:
+    prefix = term[:PREFIX_LENGTH]
+    variants = {prefix}
+    frontier = {prefix}
+    for _ in range(distance):
+        frontier = {value[:idx] + value[idx + 1 :] for value in frontier for idx in range(len(value))}
+        variants |= frontier
+    return variants
+
+
+class DeletionIndex:
+    """Symmetric-delete (SymSpell-style) index over single-token lookup keys.
+
+    Candidate keys come from a constant number of dictionary probes on the
+    query's own deletes; each is then verified with an exact, cutoff-bounded
+    Levenshtein distance, so no scan over the vocabulary is ever needed.
+    ``keys`` and ``deletes`` may be snapshot-backed tables instead of Python
+    containers.
+    """
+
+    __slots__ = ("keys", "deletes")
+
+    def __init__(self, keys: Sequence[str], deletes: Mapping[str, Sequence[int]]) -> None:
+        self.keys = keys
+        self.deletes = deletes
+
+    @classmethod
+    def build(cls, terms: Iterable[str]) -> DeletionIndex:
+        keys = tuple(sorted({term for term in terms if term and " " not in term}))
+        deletes: dict[str, array] = {}
+        for key_id, key in enumerate(keys):
+            for variant in _deletes(key, max_edit_distance(key)):
+                posting = deletes.get(variant)
+                if posting is None:
+                    posting = deletes[variant] = array("I")
+                posting.append(key_id)
+        return cls(keys, deletes)
+
+    def lookup(self, term: str) -> list[tuple[str, int]]:
+        """Keys within ``max_edit_distance(term)`` edits of ``term``, excluding ``term`` itself."""
+
+        distance = max_edit_distance(term)
+        if distance == 0 or " " in term:
+            return []
+
+        seen: set[int] = set()
+        hits: list[tuple[str, int]] = []
+        for variant in _deletes(term, distance):
+            for key_id in self.deletes.get(variant, ()):
+                if key_id in seen:
+                    continue
+                seen.add(key_id)
+                key = self.keys[key_id]
+                if key == term or abs(len(key) - len(term)) > distance:
+                    continue
+                # Both sides must tolerate the edit, so short keys keep their stricter budget.
+                allowed = min(distance, max_edit_distance(key))
+                if allowed == 0:
+                    continue
+                edits = Levenshtein.distance(term, key, score_cutoff=allowed)
+                if edits <= allowed:
+                    hits.append((key, edits))
+        hits.sort(key=lambda item: (item[1], item[0]))
+        return hits
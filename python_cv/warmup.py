@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from python_cv.pdf_extract import extract_text_from_pdf_bytes, warm_pdf_pool
+from python_cv.service import default_limits, process_skill_documents
+from python_cv.skill_db import SkillDb, skill_db_checksum
+from python_cv.synthetic_pdf import build_text_pdf
+
+# Exercises exact, alias and fuzzy paths (including the typo) so first-call
+# rapidfuzz setup and lazily built indexes are paid before real traffic.
+WARMUP_CV_LINES = [
+    "Jane Example",
+    "Experience",
+    "Senior Engineer at Example Org",
+    "2019 - Present",
+    "Skills",
+    "Python, TypeScript, React.js, Kubernets, PostgreSQL",
+    "Stakeholder management, communication, project delivery",
+    "Languages",
+    "English C2",
+]
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    skill_db_checksum: str | None
+    pdf_chars: int
+    candidate_count: int
+    duration_ms: float
+
+
+def run_warmup(skill_db: SkillDb) -> WarmupResult:
+    started = time.perf_counter()
+    skill_db.columns.build_derived_indexes()
+    warm_pdf_pool()
+
+    extracted = extract_text_from_pdf_bytes(
+        build_text_pdf([WARMUP_CV_LINES]),
+        max_pages=1,
+        max_total_chars=default_limits().max_chars_per_document,
+    )
+    result = process_skill_documents(
+        [
+            {
+                "document_id": "warmup",
+                "file_name": "warmup.pdf",
+                "text": extracted.text,
+                "context": "cv",
+            }
+        ],
+        skill_db,
+        limits=default_limits(),
+        suggestions_limit=None,
+    )
+
+    documents = result["documents"]
+    candidate_count = sum(int(document["candidate_count"]) for document in documents)  # type: ignore[index]
+    return WarmupResult(
+        skill_db_checksum=skill_db_checksum(skill_db),
+        pdf_chars=len(extracted.text),
+        candidate_count=candidate_count,
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
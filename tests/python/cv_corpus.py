@@ -0,0 +1,110 @@
+"""Synthetic CV corpora shared by the bulk, fuzz and normalization tests."""
+
+from __future__ import annotations
+
+from random import Random
+
+
+def _leet_variant(value: str) -> str:
+    return (
+        value.replace("a", "4")
+        .replace("A", "4")
+        .replace("e", "3")
+        .replace("E", "3")
+        .replace("i", "1")
+        .replace("I", "1")
+        .replace("o", "0")
+        .replace("O", "0")
+    )
+
+
+def _confusable_variant(value: str) -> str:
+    return (
+        value.replace("a", "а")
+        .replace("A", "А")
+        .replace("e", "е")
+        .replace("E", "Е")
+        .replace("o", "о")
+        .replace("O", "О")
+    )
+
+
+def mutate_skill_term(value: str, rng: Random) -> str:
+    variant = value
+
+    transform = rng.randrange(8)
+    if transform == 0:
+        variant = value.upper()
+    elif transform == 1:
+        variant = value.lower()
+    elif transform == 2:
+        variant = value.title()
+    elif transform == 3:
+        variant = _leet_variant(value)
+    elif transform == 4:
+        variant = _confusable_variant(value)
+    elif transform == 5:
+        variant = value.replace(".", " ")
+    elif transform == 6:
+        variant = value.replace(" ", "-")
+
+    if rng.random() < 0.35:
+        variant = f"  {variant}  "
+
+    if rng.random() < 0.25 and "/" not in variant:
+        variant = variant.replace(" ", " / ")
+
+    return variant
+
+
+def _mutate_token(value: str, rng: Random) -> str:
+    forms = [
+        value,
+        value.upper(),
+        value.lower(),
+        value.title(),
+        value.replace("a", "а").replace("e", "е").replace("o", "о"),
+        value.replace("i", "1").replace("e", "3").replace("a", "4"),
+    ]
+    chosen = forms[rng.randrange(len(forms))]
+    if rng.random() < 0.25:
+        chosen = f"  {chosen}  "
+    return chosen
+
+
+def build_cv_documents(total: int) -> list[dict[str, str]]:
+    rng = Random(42)
+    pool = [
+        "React.js",
+        "TypeScript",
+        "K8s",
+        "NodeJS",
+        "Postgres",
+        "C++",
+        "CSharp",
+        "Machine Learning",
+    ]
+
+    documents: list[dict[str, str]] = []
+    for index in range(total):
+        count = rng.randint(2, 4)
+        selected = [_mutate_token(pool[rng.randrange(len(pool))], rng) for _ in range(count)]
+        skills_line = ", ".join(selected)
+        text = (
+            "Experience\n"
+            "Senior Engineer at Example Org\n"
+            "2018 - Present\n"
+            "Built and shipped production systems.\n\n"
+            "Skills\n"
+            f"{skills_line}\n"
+            "Communication, leadership, project delivery\n"
+        )
+        documents.append(
+            {
+                "document_id": f"doc-{index + 1}",
+                "file_name": f"cv-{index + 1}.pdf",
+                "text": text,
+                "context": "cv",
+            }
+        )
+    return documents
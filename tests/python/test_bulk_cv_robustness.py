@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from random import Random
 from time import perf_counter
 
+from cv_corpus import build_cv_documents
 from python_cv.service import ImportLimits, process_skill_documents
 from python_cv.skill_db import SkillDb, SkillRecord
 from python_cv.text_normalize import expand_token_variants, normalize_token
@@ -161,62 +161,10 @@ def _build_skill_db() -> SkillDb:
     )
 
 
-def _mutate_token(value: str, rng: Random) -> str:
-    forms = [
-        value,
-        value.upper(),
-        value.lower(),
-        value.title(),
-        value.replace("a", "а").replace("e", "е").replace("o", "о"),
-        value.replace("i", "1").replace("e", "3").replace("a", "4"),
-    ]
-    chosen = forms[rng.randrange(len(forms))]
-    if rng.random() < 0.25:
-        chosen = f"  {chosen}  "
-    return chosen
-
-
-def _build_documents(total: int) -> list[dict[str, str]]:
-    rng = Random(42)
-    pool = [
-        "React.js",
-        "TypeScript",
-        "K8s",
-        "NodeJS",
-        "Postgres",
-        "C++",
-        "CSharp",
-        "Machine Learning",
-    ]
-
-    documents: list[dict[str, str]] = []
-    for index in range(total):
-        count = rng.randint(2, 4)
-        selected = [_mutate_token(pool[rng.randrange(len(pool))], rng) for _ in range(count)]
-        skills_line = ", ".join(selected)
-        text = (
-            "Experience\n"
-            "Senior Engineer at Example Org\n"
-            "2018 - Present\n"
-            "Built and shipped production systems.\n\n"
-            "Skills\n"
-            f"{skills_line}\n"
-            "Communication, leadership, project delivery\n"
-        )
-        documents.append(
-            {
-                "document_id": f"doc-{index + 1}",
-                "file_name": f"cv-{index + 1}.pdf",
-                "text": text,
-                "context": "cv",
-            }
-        )
-    return documents
-
-
 def test_bulk_1000_cv_processing_is_deterministic_and_high_recall():
     db = _build_skill_db()
-    documents = _build_documents(1000)
+    db.columns.build_derived_indexes()  # as warmup does before the service takes traffic
+    documents = build_cv_documents(1000)
     limits = ImportLimits(
         max_documents=1200,
         max_chars_per_document=50000,
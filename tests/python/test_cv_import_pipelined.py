@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from starlette.requests import Request
+
+import api.python.cv_import as cv_import
+from python_cv import pdf_cache as pdf_cache_module
+from python_cv.pdf_cache import PdfExtractionCache
+from python_cv.synthetic_pdf import build_text_pdf
+
+_BOUNDARY = "----pytest-pipelined"
+
+
+def _file_part(file_name: str, payload: bytes, content_type: str = "application/pdf") -> bytes:
+    return (
+        f"--{_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="files"; filename="{file_name}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + payload + b"\r\n"
+
+
+def _field_part(name: str, value: str) -> bytes:
+    return f'--{_BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+
+
+def _request(chunks: list[bytes], gates: dict[int, asyncio.Event] | None = None) -> Request:
+    """A real ASGI request whose body arrives chunk by chunk; chunk N is held back until ``gates[N]`` is set."""
+
+    position = 0
+
+    async def receive():
+        nonlocal position
+        index = position
+        position += 1
+        if gates and index in gates:
+            await asyncio.wait_for(gates[index].wait(), timeout=2)
+        return {"type": "http.request", "body": chunks[index], "more_body": index + 1 < len(chunks)}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/extract",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", f"multipart/form-data; boundary={_BOUNDARY}".encode()),
+            (b"x-python-service-secret", cv_import.LOCAL_DEV_PYTHON_SERVICE_SECRET.encode()),
+        ],
+    }
+    return Request(scope, receive)
+
+
+def _upload_chunks() -> list[bytes]:
+    cv = build_text_pdf([["Jane Example", "Skills", "Python, Kubernetes"]])
+    letter = build_text_pdf([["Cover letter", "Experience", "Built Terraform modules on AWS"]])
+    # document_ids/contexts deliberately trail the files, as some clients send them.
+    return [
+        _file_part("cv.pdf", cv),
+        _file_part("notes.txt", b"plain text", content_type="text/plain"),
+        _file_part("letter.pdf", letter),
+        _field_part("document_ids", "doc-cv")
+        + _field_part("document_ids", "doc-notes")
+        + _field_part("document_ids", "doc-letter")
+        + f"--{_BOUNDARY}--\r\n".encode(),
+    ]
+
+
+def test_pipelined_multipart_matches_buffered_form_parsing(monkeypatch):
+    monkeypatch.setattr(pdf_cache_module, "pdf_cache", PdfExtractionCache(max_bytes=1024 * 1024))
+
+    monkeypatch.delenv("CV_IMPORT_PIPELINED_MULTIPART", raising=False)
+    buffered = json.loads(asyncio.run(cv_import.extract(_request(_upload_chunks()))).body)
+
+    monkeypatch.setenv("CV_IMPORT_PIPELINED_MULTIPART", "1")
+    pipelined = json.loads(asyncio.run(cv_import.extract(_request(_upload_chunks()))).body)
+
+    assert pipelined["documents"] == buffered["documents"]
+    assert [doc["document_id"] for doc in pipelined["documents"]] == ["doc-cv", "doc-letter", "doc-notes"]
+    assert pipelined["documents"][-1]["parse_error"] == "Only PDF files are supported in V1."
+
+
+def test_pipelined_multipart_extracts_earlier_files_while_later_ones_upload(monkeypatch):
+    monkeypatch.setenv("CV_IMPORT_PIPELINED_MULTIPART", "1")
+    monkeypatch.setattr(pdf_cache_module, "pdf_cache", PdfExtractionCache(max_bytes=1024 * 1024))
+    extraction = cv_import.extract_text_from_pdf_bytes_cached
+    chunks = _upload_chunks()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        first_file_parsed = asyncio.Event()
+
+        def extract_and_signal(*args, **kwargs):
+            extracted = extraction(*args, **kwargs)
+            loop.call_soon_threadsafe(first_file_parsed.set)
+            return extracted
+
+        monkeypatch.setattr(cv_import, "extract_text_from_pdf_bytes_cached", extract_and_signal)
+        # cv.pdf is complete once chunk 1 brings the next boundary; the letter is only
+        # delivered after cv.pdf was parsed, which a buffered parser would wait on forever.
+        request = _request(chunks, gates={2: first_file_parsed})
+        response = await cv_import.extract(request)
+        return response.status_code, json.loads(response.body)
+
+    status_code, payload = asyncio.run(scenario())
+
+    assert status_code == 200
+    assert [doc["file_name"] for doc in payload["documents"]] == ["cv.pdf", "letter.pdf", "notes.txt"]
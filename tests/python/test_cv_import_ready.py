@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import api.python.cv_import as cv_import
+from python_cv.skill_db import SkillDb, SkillRecord, SkillDbUnavailableError
+
+
+def _db() -> SkillDb:
+    skill = SkillRecord(
+        code="03.001.001.00001",
+        name="Python",
+        aliases=(),
+        slug="python",
+        cat_id=3,
+        subcat_id=1,
+        l3_id=1,
+        l1_code="T",
+        l2_code="T-LANG",
+        l3_name="Languages",
+        status="active",
+        tags=("python",),
+        search_terms=("python",),
+    )
+    return SkillDb(
+        metadata={"checksum": "warm-checksum"},
+        skills=(skill,),
+        by_code={skill.code: skill},
+        by_name={"python": (skill,)},
+        by_alias={},
+        term_to_codes={"python": (skill.code,)},
+        term_choices=("python",),
+    )
+
+
+def _run_lifespan() -> None:
+    async def _enter() -> None:
+        async with cv_import._lifespan(cv_import.app):
+            pass
+
+    asyncio.run(_enter())
+
+
+def test_ready_flips_only_after_startup_warmup(monkeypatch):
+    readiness = cv_import._Readiness()
+    monkeypatch.setattr(cv_import, "_readiness", readiness)
+    monkeypatch.setattr(cv_import, "active_skill_db", _db)
+
+    assert cv_import.ready().status_code == 503
+
+    _run_lifespan()
+    assert readiness.ready.wait(timeout=30)
+
+    response = cv_import.ready()
+    payload = json.loads(response.body)
+    assert response.status_code == 200
+    assert payload["status"] == "ready"
+    assert payload["skill_db_checksum"] == "warm-checksum"
+    assert readiness.result is not None and readiness.result.candidate_count > 0
+    assert cv_import.health() == {"status": "ok"}
+
+
+def test_ready_reports_failed_warmup(monkeypatch):
+    readiness = cv_import._Readiness()
+    monkeypatch.setattr(cv_import, "_readiness", readiness)
+
+    def _unavailable() -> SkillDb:
+        raise SkillDbUnavailableError("skills_db.json not found")
+
+    monkeypatch.setattr(cv_import, "active_skill_db", _unavailable)
+    stopped = threading.Event()
+    stopped.set()
+    cv_import._run_startup_warmup(stopped)
+
+    response = cv_import.ready()
+    assert response.status_code == 503
+    assert json.loads(response.body) == {"status": "warmup_failed", "error": "skills_db.json not found"}
+
+
+def test_failed_warmup_is_retried_until_ready(monkeypatch):
+    readiness = cv_import._Readiness()
+    monkeypatch.setattr(cv_import, "_readiness", readiness)
+    monkeypatch.setattr(cv_import, "WARMUP_RETRY_INITIAL_SECONDS", 0.01)
+    attempts: list[int] = []
+
+    def _flaky() -> SkillDb:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise SkillDbUnavailableError("shared snapshot never became ready")
+        return _db()
+
+    monkeypatch.setattr(cv_import, "active_skill_db", _flaky)
+    cv_import._run_startup_warmup(threading.Event())
+
+    assert len(attempts) == 3
+    assert cv_import.ready().status_code == 200
+    assert readiness.error is None
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import python_cv.document_view as document_view
+from python_cv.document_view import DocumentView
 from python_cv.entity_extract import extract_all_entities
+from python_cv.skill_candidate_extract import extract_skill_candidates
 
 
 def test_extracts_work_learning_volunteering_and_languages_sections():
@@ -39,3 +42,48 @@ Swedish B2
     language_codes = [item["language_code"] for item in entities["languages"]]
     assert "en" in language_codes
     assert "sv" in language_codes
+
+
+SECTIONED_CV = """
+Experience
+Senior Engineer at Acme
+2021 - Present
+Built platform features.
+
+Education
+University of Stockholm
+Master of Science in Computer Science
+2018 - 2020
+
+Volunteering
+Mentor at Code Club
+2020 - Present
+Supported students.
+
+Languages
+English C2
+Swedish B2
+
+Skills
+Python, Kubernetes
+"""
+
+
+def test_document_view_detects_sections_once_for_all_extractors(monkeypatch):
+    calls: list[str] = []
+    heading_type = document_view._heading_type
+
+    def counting_heading_type(line: str) -> str | None:
+        calls.append(line)
+        return heading_type(line)
+
+    monkeypatch.setattr(document_view, "_heading_type", counting_heading_type)
+
+    view = DocumentView(SECTIONED_CV)
+    entities = extract_all_entities(view)
+    candidates = extract_skill_candidates(view)
+
+    assert len(calls) == len(view.lines)
+    assert view.sections["languages"] == (17, 23)
+    assert entities == extract_all_entities(SECTIONED_CV)
+    assert candidates == extract_skill_candidates(SECTIONED_CV)
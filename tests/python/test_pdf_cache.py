@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+
+import api.python.cv_import as cv_import
+from python_cv import pdf_cache as pdf_cache_module
+from python_cv.pdf_cache import (
+    PdfCacheUsage,
+    PdfExtractionCache,
+    extract_text_from_pdf_bytes_cached,
+    pdf_cache_key,
+)
+from python_cv.pdf_extract import ExtractedPdf
+from python_cv.synthetic_pdf import build_text_pdf
+from upload_fakes import FormRequest, PdfUpload
+
+
+def _extracted(text: str) -> ExtractedPdf:
+    return ExtractedPdf(text=text, total_pages=1, parsed_pages=1, truncated=False)
+
+
+def test_cache_key_covers_content_and_limits():
+    key = pdf_cache_key(b"%PDF-1.4 a", max_pages=4, max_total_chars=30000)
+
+    assert key == pdf_cache_key(b"%PDF-1.4 a", max_pages=4, max_total_chars=30000)
+    assert key != pdf_cache_key(b"%PDF-1.4 b", max_pages=4, max_total_chars=30000)
+    assert key != pdf_cache_key(b"%PDF-1.4 a", max_pages=2, max_total_chars=30000)
+    assert key != pdf_cache_key(b"%PDF-1.4 a", max_pages=4, max_total_chars=1000)
+    assert key != pdf_cache_key(b"%PDF-1.4 a", max_pages=4, max_total_chars=30000, text_mode="fast")
+
+
+def test_memory_tier_evicts_least_recently_used_by_size():
+    cache = PdfExtractionCache(max_bytes=10)
+    cache.put("a", _extracted("aaaa"))
+    cache.put("b", _extracted("bbbb"))
+    assert cache.get("a") is not None
+
+    cache.put("c", _extracted("cccc"))
+    cache.put("huge", _extracted("x" * 11))
+
+    assert cache.get("b") is None
+    assert cache.get("huge") is None
+    assert cache.get("a") == _extracted("aaaa")
+    assert cache.stats()["bytes"] == 8
+
+
+def test_disk_tier_survives_memory_and_is_size_bounded(tmp_path):
+    first = PdfExtractionCache(max_bytes=1024, directory=tmp_path, max_disk_bytes=300)
+    first.put("a", _extracted("alpha"))
+
+    second = PdfExtractionCache(max_bytes=1024, directory=tmp_path, max_disk_bytes=300)
+    assert second.get("a") == _extracted("alpha")
+    assert len(second) == 1
+
+    second.put("b", _extracted("b" * 200))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["b.json"]
+
+
+def test_disk_tier_scans_only_past_the_cap_and_expires_unused_entries(tmp_path, monkeypatch):
+    def make_cache() -> PdfExtractionCache:
+        return PdfExtractionCache(max_bytes=1024, directory=tmp_path, max_disk_bytes=300, max_disk_age_seconds=3600)
+
+    cache = make_cache()
+    scans: list[int] = []
+    evict_disk = cache._evict_disk
+    monkeypatch.setattr(cache, "_evict_disk", lambda: scans.append(1) or evict_disk())
+
+    cache.put("a", _extracted("alpha"))
+    cache.put("b", _extracted("beta"))
+    assert len(scans) == 1  # the first write learns the directory size; the second stays under the cap
+    cache.put("c", _extracted("c" * 200))
+    assert len(scans) == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["c.json"]
+
+    stale = tmp_path / "c.json"
+    os.utime(stale, (stale.stat().st_atime, stale.stat().st_mtime - 7200))
+    assert make_cache().get("c") is None
+    assert not stale.exists()
+
+
+def test_cached_extraction_counts_hits_and_misses(monkeypatch):
+    calls: list[bytes] = []
+
+    def fake_extract(pdf_bytes, *, max_pages, max_total_chars, text_mode=None, page_count=None):
+        calls.append(pdf_bytes)
+        return _extracted("Python")
+
+    monkeypatch.setattr(pdf_cache_module, "extract_text_from_pdf_bytes", fake_extract)
+    cache = PdfExtractionCache(max_bytes=1024)
+    usage = PdfCacheUsage()
+
+    for _ in range(3):
+        extracted = extract_text_from_pdf_bytes_cached(
+            b"%PDF-1.4", max_pages=4, max_total_chars=100, usage=usage, cache=cache
+        )
+
+    assert extracted.text == "Python"
+    assert calls == [b"%PDF-1.4"]
+    assert (usage.hits, usage.misses) == (2, 1)
+
+
+def test_extract_endpoint_reports_pdf_cache_usage(monkeypatch):
+    monkeypatch.setattr(pdf_cache_module, "pdf_cache", PdfExtractionCache(max_bytes=1024 * 1024))
+    pdf_bytes = build_text_pdf([["Jane Example", "Skills", "Python, Kubernetes"]])
+
+    first = json.loads(asyncio.run(cv_import.extract(FormRequest([PdfUpload(pdf_bytes)]))).body)
+    second = json.loads(
+        asyncio.run(cv_import.extract(FormRequest([PdfUpload(pdf_bytes), PdfUpload(pdf_bytes)]))).body
+    )
+
+    assert first["metadata"]["pdf_cache"] == {"hits": 0, "misses": 1}
+    assert second["metadata"]["pdf_cache"] == {"hits": 2, "misses": 0}
+    assert [doc["parsed_text"] for doc in second["documents"]] == [first["documents"][0]["parsed_text"]] * 2
@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+from dataclasses import replace
+
 import pytest
 
-from python_cv.pdf_extract import PdfEmptyTextError, PdfParseError, extract_text_from_pdf_bytes
+from python_cv import pdf_extract
+from python_cv.pdf_extract import (
+    PDF_STREAMING_ENV,
+    PDF_TEXT_MODE_ENV,
+    PDF_WORKERS_ENV,
+    PdfEmptyTextError,
+    PdfParseError,
+    extract_text_from_pdf_bytes,
+    shutdown_pdf_pool,
+)
+from python_cv.synthetic_pdf import build_text_pdf
 
 
 class _FakePdf:
@@ -59,3 +72,91 @@ def test_wraps_parser_errors(monkeypatch):
         extract_text_from_pdf_bytes(b"dummy", max_pages=5, max_total_chars=100)
 
     assert "broken parser" in str(exc.value)
+
+
+def test_process_pool_extraction_matches_in_process_including_truncation(monkeypatch):
+    pages = [[f"Page {page} line {line} Python Kubernetes" for line in range(12)] for page in range(5)]
+    pdf_bytes = build_text_pdf(pages)
+
+    monkeypatch.delenv(PDF_WORKERS_ENV, raising=False)
+    sequential = [
+        extract_text_from_pdf_bytes(pdf_bytes, max_pages=max_pages, max_total_chars=max_chars)
+        for max_pages, max_chars in [(4, 30000), (4, 900), (2, 30000), (10, 30000)]
+    ]
+
+    monkeypatch.setenv(PDF_WORKERS_ENV, "3")
+    try:
+        pooled = [
+            extract_text_from_pdf_bytes(pdf_bytes, max_pages=max_pages, max_total_chars=max_chars)
+            for max_pages, max_chars in [(4, 30000), (4, 900), (2, 30000), (10, 30000)]
+        ]
+        with pytest.raises(PdfParseError):
+            extract_text_from_pdf_bytes(b"not a pdf", max_pages=4, max_total_chars=1000)
+    finally:
+        shutdown_pdf_pool()
+
+    assert pooled == sequential
+    assert sequential[1].truncated is True
+    assert sequential[3].parsed_pages == 5
+
+
+def test_process_pool_only_gets_ranges_for_pages_the_document_has(monkeypatch):
+    submitted: list[tuple[int, int]] = []
+
+    class _InlinePool:
+        def submit(self, function, pdf_bytes, start, stop):
+            submitted.append((start, stop))
+            future: Future = Future()
+            future.set_result(function(pdf_bytes, start, stop))
+            return future
+
+    monkeypatch.setenv(PDF_WORKERS_ENV, "3")
+    monkeypatch.setattr(pdf_extract, "_pdf_pool", lambda workers: _InlinePool())
+    single_page = build_text_pdf([["Python Kubernetes"]])
+    two_pages = build_text_pdf([["Python"], ["Kubernetes"]])
+
+    assert extract_text_from_pdf_bytes(single_page, max_pages=10, max_total_chars=1000).total_pages == 1
+    assert submitted == []
+
+    # The preflight count sizes the ranges; the last one still runs to max_pages.
+    extracted = extract_text_from_pdf_bytes(two_pages, max_pages=10, max_total_chars=1000, page_count=2)
+    assert submitted == [(0, 1), (1, 10)]
+    assert extracted.text == "Python\n\nKubernetes"
+
+
+def test_streaming_extraction_matches_default_and_stops_at_the_character_budget(monkeypatch):
+    pages = [[f"Page {page} line {line} Python Kubernetes" for line in range(12)] for page in range(5)]
+    pdf_bytes = build_text_pdf(pages)
+    limits = [(4, 30000), (4, 900), (2, 30000), (10, 30000)]
+
+    monkeypatch.delenv(PDF_STREAMING_ENV, raising=False)
+    default = [extract_text_from_pdf_bytes(pdf_bytes, max_pages=p, max_total_chars=c) for p, c in limits]
+
+    monkeypatch.setenv(PDF_STREAMING_ENV, "1")
+    streamed = [extract_text_from_pdf_bytes(pdf_bytes, max_pages=p, max_total_chars=c) for p, c in limits]
+
+    for expected, actual in zip(default, streamed):
+        assert replace(actual, page_peak_rss_bytes=()) == expected
+    # One RSS sample per page actually extracted: the 900-char budget runs out on page three.
+    assert [len(extracted.page_peak_rss_bytes) for extracted in streamed] == [4, 3, 2, 5]
+    assert all(rss > 0 for rss in streamed[0].page_peak_rss_bytes)
+
+
+def test_fast_text_mode_matches_layout_mode_and_falls_back_when_empty(monkeypatch):
+    pages = [[f"Page {page} line {line} Python, Kubernetes (AWS) & C++" for line in range(12)] for page in range(5)]
+    pdf_bytes = build_text_pdf(pages)
+    limits = [(4, 30000), (4, 900), (10, 30000)]
+
+    monkeypatch.delenv(PDF_TEXT_MODE_ENV, raising=False)
+    layout = [extract_text_from_pdf_bytes(pdf_bytes, max_pages=p, max_total_chars=c) for p, c in limits]
+    fast = [
+        extract_text_from_pdf_bytes(pdf_bytes, max_pages=p, max_total_chars=c, text_mode="fast") for p, c in limits
+    ]
+    assert fast == layout
+
+    monkeypatch.setenv(PDF_TEXT_MODE_ENV, "fast")
+    monkeypatch.setattr("python_cv.pdf_extract.iter_fast_page_texts", lambda document, max_pages: iter([""]))
+    assert extract_text_from_pdf_bytes(pdf_bytes, max_pages=4, max_total_chars=30000) == layout[0]
+
+    with pytest.raises(ValueError, match="text mode"):
+        extract_text_from_pdf_bytes(pdf_bytes, max_pages=4, max_total_chars=30000, text_mode="ocr")
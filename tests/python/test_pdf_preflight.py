@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+import zlib
+from hashlib import md5
+
+import pytest
+from pdfminer.arcfour import Arcfour
+from pdfminer.pdfdocument import PDFStandardSecurityHandler
+
+import api.python.cv_import as cv_import
+from python_cv import pdf_cache as pdf_cache_module
+from python_cv.pdf_cache import PdfExtractionCache
+from python_cv.pdf_extract import PdfEmptyTextError, PdfEncryptedError, PdfInvalidError, PdfParseError
+from python_cv.pdf_preflight import preflight_pdf, reject_unparseable_pdf
+from python_cv.synthetic_pdf import build_pdf, build_text_pdf
+from upload_fakes import FormRequest, PdfUpload
+
+
+def _image_only_pdf(pages: int = 1) -> bytes:
+    kids = " ".join(f"{3 + idx} 0 R" for idx in range(pages))
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>",
+    }
+    for idx in range(pages):
+        objects[3 + idx] = "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"
+    return build_pdf(objects)
+
+
+def _encrypt_entry(*, opens_without_password: bool) -> str:
+    # RC4-40 standard security handler (R2) with a fixed owner hash and document id.
+    owner, doc_id, permissions = b"\x11" * 32, b"\x22" * 16, -4
+    padding = PDFStandardSecurityHandler.PASSWORD_PADDING
+    key = md5(padding + owner + struct.pack("<l", permissions) + doc_id).digest()[:5]
+    user = Arcfour(key).encrypt(padding) if opens_without_password else b"\x33" * 32
+    return (
+        f"/Encrypt << /Filter /Standard /V 1 /R 2 /O <{owner.hex()}> /U <{user.hex()}> /P {permissions} >> "
+        f"/ID [<{doc_id.hex()}> <{doc_id.hex()}>]"
+    )
+
+
+def _with_xref_stream(pdf_bytes: bytes) -> bytes:
+    # Re-emit a classic-xref PDF with a Flate/PNG-Up compressed xref stream (PDF 1.5 layout).
+    body_end = pdf_bytes.index(b"xref\n")
+    offsets = [0]
+    for object_id in range(1, 100):
+        marker = f"\n{object_id} 0 obj".encode()
+        position = pdf_bytes.find(marker)
+        if position < 0:
+            break
+        offsets.append(position + 1)
+    xref_id = len(offsets)
+    rows = [bytes(4)] + [bytes([1]) + offset.to_bytes(3, "big") for offset in [*offsets[1:], body_end]]
+    previous = bytes(4)
+    filtered = b""
+    for row in rows:
+        filtered += b"\x02" + bytes((value - up) & 0xFF for value, up in zip(row, previous))
+        previous = row
+    payload = zlib.compress(filtered)
+    xref_object = (
+        f"{xref_id} 0 obj\n<< /Type /XRef /Size {xref_id + 1} /Root 1 0 R /W [1 3 0] "
+        f"/Filter /FlateDecode /DecodeParms << /Predictor 12 /Columns 4 >> /Length {len(payload)} >>\nstream\n"
+    ).encode() + payload + b"\nendstream\nendobj\n"
+    return pdf_bytes[:body_end] + xref_object + f"startxref\n{body_end}\n%%EOF\n".encode()
+
+
+def test_preflight_reads_page_count_and_text_layer_from_xref_tables_and_streams():
+    pdf_bytes = build_text_pdf([["Jane Example"], ["Skills"], ["Python"]])
+
+    for candidate in (pdf_bytes, _with_xref_stream(pdf_bytes)):
+        preflight = reject_unparseable_pdf(candidate)
+        assert (preflight.is_pdf, preflight.encrypted, preflight.page_count, preflight.has_fonts) == (
+            True,
+            False,
+            3,
+            True,
+        )
+
+    assert preflight_pdf(_image_only_pdf(2)).page_count == 2
+    # Unreadable structure is left for the full parser rather than guessed at.
+    assert preflight_pdf(pdf_bytes.replace(b"startxref", b"startxrex")).page_count is None
+
+
+def test_preflight_stops_inflating_object_streams_at_the_cap():
+    bomb = zlib.compress(b"0" * (64 * 1024 * 1024), 9)
+    pdf_bytes = _image_only_pdf(1)
+    body_end = pdf_bytes.index(b"xref\n")
+    stream = (
+        f"9 0 obj\n<< /Type /ObjStm /N 1 /First 4 /Filter /FlateDecode /Length {len(bomb)} >>\nstream\n"
+    ).encode() + bomb + b"\nendstream\nendobj\n"
+    # The xref no longer matches the shifted body, which is fine: fonts are a byte search.
+    preflight = preflight_pdf(pdf_bytes[:body_end] + stream + pdf_bytes[body_end:])
+
+    assert preflight.has_fonts is None
+
+
+def test_preflight_rejects_with_precise_errors_before_any_parse(monkeypatch):
+    def _no_full_parse(*_args, **_kwargs):
+        raise AssertionError("preflight must not run pdfplumber")
+
+    monkeypatch.setattr("pdfplumber.open", _no_full_parse)
+
+    with pytest.raises(PdfInvalidError, match="missing %PDF header"):
+        reject_unparseable_pdf(b"PK\x03\x04 definitely a zip")
+    with pytest.raises(PdfInvalidError, match="no pages"):
+        reject_unparseable_pdf(_image_only_pdf(0))
+    with pytest.raises(PdfEmptyTextError):
+        reject_unparseable_pdf(_image_only_pdf(2))
+
+    locked = build_text_pdf([["Python"]]).replace(
+        b"/Root 1 0 R >>", f"/Root 1 0 R {_encrypt_entry(opens_without_password=False)} >>".encode()
+    )
+    with pytest.raises(PdfEncryptedError):
+        reject_unparseable_pdf(locked)
+
+    # Permission-only encryption opens with the empty user password and must reach the parser.
+    restricted = build_pdf(
+        {
+            1: "<< /Type /Catalog /Pages 2 0 R >>",
+            2: "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            3: "<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 4 0 R >> >> >>",
+            4: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        },
+        trailer_entries=_encrypt_entry(opens_without_password=True),
+    )
+    assert reject_unparseable_pdf(restricted).encrypted is True
+
+
+def test_extract_endpoint_reports_preflight_error_codes(monkeypatch):
+    monkeypatch.setattr(pdf_cache_module, "pdf_cache", PdfExtractionCache(max_bytes=1024 * 1024))
+    uploads = [PdfUpload(b"PK\x03\x04 zip"), PdfUpload(_image_only_pdf()), PdfUpload(build_text_pdf([["Python"]]))]
+
+    payload = json.loads(asyncio.run(cv_import.extract(FormRequest(uploads))).body)
+
+    assert [doc["parse_error_code"] for doc in payload["documents"]] == [
+        None,
+        cv_import.ERROR_CODE_PDF_INVALID,
+        cv_import.ERROR_CODE_PDF_EMPTY_TEXT,
+    ]
+
+
+def test_full_parse_failures_keep_the_generic_error_code(monkeypatch):
+    def _locked_parse(*_args, **_kwargs):
+        raise PdfParseError("Password is incorrect")
+
+    monkeypatch.setattr(cv_import, "extract_text_from_pdf_bytes_cached", _locked_parse)
+    uploads = [PdfUpload(b"PK\x03\x04 zip"), PdfUpload(build_text_pdf([["Python"]]))]
+
+    payload = json.loads(asyncio.run(cv_import.extract(FormRequest(uploads))).body)
+
+    # Only preflight rejections carry the new codes; the parser's message still picks the wording.
+    assert [(doc["parse_error_code"], "encrypted" in (doc["parse_error"] or "")) for doc in payload["documents"]] == [
+        (cv_import.ERROR_CODE_PDF_INVALID, False),
+        (cv_import.ERROR_CODE_PDF_PARSE_FAILED, True),
+    ]
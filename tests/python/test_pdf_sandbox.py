@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+from python_cv.pdf_extract import (
+    PDF_DEADLINE_SECONDS_ENV,
+    PDF_SANDBOX_ENV,
+    PdfResourceLimitError,
+    extract_text_from_pdf_bytes,
+    shutdown_pdf_pool,
+)
+from python_cv.pdf_sandbox import SandboxLimitError, SandboxPool
+from python_cv.synthetic_pdf import build_text_pdf
+
+_MB = 1024 * 1024
+
+
+def _hold_memory(megabytes: int) -> int:
+    ballast = b"x" * (megabytes * _MB)
+    time.sleep(5)
+    return len(ballast)
+
+
+def _fail() -> None:
+    raise ValueError("broken parser")
+
+
+def test_sandbox_kills_and_respawns_on_deadline_and_memory_breaches():
+    pool = SandboxPool(1)
+    limits = {"deadline_seconds": 2.0, "max_rss_bytes": 200 * _MB}
+    try:
+        first_pid = pool.run(os.getpid, **limits)
+
+        with pytest.raises(SandboxLimitError, match="deadline"):
+            pool.run(time.sleep, 5, deadline_seconds=0.2, max_rss_bytes=200 * _MB)
+        second_pid = pool.run(os.getpid, **limits)
+
+        with pytest.raises(SandboxLimitError, match="memory"):
+            pool.run(_hold_memory, 400, **limits)
+        third_pid = pool.run(os.getpid, **limits)
+
+        with pytest.raises(ValueError, match="broken parser"):
+            pool.run(_fail, **limits)
+        assert pool.run(os.getpid, **limits) == third_pid
+    finally:
+        pool.shutdown()
+
+    assert len({first_pid, second_pid, third_pid}) == 3
+
+
+def test_sandbox_pool_wait_counts_against_the_deadline():
+    pool = SandboxPool(1)
+    limits = {"deadline_seconds": 10.0, "max_rss_bytes": 200 * _MB}
+    try:
+        pool.run(os.getpid, **limits)
+        busy = threading.Thread(target=pool.run, args=(time.sleep, 1.5), kwargs=limits)
+        busy.start()
+        time.sleep(0.2)
+
+        started = time.monotonic()
+        with pytest.raises(SandboxLimitError, match="No PDF worker became free"):
+            pool.run(os.getpid, deadline_seconds=0.3, max_rss_bytes=200 * _MB)
+        assert time.monotonic() - started < 1.0
+
+        busy.join()
+        assert pool.run(os.getpid, **limits) > 0
+    finally:
+        pool.shutdown()
+
+
+def test_sandboxed_extraction_maps_breaches_to_resource_limit_errors(monkeypatch):
+    pdf_bytes = build_text_pdf([["Jane Example", "Skills", "Python, Kubernetes"]])
+    expected = extract_text_from_pdf_bytes(pdf_bytes, max_pages=4, max_total_chars=1000)
+
+    monkeypatch.setenv(PDF_SANDBOX_ENV, "1")
+    try:
+        # A cold worker cannot even import pdfplumber within a millisecond.
+        monkeypatch.setenv(PDF_DEADLINE_SECONDS_ENV, "0.001")
+        with pytest.raises(PdfResourceLimitError):
+            extract_text_from_pdf_bytes(pdf_bytes, max_pages=4, max_total_chars=1000)
+
+        monkeypatch.delenv(PDF_DEADLINE_SECONDS_ENV)
+        assert extract_text_from_pdf_bytes(pdf_bytes, max_pages=4, max_total_chars=1000) == expected
+    finally:
+        shutdown_pdf_pool()
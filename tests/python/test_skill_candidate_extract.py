@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from python_cv.skill_candidate_extract import extract_skill_candidates
+from python_cv.taxonomy_scanner import TaxonomyAutomaton
 
 
 def test_fallback_skill_candidate_scan_normalizes_each_line_once():
@@ -15,3 +16,95 @@ def test_fallback_skill_candidate_scan_normalizes_each_line_once():
     raw_values = {candidate.raw_skill_text for candidate in candidates}
 
     assert "Kubernetes" in raw_values
+
+
+def test_taxonomy_automaton_spots_token_aligned_longest_hits():
+    automaton = TaxonomyAutomaton.build(["java", "javascript", "react", "react native", "machine learning", "go"])
+
+    hits = automaton.scan("react native in javascript\ngo and machine learning with java.")
+
+    assert [(hit.term, hit.start, hit.end) for hit in hits] == [
+        ("react native", 0, 12),
+        ("javascript", 16, 26),
+        ("machine learning", 34, 50),
+        ("java", 56, 60),
+    ]
+
+
+def test_documents_without_skills_heading_use_taxonomy_hits():
+    automaton = TaxonomyAutomaton.build(["react native", "node.js", "machine learning", "aws"])
+    text = """
+    Jane Doe
+    Engineer at Example Org, 2019 - Present
+    Built React Native apps backed by Node.js services.
+    Machine learning pipelines on AWS; migrated billing to AWS.
+    """
+
+    candidates = extract_skill_candidates(text, taxonomy=automaton)
+
+    by_text = {candidate.raw_skill_text: candidate for candidate in candidates}
+    assert set(by_text) == {"react native", "node.js", "machine learning", "aws"}
+    assert by_text["aws"].confidence == 0.7
+    assert by_text["node.js"].confidence == 0.66
+    assert by_text["react native"].evidence_snippets == ("Built React Native apps backed by Node.js services.",)
+
+
+def test_section_ngrams_are_gated_on_taxonomy_vocabulary():
+    text = """
+    Skills
+    Python scripting, nightly ETL jobs
+    """
+
+    ungated = {candidate.raw_skill_text for candidate in extract_skill_candidates(text)}
+    gated = {
+        candidate.raw_skill_text
+        for candidate in extract_skill_candidates(text, vocabulary={"python", "etl", "jobs", "nightly"})
+    }
+
+    assert "scripting nightly" in ungated
+    assert gated == {
+        "Python scripting",
+        "nightly ETL jobs",
+        "python",
+        "nightly",
+        "nightly etl",
+        "etl",
+        "etl jobs",
+        "jobs",
+    }
+
+
+def test_vocabulary_gate_keeps_tokens_known_only_through_expansions():
+    text = """
+    Skills
+    py tooling, k8s operators
+    """
+
+    gated = {
+        candidate.raw_skill_text
+        for candidate in extract_skill_candidates(text, vocabulary={"python", "kubernetes", "operators"})
+    }
+
+    assert {"py", "k8s", "k8s operators"} <= gated
+    assert "tooling" not in gated
+
+
+def test_ngram_generation_stops_once_listed_skills_fill_the_page(monkeypatch):
+    import python_cv.skill_candidate_extract as skill_candidate_extract
+
+    pulled: list[str] = []
+    extract_ngrams = skill_candidate_extract._extract_ngrams_from_line
+
+    def counting_ngrams(*args, **kwargs):
+        for ngram in extract_ngrams(*args, **kwargs):
+            pulled.append(ngram)
+            yield ngram
+
+    monkeypatch.setattr(skill_candidate_extract, "_extract_ngrams_from_line", counting_ngrams)
+    text = "Skills\nPython, Go, Rust\nKafka, Redis"
+
+    candidates = extract_skill_candidates(text, max_candidates=5)
+
+    assert pulled == ["python"]
+
+    assert [candidate.raw_skill_text for candidate in candidates] == ["Go", "Kafka", "Python", "Redis", "Rust"]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import replace
+
+from python_cv.skill_db import SkillColumns, SkillDb, SkillRecord, build_skill_indexes
+
+
+def _records() -> tuple[SkillRecord, ...]:
+    return (
+        SkillRecord(
+            code="03.001.001.00001",
+            name="React",
+            aliases=("React.js",),
+            slug="react",
+            cat_id=3,
+            subcat_id=1,
+            l3_id=1,
+            l1_code="T",
+            l2_code="T-WEB",
+            l3_name="Frontend",
+            status="active",
+            tags=("react",),
+            search_terms=("react", "react js"),
+        ),
+        SkillRecord(
+            code="06.002.004.00002",
+            name="Data Modelling",
+            aliases=(),
+            slug="data-modelling",
+            cat_id=None,
+            subcat_id=None,
+            l3_id=None,
+            l1_code=None,
+            l2_code=None,
+            l3_name=None,
+            status="active",
+            tags=(),
+            search_terms=("data modelling",),
+        ),
+    )
+
+
+def test_columns_address_skills_by_ordinal_and_materialize_records_on_demand():
+    skills = _records()
+    columns = SkillColumns.from_records(skills, build_skill_indexes(skills))
+    db = SkillDb.from_columns({"source_mode": "test"}, columns)
+
+    assert len(columns) == 2
+    assert columns.codes[1] == "06.002.004.00002"
+    assert isinstance(columns.term_to_ordinals["react js"], array)
+    assert list(columns.by_alias["react js"]) == [0]
+
+    assert list(db.skills) == list(skills)
+    assert db.by_code["06.002.004.00002"] == skills[1]
+    assert db.by_name["react"] == (skills[0],)
+    assert db.term_to_codes["data modelling"] == ("06.002.004.00002",)
+    assert db.by_alias.get("missing") is None
+
+
+def test_hand_assembled_skill_db_derives_columns_from_record_fields():
+    skills = _records()
+    db = SkillDb(
+        metadata={},
+        skills=skills,
+        by_code={skill.code: skill for skill in skills},
+        by_name={"react": (skills[0],)},
+        by_alias={"react js": (skills[0],)},
+        term_to_codes={"react": (skills[0].code,), "unknown": ("99.999.999.99999",)},
+        term_choices=("unknown", "react"),
+    )
+
+    assert list(db.columns.by_name["react"]) == [0]
+    assert list(db.columns.term_to_ordinals["unknown"]) == []
+    assert tuple(db.columns.term_choices) == ("unknown", "react")
+
+
+def test_hierarchy_tags_are_indexed_apart_from_search_terms():
+    skills = (
+        replace(
+            _records()[0],
+            tags=("t", "t-web", "frontend", "react"),
+            search_terms=("react", "react js", "t", "t-web", "frontend"),
+        ),
+        replace(_records()[1], tags=("t", "frontend")),
+    )
+    indexes = build_skill_indexes(skills)
+
+    assert not {"t", "t web", "frontend"} & set(indexes.term_to_ordinals)
+    assert indexes.term_to_ordinals["react"] == [0]
+    assert indexes.tag_to_ordinals["frontend"] == [0, 1]
+    assert indexes.tag_to_ordinals["t web"] == [0]
+    assert "t" not in indexes.tag_to_ordinals
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+
+from python_cv import skill_db
+from python_cv import skill_db_reload
+from python_cv.skill_db_reload import SkillDbReloader
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _write_db(path, checksum: str, names: list[str]) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "metadata": {"checksum": checksum},
+                "skills": [
+                    {"code": f"03.001.001.{idx:05d}", "name": name, "slug": name.lower()}
+                    for idx, name in enumerate(names, start=1)
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_reloader_swaps_in_rebuilt_db_without_blocking_current_readers(tmp_path, monkeypatch):
+    db_path = tmp_path / "skills_db.json"
+    _write_db(db_path, "checksum-a", ["React"])
+    monkeypatch.setenv("PYTHON_CV_SKILLS_DB_PATH", str(db_path))
+    monkeypatch.setattr(skill_db, "_cached_skill_db", None)
+
+    clock = _Clock()
+    reloader = SkillDbReloader(interval_seconds=5, path_resolver=lambda: db_path, clock=clock)
+    swapped: list[str | None] = []
+    reloader.add_swap_listener(lambda db: swapped.append(skill_db.skill_db_checksum(db)))
+
+    first = reloader.current()
+    assert reloader.active_checksum == "checksum-a"
+
+    _write_db(db_path, "checksum-b", ["React", "Kubernetes"])
+    assert reloader.current() is first  # interval not yet elapsed
+
+    clock.now += 10
+    in_flight = reloader.current()
+    assert in_flight is first
+    assert reloader.wait(timeout=10)
+
+    second = reloader.current()
+    assert second is not first
+    assert reloader.active_checksum == "checksum-b"
+    assert len(second.skills) == 2
+    assert len(in_flight.skills) == 1
+    assert swapped == ["checksum-b"]
+
+
+def test_reloader_keeps_active_db_when_checksum_is_unchanged_or_source_is_broken(tmp_path, monkeypatch):
+    db_path = tmp_path / "skills_db.json"
+    _write_db(db_path, "checksum-a", ["React"])
+    monkeypatch.setenv("PYTHON_CV_SKILLS_DB_PATH", str(db_path))
+    monkeypatch.setattr(skill_db, "_cached_skill_db", None)
+
+    clock = _Clock()
+    reloader = SkillDbReloader(interval_seconds=5, path_resolver=lambda: db_path, clock=clock)
+    first = reloader.current()
+
+    _write_db(db_path, "checksum-a", ["React", "Same checksum"])
+    clock.now += 10
+    reloader.current()
+    assert reloader.wait(timeout=10)
+    assert reloader.current() is first
+
+    db_path.write_text("{not json", encoding="utf-8")
+    clock.now += 10
+    reloader.current()
+    assert reloader.wait(timeout=10)
+    assert reloader.current() is first
+    assert reloader.last_error
+    assert reloader.swap_count == 0
+
+
+def test_reloader_loads_from_its_resolver_and_default_swaps_refresh_load_skill_db(tmp_path, monkeypatch):
+    env_path = tmp_path / "env_skills_db.json"
+    resolved_path = tmp_path / "resolved_skills_db.json"
+    _write_db(env_path, "checksum-env", ["React"])
+    _write_db(resolved_path, "checksum-resolved", ["React", "Kubernetes"])
+    monkeypatch.setenv("PYTHON_CV_SKILLS_DB_PATH", str(env_path))
+    monkeypatch.setattr(skill_db, "_cached_skill_db", None)
+
+    reloader = SkillDbReloader(interval_seconds=5, path_resolver=lambda: resolved_path, clock=_Clock())
+    reloader.current()
+    assert reloader.active_checksum == "checksum-resolved"
+
+    clock = _Clock()
+    monkeypatch.setattr(skill_db_reload, "_reloader", None)
+    monkeypatch.setattr(skill_db_reload, "SkillDbReloader", lambda: SkillDbReloader(interval_seconds=5, clock=clock))
+    default_reloader = skill_db_reload.get_skill_db_reloader()
+    default_reloader.current()
+    assert skill_db.skill_db_checksum(skill_db.load_skill_db()) == "checksum-env"
+
+    _write_db(env_path, "checksum-env-b", ["React", "Kubernetes"])
+    clock.now += 10
+    default_reloader.current()
+    assert default_reloader.wait(timeout=10)
+    assert skill_db.skill_db_checksum(skill_db.load_skill_db()) == "checksum-env-b"
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+from python_cv import skill_db, skill_db_shm
+from python_cv.skill_db_shm import SharedMemory, open_shared_snapshot, segment_name
+from python_cv.skill_db_snapshot import SkillDbSnapshot
+
+
+def _write_snapshot(tmp_path, checksum: str):
+    payload = {
+        "metadata": {"checksum": checksum},
+        "skills": [
+            {"code": "03.001.001.00001", "name": "React", "slug": "react", "aliases": ["ReactJS"]},
+            {"code": "03.001.001.00002", "name": "Kubernetes", "slug": "kubernetes", "aliases": ["K8s"]},
+        ],
+    }
+    path = tmp_path / f"{checksum}.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    snapshot_path = skill_db.snapshot_path_for(path)
+    skill_db.write_skill_db_snapshot(snapshot_path, payload)
+    return snapshot_path
+
+
+def _read_codes_in_child(snapshot_path, queue) -> None:
+    snapshot = open_shared_snapshot(snapshot_path)
+    db = skill_db.SkillDb.from_columns(snapshot.metadata, skill_db.SkillColumns.from_snapshot(snapshot))
+    queue.put((snapshot.source, [skill.code for skill in db.by_alias["k8s"]]))
+
+
+@pytest.fixture()
+def shm_prefix(monkeypatch):
+    prefix = f"pcvt{uuid.uuid4().hex[:6]}"
+    monkeypatch.setenv(skill_db_shm.SHARED_MEMORY_ENV, "1")
+    monkeypatch.setenv(skill_db_shm.SHARED_MEMORY_PREFIX_ENV, prefix)
+    yield prefix
+    for name in list(skill_db_shm._published):
+        shm = skill_db_shm._published.pop(name)
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def test_workers_attach_to_one_published_segment(tmp_path, shm_prefix):
+    snapshot_path = _write_snapshot(tmp_path, "a" * 64)
+    name = segment_name(SkillDbSnapshot.open(snapshot_path))
+
+    published = skill_db._load_from_snapshot(snapshot_path)
+    assert name.startswith(f"{shm_prefix}-v")
+    assert name in skill_db_shm._published
+
+    queue: multiprocessing.Queue = multiprocessing.get_context("spawn").Queue()
+    child = multiprocessing.get_context("spawn").Process(target=_read_codes_in_child, args=(snapshot_path, queue))
+    child.start()
+    source, codes = queue.get(timeout=60)
+    child.join(timeout=60)
+
+    assert source == f"shm:{name}"
+    assert codes == ["03.001.001.00002"]
+    assert [skill.code for skill in published.by_name["react"]] == ["03.001.001.00001"]
+
+
+def test_publishing_a_new_version_retires_the_previous_segment(tmp_path, shm_prefix):
+    old_path = _write_snapshot(tmp_path, "b" * 64)
+    old_db = skill_db._load_from_snapshot(old_path)
+    skill_db._load_from_snapshot(_write_snapshot(tmp_path, "c" * 64))
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=segment_name(SkillDbSnapshot.open(old_path)), create=False)
+    # Requests still holding the previous version keep reading their mapping.
+    assert old_db.by_code["03.001.001.00001"].name == "React"
+
+
+def test_publishing_leaves_segments_published_by_other_processes(tmp_path, shm_prefix):
+    # e.g. a canary serving another taxonomy version under the same prefix.
+    foreign = SharedMemory(name=f"{shm_prefix}-v1-foreign", create=True, size=4096)
+    skill_db_shm._untrack(foreign)
+    try:
+        skill_db._load_from_snapshot(_write_snapshot(tmp_path, "e" * 64))
+
+        attached = SharedMemory(name=foreign.name, create=False)
+        skill_db_shm._untrack(attached)
+        attached.close()
+    finally:
+        foreign.close()
+        foreign.unlink()
+
+
+def test_segment_abandoned_mid_copy_is_replaced(tmp_path, shm_prefix):
+    snapshot_path = _write_snapshot(tmp_path, "d" * 64)
+    name = segment_name(SkillDbSnapshot.open(snapshot_path))
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+
+    # A creator that died after sizing the segment but before flipping it ready.
+    abandoned = SharedMemory(name=name, create=True, size=4096)
+    skill_db_shm._untrack(abandoned)
+    skill_db_shm._SEGMENT_HEADER.pack_into(abandoned.buf, 0, 0, dead.pid, 4000, 0.0)
+    abandoned.close()
+
+    snapshot = open_shared_snapshot(snapshot_path, wait_seconds=0.5)
+
+    assert snapshot.source == f"shm:{name}"
+    assert name in skill_db_shm._published
+    assert skill_db.SkillColumns.from_snapshot(snapshot).names[0] == "React"
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from python_cv import skill_db
+from python_cv.skill_db_snapshot import SnapshotIndex
+from python_cv.skill_candidate_extract import CandidateSeed
+from python_cv.skill_matcher import match_skill_candidates
+
+
+def _payload() -> dict[str, object]:
+    return {
+        "metadata": {"source_mode": "test", "checksum": "abc123"},
+        "skills": [
+            {
+                "code": "03.001.001.00001",
+                "name": "React",
+                "aliases": ["React.js", "ReactJS"],
+                "slug": "react",
+                "cat_id": 3,
+                "subcat_id": 1,
+                "l3_id": 1,
+                "l1_code": "T",
+                "l2_code": "T-WEB",
+                "l3_name": "Frontend",
+                "status": "active",
+                "tags": ["t", "t-web", "frontend"],
+                "search_terms": ["react", "react js", "frontend"],
+            },
+            {
+                "code": "03.001.001.00002",
+                "name": "Node.js",
+                "aliases": ["NodeJS"],
+                "slug": "node-js",
+                "cat_id": 3,
+                "subcat_id": None,
+                "l3_id": None,
+                "l1_code": None,
+                "l2_code": None,
+                "l3_name": None,
+                "status": "active",
+                "tags": [],
+                "search_terms": ["node.js", "nodejs"],
+            },
+            {
+                "code": "05.002.003.00003",
+                "name": "Stakeholder Management",
+                "aliases": [],
+                "slug": "stakeholder-management",
+                "cat_id": 5,
+                "subcat_id": 2,
+                "l3_id": 3,
+                "l1_code": "M",
+                "l2_code": "M-PEOPLE",
+                "l3_name": "Leadership",
+                "status": "active",
+                "tags": ["m"],
+                "search_terms": ["stakeholder management", "m"],
+            },
+        ],
+    }
+
+
+@pytest.fixture()
+def db_paths(tmp_path, monkeypatch):
+    json_path = tmp_path / "skills_db.json"
+    json_path.write_text(json.dumps(_payload()), encoding="utf-8")
+    snapshot_path = skill_db.snapshot_path_for(json_path)
+    skill_db.write_skill_db_snapshot(snapshot_path, _payload())
+
+    monkeypatch.setenv("PYTHON_CV_SKILLS_DB_PATH", str(json_path))
+    monkeypatch.setattr(skill_db, "_cached_skill_db", None)
+    return json_path, snapshot_path
+
+
+def test_snapshot_matches_json_loader(db_paths):
+    json_path, snapshot_path = db_paths
+
+    from_json = skill_db._load_from_json(json_path)
+    from_snapshot = skill_db._load_from_snapshot(snapshot_path)
+
+    assert from_snapshot.metadata == from_json.metadata
+    assert list(from_snapshot.skills) == list(from_json.skills)
+    assert tuple(from_snapshot.term_choices) == tuple(from_json.term_choices)
+    for field in ("by_code", "by_name", "by_alias", "term_to_codes"):
+        expected = getattr(from_json, field)
+        actual = getattr(from_snapshot, field)
+        assert len(actual) == len(expected)
+        assert {key: actual[key] for key in actual} == dict(expected)
+    assert from_snapshot.by_name.get("missing") is None
+    assert from_snapshot.columns.term_vocabulary() == from_json.columns.term_vocabulary()
+    assert from_json.columns.semantic_index_if_built() is None
+    shipped = from_snapshot.columns.semantic_index_if_built()
+    assert isinstance(shipped.weights, memoryview)
+    for query in ("reactjs developer", "node js", "stakeholder managing"):
+        assert shipped.search(query, limit=5, min_score=0.3) == from_json.columns.semantic_index().search(
+            query, limit=5, min_score=0.3
+        )
+
+
+def test_load_skill_db_prefers_fresh_snapshot_and_matches_identically(db_paths):
+    json_path, snapshot_path = db_paths
+
+    loaded = skill_db.load_skill_db(force_reload=True)
+    assert isinstance(loaded.columns.by_name, SnapshotIndex)
+    assert isinstance(loaded.columns.term_trigrams().postings, SnapshotIndex)
+    assert isinstance(loaded.columns.typo_index().deletes, SnapshotIndex)
+    assert isinstance(loaded.columns.taxonomy_automaton().fail, memoryview)
+
+    candidates = [
+        CandidateSeed(
+            raw_skill_text=text,
+            evidence_snippets=(f"Used {text}",),
+            confidence=0.8,
+            category="technical",
+        )
+        for text in ("ReactJS", "node js", "Stakeholder Managment", "Reakt")
+    ]
+    from_json = skill_db._load_from_json(json_path)
+
+    assert match_skill_candidates(candidates, loaded, suggestions_limit=5) == match_skill_candidates(
+        candidates, from_json, suggestions_limit=5
+    )
+
+
+def test_load_skill_db_ignores_stale_or_corrupt_snapshot(db_paths):
+    json_path, snapshot_path = db_paths
+
+    stat = json_path.stat()
+    os.utime(snapshot_path, (stat.st_atime, stat.st_mtime - 10))
+    assert not isinstance(skill_db.load_skill_db(force_reload=True).columns.by_name, SnapshotIndex)
+
+    snapshot_path.write_bytes(b"not a snapshot")
+    assert len(skill_db.load_skill_db(force_reload=True).skills) == 3
+
+
+def test_current_schema_json_loads_prebuilt_indexes_without_normalizing(tmp_path, monkeypatch):
+    legacy_path = tmp_path / "legacy.json"
+    legacy_path.write_text(json.dumps(_payload()), encoding="utf-8")
+    legacy = skill_db._load_from_json(legacy_path)
+
+    skills = skill_db.skills_from_records(_payload()["skills"])
+    payload = _payload()
+    payload["metadata"]["schema_version"] = skill_db.SKILL_DB_SCHEMA_VERSION
+    payload["indexes"] = skill_db.serialize_skill_indexes(skills, skill_db.build_skill_indexes(skills))
+    current_path = tmp_path / "current.json"
+    current_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    def _fail(_value):
+        raise AssertionError("prebuilt-index loads must not re-run token normalization")
+
+    monkeypatch.setattr(skill_db, "expand_token_variants", _fail)
+    monkeypatch.setattr(skill_db, "normalize_token", _fail)
+    current = skill_db._load_from_json(current_path)
+
+    assert list(current.skills) == list(legacy.skills)
+    assert tuple(current.term_choices) == tuple(legacy.term_choices)
+    for field in ("by_code", "by_name", "by_alias", "term_to_codes"):
+        assert dict(getattr(current, field)) == dict(getattr(legacy, field))
+    assert {key: list(value) for key, value in current.columns.tag_to_ordinals.items()} == {
+        key: list(value) for key, value in legacy.columns.tag_to_ordinals.items()
+    }
+    # The legacy record still lists its "frontend" tag in search_terms; it is split out.
+    assert "frontend" not in legacy.term_to_codes
+    assert list(legacy.columns.tag_to_ordinals["frontend"]) == [0]
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
+from rapidfuzz import fuzz
+
+from python_cv import skill_matcher
 from python_cv.skill_candidate_extract import CandidateSeed
 from python_cv.skill_db import SkillDb, SkillRecord
-from python_cv.skill_matcher import match_skill_candidates
+from python_cv.skill_matcher import _fuzzy_threshold, match_skill_candidates
+from python_cv.term_trigrams import TermTrigramIndex
+from python_cv.typo_index import DeletionIndex
 
 
 def _skill_db_fixture() -> SkillDb:
@@ -133,3 +140,278 @@ def test_matches_noisy_variants_with_confusables_and_leet_text():
     assert matched[1].suggestions
     assert matched[1].suggestions[0].skill_name == "TypeScript"
     assert matched[1].suggestions[0].match_method in {"exact", "synonym", "fuzzy"}
+
+
+def test_trigram_shortlist_keeps_every_term_that_reaches_the_fuzzy_threshold():
+    terms = (
+        "kubernetes",
+        "stakeholder management",
+        "management of stakeholders",
+        "project management",
+        "power bi",
+        "postgresql",
+        "python",
+        "machine learning",
+        "data analysis",
+        "javascript",
+        "react js",
+        "cooking",
+    )
+    index = TermTrigramIndex.build(terms)
+
+    for query in ("kubernets", "stakeholder managment", "powerbi", "postgress", "pyhton", "management project"):
+        threshold = _fuzzy_threshold(query)
+        reachable = {position for position, term in enumerate(terms) if fuzz.WRatio(query, term) >= threshold}
+        shortlist = index.shortlist(query)
+
+        assert shortlist == sorted(shortlist)
+        assert reachable <= set(shortlist)
+        assert terms.index("cooking") not in shortlist
+
+
+def test_batched_cdist_scoring_matches_per_variant_extract(monkeypatch):
+    terms = tuple(
+        f"{prefix} {suffix}"
+        for prefix in ("react", "reactive", "typescript", "type", "project", "product")
+        for suffix in ("development", "management", "testing", "js", "design")
+    )
+    queries = [
+        skill_matcher._FuzzyQuery(variant, _fuzzy_threshold(variant), positions)
+        for variant, positions in (
+            ("react developmnt", None),
+            ("typescript", None),
+            ("project managment", None),
+            ("product desing", [0, 5, 25, 29]),
+        )
+    ]
+    expected = [skill_matcher._extract_fuzzy_matches(query, terms) for query in queries]
+
+    # A single test core would otherwise keep shortlisted queries on the per-variant path.
+    monkeypatch.setattr(skill_matcher.os, "cpu_count", lambda: 64)
+    calls: list[int] = []
+    real_cdist = skill_matcher._cdist_fuzzy_matches
+
+    def counting_cdist(group, *args):
+        calls.append(len(group))
+        return real_cdist(group, *args)
+
+    monkeypatch.setattr(skill_matcher, "_cdist_fuzzy_matches", counting_cdist)
+
+    assert skill_matcher._score_fuzzy_queries(queries, terms) == expected
+    assert calls == [3]
+    assert any(expected)
+
+
+def test_suggestion_cache_serves_repeat_candidates_per_taxonomy_version(monkeypatch):
+    cache = skill_matcher.SuggestionCache(max_entries=2)
+    monkeypatch.setattr(skill_matcher, "suggestion_cache", cache)
+    db = replace(_skill_db_fixture(), metadata={"source_mode": "test", "checksum": "v1"})
+    candidates = [
+        CandidateSeed(
+            raw_skill_text=text,
+            evidence_snippets=(f"Used {text}",),
+            confidence=0.8,
+            category="technical",
+        )
+        for text in ("Kubernets", "TypeScript")
+    ]
+
+    first = match_skill_candidates(candidates, db, suggestions_limit=5)
+    assert cache.stats() == {"hits": 0, "misses": 2, "entries": 2, "max_entries": 2}
+
+    def fail_extract(*args, **kwargs):
+        raise AssertionError("cached candidates must not be rescored")
+
+    monkeypatch.setattr(skill_matcher.process, "extract", fail_extract)
+    assert match_skill_candidates(list(reversed(candidates)), db, suggestions_limit=5) == [
+        replace(matched, candidate_id=f"candidate-{index}")
+        for index, matched in enumerate(reversed(first), start=1)
+    ]
+    assert cache.stats()["hits"] == 2
+
+    # A different limit or checksum is a different key; the LRU stays bounded.
+    monkeypatch.undo()
+    monkeypatch.setattr(skill_matcher, "suggestion_cache", cache)
+    match_skill_candidates(candidates[:1], db, suggestions_limit=1)
+    match_skill_candidates(candidates[:1], replace(db, metadata={"checksum": "v2"}), suggestions_limit=5)
+    assert cache.stats()["misses"] == 4
+    assert len(cache) == 2
+
+    # DBs without a checksum are never cached.
+    match_skill_candidates(candidates, _skill_db_fixture(), suggestions_limit=5)
+    assert cache.stats()["misses"] == 4
+
+    skill_matcher.clear_suggestion_cache(db)
+    assert len(cache) == 0
+
+
+def test_semantic_tier_maps_only_candidates_left_unmapped_within_budget(monkeypatch):
+    cache = skill_matcher.SuggestionCache(max_entries=8)
+    monkeypatch.setattr(skill_matcher, "suggestion_cache", cache)
+    db = replace(_skill_db_fixture(), metadata={"source_mode": "test", "checksum": "v1"})
+    candidates = [
+        CandidateSeed(
+            raw_skill_text=text,
+            evidence_snippets=(f"Used {text}",),
+            confidence=0.8,
+            category="technical",
+        )
+        for text in ("React", "Typescripting")
+    ]
+
+    # Without a shipped or warmed-up index the tier is skipped, never built on the request path.
+    building_usage = skill_matcher.SemanticUsage()
+    building = match_skill_candidates(candidates, db, suggestions_limit=5, semantic_usage=building_usage)
+    assert building[1].unmapped_candidate
+    assert building_usage == skill_matcher.SemanticUsage(used=False, fallback_triggered=True)
+    assert len(cache) == 1
+    db.columns.semantic_index()
+
+    usage = skill_matcher.SemanticUsage()
+    matched = match_skill_candidates(candidates, db, suggestions_limit=5, semantic_usage=usage)
+
+    assert [item.match_method for item in matched[0].suggestions] == ["exact"]
+    assert [(item.skill_name, item.match_method) for item in matched[1].suggestions] == [
+        ("TypeScript", "semantic")
+    ]
+    assert 0.6 <= matched[1].suggestions[0].score <= 0.85
+    assert usage == skill_matcher.SemanticUsage(used=True, fallback_triggered=False)
+
+    # Served from the cache, the candidate still reports that the tier was used.
+    cached_usage = skill_matcher.SemanticUsage()
+    cached = match_skill_candidates(candidates[1:], db, suggestions_limit=5, semantic_usage=cached_usage)
+    assert cached[0].suggestions == matched[1].suggestions
+    assert cached_usage.used
+
+    # Over budget, the candidate stays unmapped, flags the fallback and is not cached.
+    cache.clear()
+    monkeypatch.setattr(skill_matcher, "SEMANTIC_MAX_CANDIDATES", 0)
+    skipped_usage = skill_matcher.SemanticUsage()
+    skipped = match_skill_candidates(candidates[1:], db, suggestions_limit=5, semantic_usage=skipped_usage)
+    assert skipped[0].unmapped_candidate
+    assert skipped_usage == skill_matcher.SemanticUsage(used=False, fallback_triggered=True)
+    assert len(cache) == 0
+
+    monkeypatch.setenv(skill_matcher.SEMANTIC_MATCHING_ENV, "0")
+    disabled_usage = skill_matcher.SemanticUsage()
+    match_skill_candidates(candidates[1:], db, suggestions_limit=5, semantic_usage=disabled_usage)
+    assert disabled_usage == skill_matcher.SemanticUsage()
+
+
+def test_tag_hits_are_capped_and_scored_below_direct_matches(monkeypatch):
+    monkeypatch.setattr(skill_matcher, "TAG_POSTING_LIMIT", 1)
+    base = _skill_db_fixture()
+    skills = tuple(replace(skill, tags=("t", "frontend")) for skill in base.skills)
+    db = replace(base, skills=skills, columns=None)
+    candidates = [
+        CandidateSeed(
+            raw_skill_text=text,
+            evidence_snippets=(f"Used {text}",),
+            confidence=0.8,
+            category="technical",
+        )
+        for text in ("Frontend", "React")
+    ]
+
+    matched = match_skill_candidates(candidates, db, suggestions_limit=5)
+
+    assert [(item.skill_name, item.match_method, item.score) for item in matched[0].suggestions] == [
+        ("React", "fuzzy", skill_matcher.TAG_MATCH_SCORE)
+    ]
+    assert [item.match_method for item in matched[1].suggestions] == ["exact"]
+
+
+def test_document_candidates_are_matched_once_per_request(monkeypatch):
+    db = _skill_db_fixture()
+
+    def seeds(*texts: str) -> list[CandidateSeed]:
+        return [
+            CandidateSeed(
+                raw_skill_text=text,
+                evidence_snippets=(f"Used {text}",),
+                confidence=0.8,
+                category="technical",
+            )
+            for text in texts
+        ]
+
+    documents = [seeds("React", "TypeScript", "Kubernetes"), seeds("typescript", "REACT", "Reakt")]
+    expected = [match_skill_candidates(candidates, db, suggestions_limit=5) for candidates in documents]
+
+    batches: list[list[str]] = []
+    real_match = skill_matcher.match_skill_candidates
+
+    def recording_match(candidates, *args, **kwargs):
+        batches.append([candidate.raw_skill_text for candidate in candidates])
+        return real_match(candidates, *args, **kwargs)
+
+    monkeypatch.setattr(skill_matcher, "match_skill_candidates", recording_match)
+    matched = skill_matcher.match_document_candidates(documents, db, suggestions_limit=5)
+
+    assert matched == expected
+    assert [item.candidate_id for item in matched[1]] == ["candidate-1", "candidate-2", "candidate-3"]
+    assert batches == [["React", "TypeScript", "Kubernetes", "Reakt"]]
+
+
+def test_deletion_index_finds_typos_within_the_length_budget():
+    index = DeletionIndex.build(["kubernetes", "postgres", "postgresql", "react", "java", "power bi"])
+
+    assert index.lookup("kubernets") == [("kubernetes", 1)]
+    assert index.lookup("kubernetse") == [("kubernetes", 2)]
+    assert index.lookup("postgress") == [("postgres", 1), ("postgresql", 2)]
+    assert index.lookup("reakt") == [("react", 1)]
+    # Short terms get no typo budget and multi-token keys are not indexed.
+    assert index.lookup("jav") == []
+    assert index.lookup("powr bi") == []
+    assert index.lookup("react") == []
+
+
+def test_typo_hits_are_fuzzy_suggestions_without_wratio(monkeypatch):
+    def fail_extract(*args, **kwargs):
+        raise AssertionError("typo hits must not fall through to process.extract")
+
+    monkeypatch.setattr(skill_matcher.process, "extract", fail_extract)
+    matched = match_skill_candidates(
+        [
+            CandidateSeed(
+                raw_skill_text="Typescrpt",
+                evidence_snippets=("Typescrpt services",),
+                confidence=0.8,
+                category="technical",
+            )
+        ],
+        _skill_db_fixture(),
+        suggestions_limit=5,
+    )
+
+    assert [(item.skill_name, item.match_method, item.score) for item in matched[0].suggestions] == [
+        ("TypeScript", "fuzzy", 0.9)
+    ]
+
+
+def test_typo_hits_below_the_fuzzy_threshold_fall_through_to_wratio(monkeypatch):
+    scored: list[list[str]] = []
+    score_fuzzy_queries = skill_matcher._score_fuzzy_queries
+
+    def record_queries(queries, term_choices):
+        scored.append([query.variant for query in queries])
+        return score_fuzzy_queries(queries, term_choices)
+
+    monkeypatch.setattr(skill_matcher, "_score_fuzzy_queries", record_queries)
+    matched = match_skill_candidates(
+        [
+            CandidateSeed(
+                raw_skill_text="Reactt",
+                evidence_snippets=("Reactt frontends",),
+                confidence=0.8,
+                category="technical",
+            )
+        ],
+        _skill_db_fixture(),
+        suggestions_limit=5,
+    )
+
+    # One edit in six characters scores 0.833; six-character tokens need 0.92 to map.
+    assert scored == [["reactt"]]
+    assert matched[0].suggestions == ()
+    assert matched[0].unmapped_candidate
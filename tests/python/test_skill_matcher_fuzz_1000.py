@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from random import Random
 
+from cv_corpus import mutate_skill_term
 from python_cv.skill_candidate_extract import CandidateSeed
 from python_cv.skill_db import SkillDb, SkillRecord
 from python_cv.skill_matcher import match_skill_candidates
@@ -146,58 +147,6 @@ def _skill_db_fixture() -> SkillDb:
     )
 
 
-def _leet_variant(value: str) -> str:
-    return (
-        value.replace("a", "4")
-        .replace("A", "4")
-        .replace("e", "3")
-        .replace("E", "3")
-        .replace("i", "1")
-        .replace("I", "1")
-        .replace("o", "0")
-        .replace("O", "0")
-    )
-
-
-def _confusable_variant(value: str) -> str:
-    return (
-        value.replace("a", "а")
-        .replace("A", "А")
-        .replace("e", "е")
-        .replace("E", "Е")
-        .replace("o", "о")
-        .replace("O", "О")
-    )
-
-
-def _mutate(value: str, rng: Random) -> str:
-    variant = value
-
-    transform = rng.randrange(8)
-    if transform == 0:
-        variant = value.upper()
-    elif transform == 1:
-        variant = value.lower()
-    elif transform == 2:
-        variant = value.title()
-    elif transform == 3:
-        variant = _leet_variant(value)
-    elif transform == 4:
-        variant = _confusable_variant(value)
-    elif transform == 5:
-        variant = value.replace(".", " ")
-    elif transform == 6:
-        variant = value.replace(" ", "-")
-
-    if rng.random() < 0.35:
-        variant = f"  {variant}  "
-
-    if rng.random() < 0.25 and "/" not in variant:
-        variant = variant.replace(" ", " / ")
-
-    return variant
-
-
 def test_1000_mutations_keep_expected_top_match_and_are_deterministic():
     rng = Random(20260301)
     db = _skill_db_fixture()
@@ -214,7 +163,7 @@ def test_1000_mutations_keep_expected_top_match_and_are_deterministic():
     cases: list[tuple[str, str]] = []
     for i in range(1000):
         base, code = canonical[i % len(canonical)]
-        cases.append((_mutate(base, rng), code))
+        cases.append((mutate_skill_term(base, rng), code))
 
     seeds = [
         CandidateSeed(
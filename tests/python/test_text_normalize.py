@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from python_cv.text_normalize import expand_token_variants, normalize_token
+from random import Random
+
+import python_cv.text_normalize as text_normalize
+from cv_corpus import build_cv_documents, mutate_skill_term
+from python_cv.text_normalize import (
+    clear_normalize_caches,
+    expand_token_variants,
+    normalize_cache_stats,
+    normalize_token,
+    slugify,
+)
 
 
 def test_normalize_token_handles_case_accents_and_confusables():
@@ -19,3 +29,43 @@ def test_expand_token_variants_handles_punctuation_and_compact_forms():
 def test_expand_token_variants_handles_leet_substitutions():
     variants = set(expand_token_variants("Typ3Scr1pt"))
     assert "typescript" in variants
+
+
+def test_normalization_is_memoized_with_stats_and_clearable():
+    clear_normalize_caches()
+
+    assert normalize_token("Rеаct.JS") == normalize_token("Rеаct.JS")
+    assert expand_token_variants("Node.js") == expand_token_variants("Node.js")
+
+    stats = normalize_cache_stats()
+    assert stats["normalize_token"]["hits"] >= 1
+    assert stats["expand_token_variants"]["hits"] == 1
+    assert stats["expand_token_variants"]["hit_rate"] == 0.5
+
+    clear_normalize_caches()
+    assert normalize_cache_stats()["normalize_token"]["size"] == 0
+
+
+def _normalization_outputs(corpus: list[str]) -> list[tuple[str, str, tuple[str, ...]]]:
+    clear_normalize_caches()
+    try:
+        return [(normalize_token(value), slugify(value), expand_token_variants(value)) for value in corpus]
+    finally:
+        clear_normalize_caches()
+
+
+def test_ascii_fast_path_matches_unicode_folding_on_fuzz_corpora(monkeypatch):
+    rng = Random(20260301)
+    canonical = ["React.js", "TypeScript", "K8s", "NodeJS", "Postgres", "Terraform", "C++", "R&D"]
+    corpus = [mutate_skill_term(canonical[index % len(canonical)], rng) for index in range(1000)]
+    for document in build_cv_documents(200):
+        lines = document["text"].splitlines()
+        corpus.extend(lines)
+        corpus.extend(token for line in lines for token in line.split(","))
+    corpus.extend(["Ｒｅａｃｔ", "ﬁnance", "Café  Ops", "ß-Straße", "Node\u00a0JS", "", "  "])
+
+    fast = _normalization_outputs(corpus)
+    monkeypatch.setattr(text_normalize, "_fold", text_normalize._fold_unicode)
+    slow = _normalization_outputs(corpus)
+
+    assert fast == slow
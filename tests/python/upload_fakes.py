@@ -0,0 +1,37 @@
+"""Stand-ins for the uploads and buffered form that ``cv_import.extract`` reads."""
+
+from __future__ import annotations
+
+import api.python.cv_import as cv_import
+
+
+class PdfUpload:
+    filename = "cv.pdf"
+    content_type = "application/pdf"
+
+    def __init__(self, payload: bytes):
+        self._payload = payload
+
+    async def read(self) -> bytes:
+        return self._payload
+
+
+class _Form:
+    def __init__(self, files):
+        self._fields = {"files": files, "document_ids": [], "contexts": []}
+
+    def getlist(self, name):
+        return self._fields.get(name, [])
+
+
+class FormRequest:
+    def __init__(self, files):
+        self.headers = {
+            "content-type": "multipart/form-data; boundary=----pytest",
+            "x-python-service-secret": cv_import.LOCAL_DEV_PYTHON_SERVICE_SECRET,
+        }
+        self.query_params = {}
+        self._form = _Form(files)
+
+    async def form(self):
+        return self._form